@@ -0,0 +1,207 @@
+"""
+Asset Manager - Bilder einmal laden, konvertieren, skalieren und teilen
+
+Pfade werden relativ zu den Asset-Ordnern unter BASE_PATH aufgelöst (nicht
+zum aktuellen Arbeitsverzeichnis). Jedes Bild wird pro (Name, Größe, Alpha)
+nur einmal geladen, mit convert()/convert_alpha() ins Display-Format
+gebracht und auf die gewünschte Größe vorskaliert - Blits müssen dann
+nichts mehr umrechnen.
+
+preload() lädt Bilder beim Start auf einem Hintergrund-Thread vor. Der
+Cache ist nach Speicher begrenzt: zuletzt nicht benutzte Bilder fliegen
+zuerst raus (Szenen, die ein Bild gerade halten, behalten ihre Referenz).
+
+Gelieferte Surfaces werden geteilt und dürfen nicht verändert werden.
+"""
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+import pygame
+
+from core.constants import BASE_PATH, WIDTH, HEIGHT
+
+
+# Gesucht wird in dieser Reihenfolge (Kampf-Grafiken liegen historisch neben game.aw)
+ASSET_DIRS = (
+    os.path.join(BASE_PATH, "assets"),
+    os.path.join(os.path.dirname(BASE_PATH), "assets"),
+)
+ASSET_BUDGET_BYTES = 64 * 1024 * 1024   # Obergrenze für gecachte Bilder
+
+SCREEN_SIZE = (WIDTH, HEIGHT)
+
+TOWN_BACKGROUND = "town/background.png"
+BATTLE_BACKGROUND = "battle/2D_test_battle.png"
+
+# Beim Start vorgeladen: (Name, Größe, Alpha)
+STARTUP_ASSETS = (
+    (TOWN_BACKGROUND, SCREEN_SIZE, False),
+    (BATTLE_BACKGROUND, SCREEN_SIZE, False),
+)
+
+AssetKey = Tuple[str, Optional[Tuple[int, int]], bool]
+
+
+def resolve_asset_path(name: str) -> Optional[str]:
+    """Absoluter Pfad eines Assets (None, wenn es in keinem Asset-Ordner liegt)"""
+    for directory in ASSET_DIRS:
+        path = os.path.join(directory, name)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+class AssetManager:
+    def __init__(self, max_bytes: int = ASSET_BUDGET_BYTES):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._surfaces: "OrderedDict[AssetKey, Tuple[pygame.Surface, int]]" = OrderedDict()
+        self._missing: Set[AssetKey] = set()
+
+        # Vorladen: key -> Event (gesetzt, sobald der Worker fertig ist)
+        self._pending: Dict[AssetKey, threading.Event] = {}
+
+        self.bytes = 0
+        self.hits = 0
+        self.loads = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    @staticmethod
+    def _key(name: str, size: Optional[Tuple[int, int]], alpha: bool) -> AssetKey:
+        return name, (tuple(size) if size else None), bool(alpha)
+
+    # ------------------------------------------------------------------ #
+    # Zugriff
+    # ------------------------------------------------------------------ #
+    def image(self, name: str, size: Optional[Tuple[int, int]] = None,
+              alpha: bool = False) -> Optional[pygame.Surface]:
+        """
+        Liefert ein Bild aus dem Cache (lädt es beim ersten Zugriff)
+
+        Args:
+            name: Pfad relativ zum Asset-Ordner, z.B. "town/background.png"
+            size: Zielgröße (None = Originalgröße)
+            alpha: convert_alpha() statt convert() (für Bilder mit Transparenz)
+
+        Returns:
+            Surface oder None, wenn das Bild fehlt oder nicht lesbar ist
+        """
+        key = self._key(name, size, alpha)
+        while True:
+            with self._lock:
+                entry = self._surfaces.get(key)
+                if entry is not None:
+                    self._surfaces.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                if key in self._missing:
+                    return None
+                pending = self._pending.get(key)
+            if pending is None:
+                break
+            # Wird gerade vorgeladen: warten ist nie langsamer als doppelt laden,
+            # danach liegt das Bild im Cache (oder wurde schon wieder verdrängt)
+            pending.wait()
+
+        return self._store(key, self._load(key))
+
+    def preload(self, assets: Iterable[Tuple[str, Optional[Tuple[int, int]], bool]] = STARTUP_ASSETS):
+        """Lädt (Name, Größe, Alpha)-Einträge auf einem Hintergrund-Thread vor"""
+        keys = []
+        with self._lock:
+            for name, size, alpha in assets:
+                key = self._key(name, size, alpha)
+                if key in self._surfaces or key in self._pending or key in self._missing:
+                    continue
+                self._pending[key] = threading.Event()
+                keys.append(key)
+        if keys:
+            threading.Thread(target=self._preload, args=(keys,), name="asset-preload", daemon=True).start()
+
+    def clear(self):
+        with self._lock:
+            self._surfaces.clear()
+            self._missing.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._surfaces),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "loads": self.loads,
+            "evictions": self.evictions,
+        }
+
+    # ------------------------------------------------------------------ #
+    # Laden
+    # ------------------------------------------------------------------ #
+    def _preload(self, keys):
+        for key in keys:
+            # Direkt in den Cache: zählt zum Budget und kann verdrängt werden
+            self._store(key, self._load(key))
+            with self._lock:
+                self._pending.pop(key).set()
+
+    def _load(self, key: AssetKey) -> Optional[pygame.Surface]:
+        """Lädt, skaliert und konvertiert ein Bild (ohne Cache, thread-sicher)"""
+        name, size, alpha = key
+        path = resolve_asset_path(name)
+        if path is None:
+            print(f"Asset nicht gefunden: {name}")
+            return None
+
+        try:
+            surface = pygame.image.load(path)
+        except (pygame.error, OSError) as e:
+            print(f"Fehler beim Laden von {name}: {e}")
+            return None
+
+        if size and surface.get_size() != size:
+            # smoothscale geht nur mit 24/32 Bit Farbtiefe
+            if surface.get_bitsize() in (24, 32):
+                surface = pygame.transform.smoothscale(surface, size)
+            else:
+                surface = pygame.transform.scale(surface, size)
+
+        # Ohne gesetzten Videomodus (z.B. in Tools) bleibt das Originalformat
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        return surface
+
+    def _store(self, key: AssetKey, surface: Optional[pygame.Surface]) -> Optional[pygame.Surface]:
+        with self._lock:
+            if surface is None:
+                self._missing.add(key)
+                return None
+
+            entry = self._surfaces.get(key)
+            if entry is not None:
+                # Anderer Thread war schneller
+                return entry[0]
+
+            size = surface.get_pitch() * surface.get_height()
+            self._surfaces[key] = (surface, size)
+            self.bytes += size
+            self.loads += 1
+
+            # Am längsten unbenutzte Bilder verdrängen (das neue bleibt immer drin)
+            while self.bytes > self.max_bytes and len(self._surfaces) > 1:
+                _, (_, old_size) = self._surfaces.popitem(last=False)
+                self.bytes -= old_size
+                self.evictions += 1
+            return surface
+
+
+ASSETS = AssetManager()
+
+
+def load_image(name: str, size: Optional[Tuple[int, int]] = None,
+               alpha: bool = False) -> Optional[pygame.Surface]:
+    """Wie AssetManager.image(), aus dem gemeinsamen Asset-Cache"""
+    return ASSETS.image(name, size, alpha)
@@ -0,0 +1,79 @@
+"""
+Attack Scheduler - Prioritätswarteschlange für Auto-Angriffe
+
+Jeder Kämpfer steht mit dem Zeitpunkt seines nächsten Angriffs in einem
+Heap. Pro Tick werden nur die fälligen Einträge entnommen (O(log n) pro
+Angriff), statt alle Kämpfer abzufragen.
+"""
+import heapq
+import itertools
+from typing import Dict, Hashable, Iterator, List, Tuple
+
+
+class AttackScheduler:
+    def __init__(self):
+        # Heap-Einträge: (fällig_um, laufende_nr, kämpfer_id, token)
+        self._heap: List[Tuple[float, int, Hashable, int]] = []
+        # kämpfer_id -> (intervall, token); veraltete Heap-Einträge erkennt man am Token
+        self._entries: Dict[Hashable, Tuple[float, int]] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, combatant_id: Hashable) -> bool:
+        return combatant_id in self._entries
+
+    def add(self, combatant_id: Hashable, attack_speed: float, now: float, delay: float = None):
+        """
+        Plant einen Kämpfer ein (ersetzt einen bestehenden Eintrag)
+
+        Args:
+            combatant_id: Eindeutige ID des Kämpfers
+            attack_speed: Angriffe pro Sekunde
+            now: Aktuelle Kampfzeit in Sekunden
+            delay: Zeit bis zum ersten Angriff (Default: ein Intervall)
+        """
+        interval = 1.0 / max(attack_speed, 0.01)
+        token = next(self._counter)
+        self._entries[combatant_id] = (interval, token)
+        first = now + (interval if delay is None else delay)
+        heapq.heappush(self._heap, (first, token, combatant_id, token))
+
+    def remove(self, combatant_id: Hashable):
+        """Entfernt einen Kämpfer; sein Heap-Eintrag verfällt beim nächsten Pop."""
+        if self._entries.pop(combatant_id, None) is not None:
+            self._compact_if_needed()
+
+    def clear(self):
+        self._heap.clear()
+        self._entries.clear()
+
+    def pop_due(self, now: float) -> Iterator[Tuple[Hashable, float]]:
+        """
+        Liefert alle bis now fälligen Angriffe in zeitlicher Reihenfolge.
+
+        Jeder Angriff wird sofort um ein Intervall neu eingeplant; ist auch der
+        nächste noch fällig (großes dt), kommt er im selben Durchlauf.
+
+        Yields:
+            (kämpfer_id, angriffszeitpunkt)
+        """
+        # self._heap immer neu lesen: remove() während der Iteration darf kompaktieren
+        while self._heap and self._heap[0][0] <= now:
+            due, _, combatant_id, token = heapq.heappop(self._heap)
+            entry = self._entries.get(combatant_id)
+            if entry is None or entry[1] != token:
+                continue  # entfernt oder neu eingeplant
+
+            heapq.heappush(self._heap, (due + entry[0], next(self._counter), combatant_id, token))
+            yield combatant_id, due
+
+    def _compact_if_needed(self):
+        # Veraltete Einträge aufräumen, wenn sie mehr als die Hälfte des Heaps ausmachen
+        if len(self._heap) > 64 and len(self._heap) > 2 * len(self._entries):
+            self._heap = [
+                item for item in self._heap
+                if self._entries.get(item[2], (None, None))[1] == item[3]
+            ]
+            heapq.heapify(self._heap)
@@ -0,0 +1,122 @@
+"""
+Background Builder - baut ein Objekt spekulativ auf einem Worker-Thread
+
+Gedacht für teure Konstruktoren (z.B. BattleScene), deren Ergebnis
+wahrscheinlich gleich gebraucht wird. Es läuft höchstens ein Build
+gleichzeitig; kommt währenddessen eine neue Anfrage, ersetzt sie die
+wartende ("neueste gewinnt"). Gehalten wird nur das letzte Ergebnis.
+
+Ein laufender Thread lässt sich nicht abbrechen: cancel() markiert den
+Build als verworfen, sein Ergebnis wird dann beim Fertigwerden ignoriert.
+Mit cancel(wait=True) kehrt cancel() erst zurück, wenn auch der laufende
+Build beendet ist - danach arbeitet garantiert nichts mehr im Hintergrund.
+"""
+import threading
+from typing import Any, Callable, Hashable, Optional
+
+
+class BackgroundBuilder:
+    def __init__(self, build: Callable[[Hashable], Any], name: str = "background-builder"):
+        """
+        Args:
+            build: Funktion key -> Ergebnis (läuft im Worker-Thread)
+            name: Name des Worker-Threads
+        """
+        self._build = build
+        self._name = name
+        self._lock = threading.Lock()
+
+        self._thread: Optional[threading.Thread] = None
+        self._running_key: Optional[Hashable] = None   # None = kein gültiger Build läuft
+        self._pending_key: Optional[Hashable] = None
+        self._result_key: Optional[Hashable] = None
+        self._result: Any = None
+
+    @property
+    def busy(self) -> bool:
+        return self._thread is not None
+
+    def ready(self, key: Hashable) -> bool:
+        """Liegt ein fertiges Ergebnis für key bereit?"""
+        return self._result_key == key
+
+    # ------------------------------------------------------------------ #
+    # Anfragen
+    # ------------------------------------------------------------------ #
+    def request(self, key: Hashable):
+        """Baut key im Hintergrund, falls nicht schon fertig oder in Arbeit"""
+        with self._lock:
+            if key == self._result_key or key == self._running_key:
+                self._pending_key = None
+                return
+            if self._thread is None:
+                self._start(key)
+            else:
+                self._pending_key = key
+
+    def take(self, key: Hashable) -> Optional[Any]:
+        """
+        Übergibt das Ergebnis für key (und vergisst es)
+
+        Läuft der Build für key gerade, wird auf ihn gewartet - das ist nie
+        langsamer als ein neuer Aufbau. Für andere Keys gibt es None.
+        """
+        with self._lock:
+            self._pending_key = None
+            if self._result_key == key:
+                result = self._result
+                self._result_key, self._result = None, None
+                return result
+            thread = self._thread if self._running_key == key else None
+
+        if thread is None:
+            return None
+        thread.join()
+        with self._lock:
+            if self._result_key != key:
+                return None
+            result = self._result
+            self._result_key, self._result = None, None
+            return result
+
+    def cancel(self, wait: bool = False):
+        """
+        Verwirft wartende, laufende und fertige Builds
+
+        Args:
+            wait: auf das Ende eines laufenden Builds warten (z.B. bevor ein
+                Kampf startet, der nicht parallel zu einem Build laufen darf)
+        """
+        with self._lock:
+            self._pending_key = None
+            self._running_key = None
+            self._result_key, self._result = None, None
+            thread = self._thread
+
+        if wait and thread is not None:
+            thread.join()
+
+    # ------------------------------------------------------------------ #
+    # Worker
+    # ------------------------------------------------------------------ #
+    def _start(self, key: Hashable):
+        # Nur mit gehaltenem Lock aufrufen
+        self._running_key = key
+        self._thread = threading.Thread(target=self._run, args=(key,), name=self._name, daemon=True)
+        self._thread.start()
+
+    def _run(self, key: Hashable):
+        try:
+            result = self._build(key)
+        except Exception as e:
+            print(f"Fehler beim Vorab-Aufbau von {key}: {e}")
+            result = None
+
+        with self._lock:
+            if self._running_key == key and result is not None:
+                self._result_key, self._result = key, result
+            self._running_key = None
+            self._thread = None
+            if self._pending_key is not None:
+                next_key, self._pending_key = self._pending_key, None
+                self._start(next_key)
@@ -0,0 +1,35 @@
+"""
+Kampfregeln - gemeinsam genutzt von der BattleScene und den Balancing-Tools
+"""
+from typing import Any, Dict
+
+
+def get_player_damage(player_stats: Dict[str, Any]) -> int:
+    """
+    Ermittelt den Schaden eines Spielerangriffs
+
+    Wenn kein direkter Schaden vorhanden ist, wird der höhere Wert aus
+    Stärke/Intelligenz verwendet (Fallback: 5).
+
+    Args:
+        player_stats: Gesamt-Stats aus PlayerStatsCalculator.calculate_total_stats
+
+    Returns:
+        Schaden pro Treffer
+    """
+    player_damage = player_stats.get("damage", 0)
+    if player_damage <= 0:
+        strength = player_stats.get("strength", 0)
+        intelligence = player_stats.get("intelligence", 0)
+        player_damage = max(strength, intelligence) if max(strength, intelligence) > 0 else 5
+    return player_damage
+
+
+def get_total_defense(final_stats: Dict[str, Any]) -> int:
+    """Verteidigung + Rüstung eines Gegners"""
+    return final_stats.get("defense", 0) + final_stats.get("armour", 0)
+
+
+def calculate_damage(player_damage: int, total_defense: int) -> int:
+    """Schaden = Spieler-Schaden - Gegner-Verteidigung (Minimum 1)"""
+    return max(1, player_damage - total_defense)
@@ -0,0 +1,159 @@
+"""
+Combat Log - kompaktes Binärprotokoll eines Kampfes
+
+Aufgezeichnet werden nur Eingaben und Ergebnisse, der Rest ist durch den
+RNG-Seed festgelegt:
+
+    Kopf:      Magic, Version, Seed, Zeitschritt, Meta (Level, Config,
+               Spieler-Stats als JSON), Roster-Hash der Startgegner
+    Ereignisse: (Tick, Typ) + feste struct-Nutzlast je Typ
+
+Alles nach Magic und Version ist zlib-komprimiert; ein Kampf mit einigen
+hundert Treffern bleibt so bei wenigen KB.
+"""
+import json
+import struct
+import zlib
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+MAGIC = b"CLOG"
+VERSION = 1
+
+# Ereignistypen
+EVENT_CLICK = 1    # Taste, x, y (Eingabe, wird beim Replay eingespielt)
+EVENT_HIT = 2      # Ziel-ID (-1 = Spieler), Schaden, HP danach
+EVENT_DEATH = 3    # Gegner-ID
+EVENT_LOOT = 4     # CRC32 des Items
+EVENT_WAVE = 5     # Roster-Hash nach dem Spawn einer Welle
+EVENT_DEFEAT = 6   # Spieler besiegt
+EVENT_END = 7      # Ende der Aufzeichnung
+
+EVENT_NAMES = {
+    EVENT_CLICK: "click",
+    EVENT_HIT: "hit",
+    EVENT_DEATH: "death",
+    EVENT_LOOT: "loot",
+    EVENT_WAVE: "wave",
+    EVENT_DEFEAT: "defeat",
+    EVENT_END: "end",
+}
+
+_PREFIX = struct.Struct("<4sB")
+_HEAD = struct.Struct("<QdI")          # Seed, Zeitschritt, Länge des Meta-JSON
+_EVENT = struct.Struct("<IB")          # Tick, Typ
+_PAYLOADS = {
+    EVENT_CLICK: struct.Struct("<Bhh"),
+    EVENT_HIT: struct.Struct("<iii"),
+    EVENT_DEATH: struct.Struct("<i"),
+    EVENT_LOOT: struct.Struct("<I"),
+    EVENT_WAVE: struct.Struct("<I"),
+    EVENT_DEFEAT: struct.Struct("<"),
+    EVENT_END: struct.Struct("<"),
+}
+_ROSTER_HASH = struct.Struct("<I")
+
+Event = Tuple[int, int, Tuple[int, ...]]
+
+
+def roster_hash(store) -> int:
+    """CRC32 über die Kampfwerte aller lebenden Gegner eines EnemyStore"""
+    slots = store.alive_slots()
+    crc = 0
+    for column in (store.ids, store.x, store.y, store.hp, store.max_hp, store.damage,
+                   store.defense, store.armour, store.attack_speed, store.template_id):
+        crc = zlib.crc32(np.ascontiguousarray(column[slots]).tobytes(), crc)
+    return crc
+
+
+def item_hash(item: Dict[str, Any]) -> int:
+    """
+    CRC32 eines Loot-Items (unabhängig von der Key-Reihenfolge)
+
+    Die uid ist zufällig (nicht aus dem Seed) und zählt daher nicht mit.
+    """
+    data = json.dumps({key: value for key, value in item.items() if key != "uid"},
+                      sort_keys=True, ensure_ascii=False, default=str)
+    return zlib.crc32(data.encode("utf-8"))
+
+
+class CombatLog:
+    def __init__(self, seed: int, sim_dt: float, meta: Dict[str, Any]):
+        """
+        Args:
+            seed: RNG-Seed, mit dem der Kampf aufgebaut wurde
+            sim_dt: fester Zeitschritt der Simulation
+            meta: level_type, level_number, level_config, player_stats
+        """
+        self.seed = seed
+        self.sim_dt = sim_dt
+        self.meta = meta
+        self.roster_hash = 0
+        self.events: List[Event] = []
+
+    def record(self, tick: int, kind: int, *payload: int):
+        self.events.append((tick, kind, tuple(int(v) for v in payload)))
+
+    @property
+    def end_tick(self) -> int:
+        return self.events[-1][0] if self.events else 0
+
+    def clicks_by_tick(self) -> Dict[int, List[Tuple[int, int, int]]]:
+        """Aufgezeichnete Klicks (Taste, x, y) gruppiert nach Tick"""
+        clicks: Dict[int, List[Tuple[int, int, int]]] = {}
+        for tick, kind, payload in self.events:
+            if kind == EVENT_CLICK:
+                clicks.setdefault(tick, []).append(payload)
+        return clicks
+
+    # ------------------------------------------------------------------ #
+    # (De-)Serialisierung
+    # ------------------------------------------------------------------ #
+    def to_bytes(self) -> bytes:
+        meta = json.dumps(self.meta, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        parts = [_HEAD.pack(self.seed, self.sim_dt, len(meta)), meta,
+                 _ROSTER_HASH.pack(self.roster_hash)]
+        for tick, kind, payload in self.events:
+            parts.append(_EVENT.pack(tick, kind))
+            parts.append(_PAYLOADS[kind].pack(*payload))
+        return _PREFIX.pack(MAGIC, VERSION) + zlib.compress(b"".join(parts), 9)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CombatLog":
+        magic, version = _PREFIX.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Keine Combat-Log-Datei")
+        if version != VERSION:
+            raise ValueError(f"Combat-Log-Version {version} wird nicht unterstützt")
+
+        body = zlib.decompress(data[_PREFIX.size:])
+        seed, sim_dt, meta_len = _HEAD.unpack_from(body)
+        offset = _HEAD.size
+        meta = json.loads(body[offset:offset + meta_len].decode("utf-8"))
+        offset += meta_len
+
+        log = cls(seed, sim_dt, meta)
+        (log.roster_hash,) = _ROSTER_HASH.unpack_from(body, offset)
+        offset += _ROSTER_HASH.size
+
+        while offset < len(body):
+            tick, kind = _EVENT.unpack_from(body, offset)
+            offset += _EVENT.size
+            payload_struct = _PAYLOADS[kind]
+            log.events.append((tick, kind, payload_struct.unpack_from(body, offset)))
+            offset += payload_struct.size
+        return log
+
+    def save(self, path: str) -> int:
+        """Schreibt das Log und gibt die Dateigröße in Bytes zurück"""
+        data = self.to_bytes()
+        with open(path, "wb") as f:
+            f.write(data)
+        return len(data)
+
+    @classmethod
+    def load(cls, path: str) -> "CombatLog":
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
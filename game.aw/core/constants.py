@@ -1,13 +1,11 @@
 import os
-import pygame
-
-pygame.init()
 
 # ---------------------------------------------------
 # PATHS
 # ---------------------------------------------------
 BASE_PATH = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
-SAVE_ROOT = os.path.join(BASE_PATH, "save")
+# GAME_SAVE_ROOT: Saves woanders ablegen (z.B. Fixture-Saves für tools/frame_bench.py)
+SAVE_ROOT = os.environ.get("GAME_SAVE_ROOT") or os.path.join(BASE_PATH, "save")
 SAVE_SLOTS = ["save1", "save2", "save3"]
 
 ASSET_ICON_PATH = os.path.join(BASE_PATH, "assets", "icons")
@@ -16,3 +14,11 @@ ASSET_ICON_PATH = os.path.join(BASE_PATH, "assets", "icons")
 # WINDOW
 # ---------------------------------------------------
 WIDTH, HEIGHT = 1600, 900
+
+# ---------------------------------------------------
+# GAME LOOP
+# ---------------------------------------------------
+SIMULATION_RATE = 60     # Logik-Schritte pro Sekunde (fester Zeitschritt)
+FRAME_RATE = 60          # Render-Limit in FPS (0 = unbegrenzt)
+MAX_FRAME_TIME = 0.25    # Obergrenze für einen Frame (verhindert "Spiral of Death")
+IDLE_WAIT_TIMEOUT = 250  # ms: so lange blockiert die Schleife höchstens, wenn nichts animiert
@@ -4,6 +4,8 @@
 
 DEFAULT_DEV_SETTINGS = {
     "dev_mode": False,
+    # Kämpfe als Combat-Log im Save-Slot aufzeichnen (siehe tools/combat_replay.py)
+    "record_combat": False,
     # Rest aktuell ungenutzt, kann später wiederverwendet werden
     "enemy_count": 5,
     "enchantment_min": 0,
@@ -15,6 +17,9 @@ DEFAULT_DEV_SETTINGS = {
 # Interner, veränderbarer Zustand (gilt global im Prozess)
 _DEV_STATE = DEFAULT_DEV_SETTINGS.copy()
 
+# Wird bei jeder Änderung erhöht (z.B. um vorab gebaute Kämpfe zu verwerfen)
+_VERSION = 0
+
 
 def load_dev_settings() -> dict:
     """Gibt eine Kopie des aktuellen Dev-States zurück."""
@@ -23,11 +28,20 @@ def load_dev_settings() -> dict:
 
 def save_dev_settings(settings: dict):
     """Aktualisiert den globalen Dev-State (nur im Speicher)."""
+    global _VERSION
     if not isinstance(settings, dict):
         return
     _DEV_STATE.update(settings)
+    _VERSION += 1
 
 
 def set_dev_mode(enabled: bool):
     """Schaltet den Dev-Modus global an/aus (nur im Speicher)."""
+    global _VERSION
     _DEV_STATE["dev_mode"] = bool(enabled)
+    _VERSION += 1
+
+
+def dev_settings_version() -> int:
+    """Zähler, der sich bei jeder Änderung der Dev-Settings erhöht."""
+    return _VERSION
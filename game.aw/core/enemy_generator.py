@@ -5,23 +5,25 @@ Generiert Gegner-Kopien aus monster.json mit zufälligen Verzauberungen
 import json
 import random
 import os
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterator, List
 
 from core.dev_settings import load_dev_settings
 
 class EnemyGenerator:
-    def __init__(self, data_path: str = None):
+    def __init__(self, data_path: str = None, rng=random):
         """
         Initialisiert den Gegnergenerator
         
         Args:
             data_path: Pfad zum data Ordner (default: game.aw/data)
+            rng: Zufallsquelle (Modul random oder random.Random, z.B. pro Kampf)
         """
         if data_path is None:
             base_path = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
             data_path = os.path.join(base_path, "data")
         
         self.data_path = data_path
+        self.rng = rng
         self.monsters = self._load_monsters()
         self.enchantments = self._load_enchantments()
 
@@ -37,7 +39,7 @@ class EnemyGenerator:
             candidates = self.monsters
         if not candidates:
             return None
-        return random.choice(candidates)
+        return self.rng.choice(candidates)
     
     def _load_monsters(self) -> List[Dict[str, Any]]:
         """Lädt die Monster-Daten aus monster.json"""
@@ -100,7 +102,7 @@ class EnemyGenerator:
         # Begrenze die Anzahl auf die verfügbaren Slots
         count = min(count, max_slots, len(available_enchantments))
         
-        selected = random.sample(available_enchantments, count)
+        selected = self.rng.sample(available_enchantments, count)
         result = []
         max_tier = self._get_max_tier_for_level(monster_level)
         
@@ -108,10 +110,10 @@ class EnemyGenerator:
             # Generiere einen zufälligen Wert basierend auf value_min und value_max
             value_min = enchant.get("value_min", 0)
             value_max = enchant.get("value_max", 0)
-            value = random.randint(value_min, value_max) if value_max > value_min else value_min
+            value = self.rng.randint(value_min, value_max) if value_max > value_min else value_min
             
             # Rolle das Tier basierend auf dem Monsterlevel (mind. 1)
-            rolled_tier = random.randint(1, max_tier)
+            rolled_tier = self.rng.randint(1, max_tier)
 
             # Skaliere den Wert mit dem Tier
             scaled_value = value * rolled_tier
@@ -150,28 +152,28 @@ class EnemyGenerator:
         # HP
         hp_min = stats_data.get("hp_min", 10)
         hp_max = stats_data.get("hp_max", 20)
-        stats["hp"] = random.randint(hp_min, hp_max)
+        stats["hp"] = self.rng.randint(hp_min, hp_max)
         stats["max_hp"] = stats["hp"]
         
         # Schaden
         dmg_min = stats_data.get("damage_min", 1)
         dmg_max = stats_data.get("damage_max", 5)
-        stats["damage"] = random.randint(dmg_min, dmg_max)
+        stats["damage"] = self.rng.randint(dmg_min, dmg_max)
         
         # Verteidigung
         def_min = stats_data.get("defense_min", 0)
         def_max = stats_data.get("defense_max", 5)
-        stats["defense"] = random.randint(def_min, def_max)
+        stats["defense"] = self.rng.randint(def_min, def_max)
         
         # Angriffsgeschwindigkeit
         atk_spd_min = stats_data.get("attack_speed_min", 1)
         atk_spd_max = stats_data.get("attack_speed_max", 2)
-        stats["attack_speed"] = random.uniform(atk_spd_min, atk_spd_max)
+        stats["attack_speed"] = self.rng.uniform(atk_spd_min, atk_spd_max)
         
         # Ausweichen
         eva_min = stats_data.get("evasion_min", 0)
         eva_max = stats_data.get("evasion_max", 10)
-        stats["evasion"] = random.randint(eva_min, eva_max)
+        stats["evasion"] = self.rng.randint(eva_min, eva_max)
         
         return stats
     
@@ -193,7 +195,7 @@ class EnemyGenerator:
             monster = next((m for m in self.monsters if m.get("id") == monster_id), None)
             if not monster:
                 print(f"Monster '{monster_id}' nicht gefunden, verwende zufälliges Monster")
-                monster = random.choice(self.monsters) if self.monsters else None
+                monster = self.rng.choice(self.monsters) if self.monsters else None
         else:
             if min_level is not None or max_level is not None:
                 min_lvl = min_level if min_level is not None else 1
@@ -205,7 +207,7 @@ class EnemyGenerator:
                     max_lvl = max_level if max_level is not None else 999
                     monster = self._pick_monster_in_level_range(min_lvl, max_lvl)
                 else:
-                    monster = random.choice(self.monsters) if self.monsters else None
+                    monster = self.rng.choice(self.monsters) if self.monsters else None
         
         # Erstelle eine Kopie des Monsters
         enemy = monster.copy()
@@ -310,6 +312,40 @@ class EnemyGenerator:
         
         return final_stats, enchantment_bonuses
     
+    def iter_configured_enemies(self, config: Dict[str, Any],
+                                count: int = None) -> Iterator[Dict[str, Any]]:
+        """
+        Erzeugt Gegner nach einer Level-Config erst bei Bedarf (Generator)
+
+        Args:
+            config: Level-Settings (enemy_count, Verzauberungs- und Levelbereich)
+            count: Anzahl der Gegner (Default: enemy_count aus der Config)
+
+        Yields:
+            Gegner-Dictionaries wie generate_enemy()
+        """
+        if count is None:
+            count = max(1, int(config.get("enemy_count", 5)))
+        ench_min = int(config.get("enchantment_min", 0))
+        ench_max = int(config.get("enchantment_max", 0))
+        lvl_min = int(config.get("monster_level_min", 1))
+        lvl_max = int(config.get("monster_level_max", 100))
+
+        if ench_max < ench_min:
+            ench_max = ench_min
+
+        for _ in range(count):
+            if ench_max > 0:
+                enchant_count = self.rng.randint(ench_min, ench_max)
+            else:
+                enchant_count = 0
+
+            yield self.generate_enemy(
+                enchantment_count=enchant_count,
+                min_level=lvl_min,
+                max_level=lvl_max,
+            )
+
     def generate_field_enemies(self, field_number: int, config=None) -> List[Dict[str, Any]]:
         """
         Generiert Gegner für ein Feld
@@ -320,29 +356,7 @@ class EnemyGenerator:
 
         # Dev-Konfiguration aktiv
         if config is not None:
-            enemy_count = max(1, int(config.get("enemy_count", 5)))
-            ench_min = int(config.get("enchantment_min", 0))
-            ench_max = int(config.get("enchantment_max", 0))
-            lvl_min = int(config.get("monster_level_min", 1))
-            lvl_max = int(config.get("monster_level_max", 100))
-
-            if ench_max < ench_min:
-                ench_max = ench_min
-
-            for _ in range(enemy_count):
-                if ench_max > 0:
-                    enchant_count = random.randint(ench_min, ench_max)
-                else:
-                    enchant_count = 0
-
-                enemy = self.generate_enemy(
-                    enchantment_count=enchant_count,
-                    min_level=lvl_min,
-                    max_level=lvl_max,
-                )
-                enemies.append(enemy)
-
-            return enemies
+            return list(self.iter_configured_enemies(config))
 
         # Standard-Verhalten, wenn keine config übergeben wurde
         if field_number == 1:
@@ -351,11 +365,11 @@ class EnemyGenerator:
                 enemies.append(self.generate_enemy(enchantment_count=0))
 
             # 1 Gegner mit 1-3 Verzauberungen
-            enchant_count = random.randint(1, 3)
+            enchant_count = self.rng.randint(1, 3)
             enemies.append(self.generate_enemy(enchantment_count=enchant_count))
 
             # 1 Gegner mit 4-6 Verzauberungen
-            enchant_count = random.randint(4, 6)
+            enchant_count = self.rng.randint(4, 6)
             enemies.append(self.generate_enemy(enchantment_count=enchant_count))
         else:
             # Standard: 5 normale Gegner für andere Felder
@@ -372,10 +386,10 @@ class EnemyGenerator:
             for _ in range(3):
                 enemies.append(self.generate_enemy(enchantment_count=0))
 
-            enchant_count = random.randint(1, 3)
+            enchant_count = self.rng.randint(1, 3)
             enemies.append(self.generate_enemy(enchantment_count=enchant_count))
 
-            enchant_count = random.randint(4, 6)
+            enchant_count = self.rng.randint(4, 6)
             enemies.append(self.generate_enemy(enchantment_count=enchant_count))
         else:
             for _ in range(5):
@@ -0,0 +1,254 @@
+"""
+Enemy Store - slotbasierte Gegnerverwaltung statt kopierter Monster-Dicts
+
+Heiße Werte (Position, HP, Kampfwerte, Anzahl Verzauberungen, Template)
+liegen als NumPy-Spalten vor, ein Slot pro Gegner. Alles, was nur selten
+gelesen wird (Verzauberungen, Boni, Namensfarbe), steckt in einem
+EnemyRecord mit __slots__, der das Monster-Template aus monster.json nur
+referenziert statt es zu kopieren.
+
+Gegner werden über stabile, nie wiederverwendete IDs angesprochen. Slots
+toter Gegner werden freigegeben und beim nächsten add() wiederverwendet,
+dadurch verschiebt sich beim Entfernen nichts.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Namensfarben nach "Stufe" des Gegners
+WHITE = (255, 255, 255)
+BLUE = (100, 149, 237)         # 1–2 Enchants
+PURPLE = (186, 85, 211)        # 3–4 Enchants
+GOLD = (255, 215, 0)           # 5–6 Enchants
+DARK_ORANGE = (210, 120, 0)    # Unique
+
+# Gemeinsames Objekt für Gegner ohne Verzauberungsboni
+NO_BONUSES: Dict[str, Any] = {}
+
+# Spalten mit Datentyp (Reihenfolge egal, alle werden gemeinsam vergrößert)
+_COLUMNS = (
+    ("ids", np.int64, -1),
+    ("alive", bool, False),
+    ("x", np.float32, 0),
+    ("y", np.float32, 0),
+    ("hp", np.int32, 0),
+    ("max_hp", np.int32, 0),
+    ("damage", np.int32, 0),
+    ("defense", np.int32, 0),
+    ("armour", np.int32, 0),
+    ("evasion", np.int32, 0),
+    ("attack_speed", np.float32, 0),
+    ("enchant_count", np.int16, 0),
+    ("template_id", np.int32, -1),
+    ("version", np.uint32, 0),       # zählt Änderungen am Zustand (für Anzeige-Caches)
+)
+
+
+def name_color_for(template: Dict[str, Any], enchant_count: int) -> Tuple[int, int, int]:
+    """Namensfarbe nach Unique-Status bzw. Anzahl der Verzauberungen"""
+    loot_quality = str(template.get("loot_quality", "")).lower()
+    if template.get("is_unique", False) or loot_quality == "unique":
+        return DARK_ORANGE
+    if enchant_count >= 5:
+        return GOLD
+    if enchant_count >= 3:
+        return PURPLE
+    if enchant_count >= 1:
+        return BLUE
+    return WHITE
+
+
+class EnemyRecord:
+    """Selten gelesene Daten eines Gegners (Template nur als Referenz)"""
+
+    __slots__ = ("template", "enchantments", "bonuses", "name_color")
+
+    def __init__(self, template: Dict[str, Any], enchantments: List[Dict[str, Any]],
+                 bonuses: Dict[str, Any]):
+        self.template = template
+        self.enchantments = enchantments
+        self.bonuses = bonuses
+        self.name_color = name_color_for(template, len(enchantments))
+
+    @property
+    def name(self) -> str:
+        return self.template.get("name", "Gegner")
+
+    @property
+    def level(self) -> int:
+        return self.template.get("level", 1)
+
+
+class EnemyStore:
+    def __init__(self, templates: Sequence[Dict[str, Any]], capacity: int = 16):
+        """
+        Args:
+            templates: Monster-Templates (z.B. EnemyGenerator.monsters), werden geteilt
+            capacity: Anfangsgröße der Spalten (wächst bei Bedarf)
+        """
+        self.templates = list(templates)
+        self._template_index = {t.get("id"): i for i, t in enumerate(self.templates)}
+
+        self.capacity = 0
+        for name, dtype, fill in _COLUMNS:
+            setattr(self, name, np.full(0, fill, dtype=dtype))
+        self.records: List[Optional[EnemyRecord]] = []
+
+        self._free: List[int] = []
+        self._slot_by_id: Dict[int, int] = {}
+        self._next_id = 0
+        self._grow(max(1, capacity))
+
+    def __len__(self) -> int:
+        return len(self._slot_by_id)
+
+    def __contains__(self, enemy_id: int) -> bool:
+        return enemy_id in self._slot_by_id
+
+    def _grow(self, capacity: int):
+        """Vergrößert alle Spalten auf capacity (freie Slots hinten anhängen)"""
+        old = self.capacity
+        for name, dtype, fill in _COLUMNS:
+            column = np.full(capacity, fill, dtype=dtype)
+            column[:old] = getattr(self, name)
+            setattr(self, name, column)
+        self.records.extend([None] * (capacity - old))
+        # Stack: kleinste Slots zuerst vergeben
+        self._free.extend(range(capacity - 1, old - 1, -1))
+        self.capacity = capacity
+
+    # ------------------------------------------------------------------ #
+    # Anlegen
+    # ------------------------------------------------------------------ #
+    def _template_for(self, enemy: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        template_id = self._template_index.get(enemy.get("id"))
+        if template_id is None:
+            # Unbekanntes Monster: Eintrag ohne generierte Daten als eigenes Template
+            template = {k: v for k, v in enemy.items()
+                        if k not in ("generated_stats", "final_stats", "enchantment_bonuses",
+                                     "enchantments", "x", "y")}
+            template_id = len(self.templates)
+            self.templates.append(template)
+            self._template_index[template.get("id")] = template_id
+        return template_id, self.templates[template_id]
+
+    def add(self, enemy: Dict[str, Any], x: float, y: float) -> int:
+        """
+        Übernimmt einen generierten Gegner (EnemyGenerator.generate_enemy)
+
+        Das Dict selbst wird nicht gespeichert, nur seine Werte.
+
+        Returns:
+            Stabile ID des Gegners
+        """
+        if not self._free:
+            self._grow(self.capacity * 2)
+        slot = self._free.pop()
+
+        enemy_id = self._next_id
+        self._next_id += 1
+        self._slot_by_id[enemy_id] = slot
+
+        template_id, template = self._template_for(enemy)
+        stats = enemy.get("final_stats", enemy.get("generated_stats", {}))
+        enchantments = enemy.get("enchantments") or []
+        bonuses = enemy.get("enchantment_bonuses") or NO_BONUSES
+        if not any(bonuses.values()):
+            bonuses = NO_BONUSES
+
+        self.ids[slot] = enemy_id
+        self.alive[slot] = True
+        self.x[slot] = x
+        self.y[slot] = y
+        self.hp[slot] = stats.get("hp", 0)
+        self.max_hp[slot] = stats.get("max_hp", stats.get("hp", 0))
+        self.damage[slot] = stats.get("damage", 0)
+        self.defense[slot] = stats.get("defense", 0)
+        self.armour[slot] = stats.get("armour", 0)
+        self.evasion[slot] = stats.get("evasion", 0)
+        self.attack_speed[slot] = stats.get("attack_speed", 1.0)
+        self.enchant_count[slot] = len(enchantments)
+        self.template_id[slot] = template_id
+        self.version[slot] = 0
+        self.records[slot] = EnemyRecord(template, enchantments, bonuses)
+        return enemy_id
+
+    # ------------------------------------------------------------------ #
+    # Zugriff
+    # ------------------------------------------------------------------ #
+    def slot_of(self, enemy_id: Optional[int]) -> int:
+        """Slot einer stabilen Gegner-ID (-1 wenn nicht mehr vorhanden)"""
+        return self._slot_by_id.get(enemy_id, -1)
+
+    def alive_slots(self) -> np.ndarray:
+        """Belegte Slots in aufsteigender Reihenfolge (= Zeichenreihenfolge)"""
+        return np.nonzero(self.alive)[0]
+
+    # ------------------------------------------------------------------ #
+    # Treffer
+    # ------------------------------------------------------------------ #
+    def hit(self, slot: int, player_damage: int) -> Tuple[int, int, int]:
+        """
+        Einzeltreffer auf einen Gegner
+
+        Returns:
+            (tatsächlicher Schaden, HP vorher, HP nachher)
+        """
+        total_defense = int(self.defense[slot] + self.armour[slot])
+        actual_damage = max(1, int(player_damage) - total_defense)
+        current_hp = int(self.hp[slot])
+        new_hp = max(0, current_hp - actual_damage)
+        self.hp[slot] = new_hp
+        self.version[slot] += 1
+        return actual_damage, current_hp, new_hp
+
+    def hit_area(self, x: float, y: float, radius: float,
+                 player_damage: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Flächentreffer auf alle lebenden Gegner im Radius um (x, y)
+
+        Distanzmaske -> Schaden = max(1, dmg - def) -> HP-Update.
+        Gestorbene Gegner werden nicht entfernt, siehe remove_dead().
+
+        Returns:
+            (Slots der getroffenen Gegner, Schaden pro getroffenem Gegner)
+        """
+        dx = self.x - x
+        dy = self.y - y
+        in_range = (dx * dx + dy * dy) <= radius * radius
+        in_range &= self.alive
+        in_range &= self.hp > 0
+
+        slots = np.nonzero(in_range)[0]
+        damage = np.maximum(1, int(player_damage) - (self.defense[slots] + self.armour[slots]))
+        self.hp[slots] = np.maximum(0, self.hp[slots] - damage)
+        self.version[slots] += 1
+        return slots, damage
+
+    # ------------------------------------------------------------------ #
+    # Entfernen
+    # ------------------------------------------------------------------ #
+    def remove_dead(self) -> Tuple[List[EnemyRecord], List[int]]:
+        """
+        Gibt die Slots aller Gegner mit hp <= 0 frei (ohne Umkopieren)
+
+        Returns:
+            (Records der entfernten Gegner, deren IDs)
+        """
+        dead_slots = np.nonzero(self.alive & (self.hp <= 0))[0]
+        if len(dead_slots) == 0:
+            return [], []
+
+        removed = [self.records[slot] for slot in dead_slots.tolist()]
+        removed_ids = self.ids[dead_slots].tolist()
+
+        self.alive[dead_slots] = False
+        self.ids[dead_slots] = -1
+        for slot, enemy_id in zip(dead_slots.tolist(), removed_ids):
+            self.records[slot] = None
+            del self._slot_by_id[enemy_id]
+        # Größte Slots zuerst auf den Stack, damit kleine zuerst wiederverwendet werden
+        self._free.extend(sorted(dead_slots.tolist(), reverse=True))
+
+        return removed, removed_ids
@@ -0,0 +1,74 @@
+"""
+Inventory Cache - Item-Store und Suchindex über Szenen hinweg behalten
+
+Der Index über das globale Inventar kostet beim Aufbau einige µs pro Item
+(Postings, Trigramme, sortierte Buckets). Statt ihn bei jedem Öffnen des
+Inventars neu zu bauen, hält der Cache Store und Index des zuletzt
+geöffneten Inventars. open() spielt nur die seitdem angehängten
+Journal-Zeilen ein (z.B. Loot aus Kämpfen) und zieht den Index pro Eintrag
+nach. Neu gebaut wird nur, wenn die Dateien anderweitig neu geschrieben
+wurden oder ein anderer Spielstand geöffnet wird.
+
+prefetch() baut beim Betreten der Stadt auf einem Hintergrund-Thread vor;
+open() wartet über den Lock auf einen laufenden Aufbau.
+
+Store und Index gehören danach der Szene, die open() aufgerufen hat; sie
+werden nur vom Haupt-Thread verändert.
+"""
+import threading
+from typing import Optional, Tuple
+
+from core.inventory_index import InventoryIndex
+from core.item_store import ItemStore
+
+
+class InventoryCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._path: Optional[str] = None
+        self._store: Optional[ItemStore] = None
+        self._index: Optional[InventoryIndex] = None
+
+    def open(self, path: str) -> Tuple[ItemStore, InventoryIndex]:
+        """
+        Store und Index des Inventars, auf dem Stand der Dateien
+
+        Raises:
+            json.JSONDecodeError: wenn der Schnappschuss beschädigt ist
+        """
+        with self._lock:
+            records = None if path != self._path else self._store.sync()
+            if records is None:
+                self._build(path)
+            else:
+                for record in records:
+                    self._index.apply(record)
+            return self._store, self._index
+
+    def prefetch(self, path: str):
+        """Baut ein noch nicht geladenes Inventar im Hintergrund auf"""
+        with self._lock:
+            if path == self._path:
+                return
+        threading.Thread(target=self._prefetch, args=(path,), name="inventory-prefetch", daemon=True).start()
+
+    def clear(self):
+        with self._lock:
+            self._path = self._store = self._index = None
+
+    def _prefetch(self, path: str):
+        try:
+            self.open(path)
+        except (OSError, ValueError):
+            # Fehler meldet die Inventar-Szene beim eigentlichen Öffnen
+            pass
+
+    def _build(self, path: str):
+        # Erst vergessen: schlägt das Laden fehl, versucht es der nächste Aufruf neu
+        self._path = self._store = self._index = None
+        store = ItemStore.load(path)
+        self._index = InventoryIndex(store)
+        self._path, self._store = path, store
+
+
+INVENTORIES = InventoryCache()
@@ -0,0 +1,354 @@
+"""
+Inventory Index - Sekundärindizes für Suche, Filter und Sortierung
+
+Jedes Item bekommt beim Einfügen einen Handle (fortlaufende Zahl, daher
+in Drop-Reihenfolge), nachschlagbar über seine uid (siehe core.item_store). Die
+Indizes werden bei add()/remove() inkrementell gepflegt, nichts wird für
+eine Abfrage neu aufgebaut:
+
+    Item-Typ        typ -> Handles
+    Verzauberung    Enchantment-ID -> Handles
+    Name            Name -> Handles, dazu Trigramme (klein geschrieben) -> Namen
+    Level/Schaden/  sortierte Liste der vorkommenden Werte + Wert -> Handles
+    Rüstung         (Werte sind wenige kleine Zahlen, Buckets statt Array)
+
+Handle-Mengen sind dicts statt sets: sie behalten die Einfügereihenfolge
+(= Drop-Reihenfolge), gleichwertige Items bleiben so stabil sortiert.
+
+Eine Abfrage startet bei der kleinsten passenden Handle-Menge und prüft die
+übrigen Bedingungen pro Kandidat in O(1). Die Namenssuche läuft über die
+verschiedenen Namen (einige hundert Vorlagen), nicht über alle Items.
+
+Neue Journal-Zeilen (ItemStore.sync()) zieht apply() einzeln nach; der
+Index wird nur beim ersten Laden komplett aufgebaut (core.inventory_cache).
+"""
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+SORT_FIELDS = ("level", "damage", "armour")
+
+# Stat-Namen, unter denen Items einen Wert führen (erster Treffer zählt)
+_STAT_ALIASES = {
+    "damage": ("damage", "attack_power"),
+    "armour": ("armour", "armor", "defence", "defense"),
+}
+
+Postings = Dict[int, None]
+
+
+def item_level(item: Dict[str, Any]) -> int:
+    return int(item.get("item_level") or item.get("item_level_min") or 0)
+
+
+def item_stat(item: Dict[str, Any], stat: str) -> float:
+    """
+    Wert eines Stats über alle Item-Strukturen hinweg
+    (gerollte "stats", "base_stats" aus den Vorlagen, direkte Keys alter Items)
+    """
+    if stat == "level":
+        return item_level(item)
+    names = _STAT_ALIASES.get(stat, (stat,))
+    for block in (item.get("stats"), item.get("base_stats"), item):
+        if not isinstance(block, dict):
+            continue
+        for name in names:
+            value = block.get(name)
+            if isinstance(value, (int, float)):
+                return value
+    return 0
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class InventoryQuery:
+    """Filter einer Abfrage (None = egal)"""
+
+    __slots__ = ("item_type", "level_min", "level_max", "enchantment", "name")
+
+    def __init__(self, item_type: Optional[str] = None, level_min: Optional[int] = None,
+                 level_max: Optional[int] = None, enchantment: Optional[str] = None,
+                 name: Optional[str] = None):
+        self.item_type = item_type
+        self.level_min = level_min
+        self.level_max = level_max
+        self.enchantment = enchantment
+        self.name = name
+
+    @classmethod
+    def parse(cls, text: str) -> "InventoryQuery":
+        """
+        Liest eine Suchzeile, z.B. "typ:weapon level:10-20 ench:fire_damage stab"
+
+            typ:/type:        Item-Typ
+            level:/lvl:       Level, Bereich "a-b", "a-" oder "-b"
+            ench:             Enchantment-ID
+            alles andere      Teil des Namens (Groß-/Kleinschreibung egal)
+        """
+        query = cls()
+        words = []
+        for token in text.split():
+            prefix, sep, value = token.partition(":")
+            prefix = prefix.lower()
+            if not sep or not value:
+                words.append(token)
+            elif prefix in ("typ", "type"):
+                query.item_type = value.lower()
+            elif prefix in ("level", "lvl"):
+                low, dash, high = value.partition("-")
+                if low.isdigit():
+                    query.level_min = int(low)
+                if high.isdigit():
+                    query.level_max = int(high)
+                elif not dash and low.isdigit():
+                    query.level_max = int(low)
+            elif prefix == "ench":
+                query.enchantment = value.lower()
+            else:
+                words.append(token)
+        if words:
+            query.name = " ".join(words)
+        return query
+
+    def is_empty(self) -> bool:
+        return all(getattr(self, name) is None for name in self.__slots__)
+
+
+class _SortedBuckets:
+    """Wert -> Handles, dazu die vorkommenden Werte sortiert"""
+
+    def __init__(self):
+        self.values: List[float] = []
+        self.buckets: Dict[float, Postings] = {}
+        self.value_of: Dict[int, float] = {}
+
+    def add(self, handle: int, value: float):
+        bucket = self.buckets.get(value)
+        if bucket is None:
+            bucket = self.buckets[value] = {}
+            insort(self.values, value)
+        bucket[handle] = None
+        self.value_of[handle] = value
+
+    def remove(self, handle: int):
+        value = self.value_of.pop(handle)
+        bucket = self.buckets[value]
+        del bucket[handle]
+        if not bucket:
+            del self.buckets[value]
+            del self.values[bisect_left(self.values, value)]
+
+    def range(self, low: Optional[float], high: Optional[float]) -> List[Postings]:
+        start = 0 if low is None else bisect_left(self.values, low)
+        end = len(self.values) if high is None else bisect_right(self.values, high)
+        return [self.buckets[value] for value in self.values[start:end]]
+
+
+class QueryResult:
+    """Ergebnis einer Abfrage: Handles in Anzeige-Reihenfolge, per Index auf Items abgebildet"""
+
+    __slots__ = ("handles", "_items", "_positions")
+
+    def __init__(self, handles: List[int], items: Dict[int, Dict[str, Any]]):
+        self.handles = handles
+        self._items = items
+        self._positions: Optional[Dict[int, int]] = None     # Handle -> Position, bei Bedarf
+
+    def __len__(self) -> int:
+        return len(self.handles)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        return self._items[self.handles[index]]
+
+    def index(self, handle: int) -> Optional[int]:
+        """Position eines Handles im Ergebnis (None, wenn nicht enthalten)"""
+        if self._positions is None:
+            self._positions = {h: position for position, h in enumerate(self.handles)}
+        return self._positions.get(handle)
+
+
+class InventoryIndex:
+    def __init__(self, items: Iterable[Dict[str, Any]] = ()):
+        self._items: Dict[int, Dict[str, Any]] = {}
+        self._handles: Dict[str, int] = {}          # uid -> Handle
+        self._next_handle = 0
+
+        self._by_type: Dict[str, Postings] = {}
+        self._by_enchantment: Dict[str, Postings] = {}
+        self._by_name: Dict[str, Postings] = {}     # Name (klein) -> Handles
+        self._name_of: Dict[int, str] = {}
+        self._trigrams: Dict[str, Set[str]] = {}    # Trigramm -> Namen (klein)
+        self._sorted: Dict[str, _SortedBuckets] = {field: _SortedBuckets() for field in SORT_FIELDS}
+
+        for item in items:
+            self.add(item)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, handle: int) -> bool:
+        return handle in self._items
+
+    def item(self, handle: int) -> Dict[str, Any]:
+        return self._items[handle]
+
+    def handle_of(self, uid: str) -> Optional[int]:
+        return self._handles.get(uid)
+
+    # ------------------------------------------------------------------ #
+    # Pflege
+    # ------------------------------------------------------------------ #
+    def add(self, item: Dict[str, Any]) -> int:
+        handle = self._next_handle
+        self._next_handle += 1
+        self._items[handle] = item
+        self._handles[item["uid"]] = handle
+
+        self._by_type.setdefault(str(item.get("item_type") or "").lower(), {})[handle] = None
+        for enchant_id in self._enchantment_ids(item):
+            self._by_enchantment.setdefault(enchant_id, {})[handle] = None
+
+        name = str(item.get("name") or item.get("id") or "").lower()
+        self._name_of[handle] = name
+        postings = self._by_name.get(name)
+        if postings is None:
+            postings = self._by_name[name] = {}
+            for gram in trigrams(name):
+                self._trigrams.setdefault(gram, set()).add(name)
+        postings[handle] = None
+
+        for field, buckets in self._sorted.items():
+            buckets.add(handle, item_stat(item, field))
+        return handle
+
+    def remove(self, handle: int) -> Dict[str, Any]:
+        item = self._items.pop(handle)
+        del self._handles[item["uid"]]
+
+        self._discard(self._by_type, str(item.get("item_type") or "").lower(), handle)
+        for enchant_id in self._enchantment_ids(item):
+            self._discard(self._by_enchantment, enchant_id, handle)
+
+        name = self._name_of.pop(handle)
+        self._discard(self._by_name, name, handle)
+        if name not in self._by_name:
+            for gram in trigrams(name):
+                names = self._trigrams[gram]
+                names.discard(name)
+                if not names:
+                    del self._trigrams[gram]
+
+        for buckets in self._sorted.values():
+            buckets.remove(handle)
+        return item
+
+    def apply(self, record: Dict[str, Any]) -> Optional[int]:
+        """
+        Zieht einen Journal-Eintrag aus ItemStore.sync() nach
+
+        Returns:
+            Handle des betroffenen Items (None, wenn es unbekannt war)
+        """
+        if "add" in record:
+            return self.add(record["add"])
+        handle = self.handle_of(record.get("del"))
+        if handle is not None:
+            self.remove(handle)
+        return handle
+
+    @staticmethod
+    def _discard(index: Dict[str, Postings], key: str, handle: int):
+        postings = index.get(key)
+        if postings is not None:
+            postings.pop(handle, None)
+            if not postings:
+                del index[key]
+
+    @staticmethod
+    def _enchantment_ids(item: Dict[str, Any]) -> List[str]:
+        # Doppelte IDs sind egal: Eintragen und Austragen sind idempotent
+        enchantments = item.get("enchantments")
+        if not enchantments:
+            return []
+        return [str(enchant["id"]).lower() for enchant in enchantments if enchant.get("id")]
+
+    # ------------------------------------------------------------------ #
+    # Abfragen
+    # ------------------------------------------------------------------ #
+    def _matching_names(self, text: str) -> List[str]:
+        text = text.lower()
+        if len(text) < 3:
+            names: Iterable[str] = self._by_name
+        else:
+            # Kleinste Trigramm-Menge zuerst, danach Teilstring prüfen
+            sets = sorted((self._trigrams.get(gram, set()) for gram in trigrams(text)), key=len)
+            names = set.intersection(*sets) if sets[0] else ()
+        return [name for name in names if text in name]
+
+    def query(self, query: Optional[InventoryQuery] = None, sort: Optional[str] = None,
+              descending: bool = True) -> QueryResult:
+        """
+        Alle passenden Items
+
+        Args:
+            query: Filter (None = alle Items)
+            sort: Feld aus SORT_FIELDS (None = Drop-Reihenfolge)
+            descending: höchste Werte zuerst
+        """
+        # (geschätzte Größe, Handles, Prüfung pro Handle) je aktiver Bedingung
+        filters: List[Tuple[int, Callable[[], Iterable[int]], Callable[[int], bool]]] = []
+        if query is not None:
+            if query.item_type is not None:
+                postings = self._by_type.get(query.item_type, {})
+                filters.append((len(postings), lambda p=postings: p, postings.__contains__))
+
+            if query.enchantment is not None:
+                postings = self._by_enchantment.get(query.enchantment, {})
+                filters.append((len(postings), lambda p=postings: p, postings.__contains__))
+
+            if query.level_min is not None or query.level_max is not None:
+                levels = self._sorted["level"]
+                buckets = levels.range(query.level_min, query.level_max)
+                low = float("-inf") if query.level_min is None else query.level_min
+                high = float("inf") if query.level_max is None else query.level_max
+                filters.append((
+                    sum(len(bucket) for bucket in buckets),
+                    lambda b=buckets: (handle for bucket in b for handle in bucket),
+                    lambda handle, v=levels.value_of: low <= v[handle] <= high,
+                ))
+
+            if query.name:
+                names = self._matching_names(query.name)
+                postings_list = [self._by_name[name] for name in names]
+                names = set(names)
+                filters.append((
+                    sum(len(postings) for postings in postings_list),
+                    lambda p=postings_list: (handle for postings in p for handle in postings),
+                    lambda handle, n=self._name_of: n[handle] in names,
+                ))
+
+        if not filters:
+            if sort is None:
+                return QueryResult(list(self._items), self._items)
+            # Alles sortiert: Buckets der Reihe nach ablaufen
+            buckets = self._sorted[sort]
+            handles: List[int] = []
+            for value in (reversed(buckets.values) if descending else buckets.values):
+                handles.extend(buckets.buckets[value])
+            return QueryResult(handles, self._items)
+
+        filters.sort(key=lambda f: f[0])
+        _, candidates, _ = filters[0]
+        checks = [check for _, _, check in filters[1:]]
+        if checks:
+            handles = [handle for handle in candidates() if all(check(handle) for check in checks)]
+        else:
+            handles = list(candidates())
+
+        handles.sort()                           # Handles steigen mit der Drop-Reihenfolge
+        if sort is not None:
+            # Stabil: gleiche Werte bleiben in Drop-Reihenfolge
+            handles.sort(key=self._sorted[sort].value_of.__getitem__, reverse=descending)
+        return QueryResult(handles, self._items)
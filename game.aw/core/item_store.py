@@ -0,0 +1,256 @@
+"""
+Item Store - globales Inventar mit stabilen Item-IDs und Tombstones
+
+Jedes Item trägt eine eindeutige "uid" (vergeben beim Drop in
+LootGenerator.generate_loot, ältere Items bekommen sie beim Laden). Der
+Store hält die Items in Drop-Reihenfolge in einer Slot-Liste, dazu
+uid -> Slot. Entfernen setzt nur einen Tombstone (None), dadurch sind
+Anlegen, Ablegen und Nachschlagen O(1) und nichts verschiebt sich.
+Sind zu viele Slots tot, wird kompaktiert (amortisiert O(1)).
+
+Auf der Platte liegt wie bisher global_inventory.json als Schnappschuss.
+Änderungen werden nicht mehr durch Neuschreiben der ganzen Datei
+gespeichert, sondern als Zeilen an ein Journal angehängt:
+
+    {"add": {...Item...}}
+    {"del": "<uid>"}
+
+Beim Laden wird das Journal über den Schnappschuss gespielt (doppelte
+"add" und "del" unbekannter uids sind harmlos). Ist das Journal im
+Verhältnis zum Inventar groß geworden, schreibt compact() einen neuen
+Schnappschuss und leert es.
+
+Der Store merkt sich, bis wohin er das Journal gelesen hat. sync() spielt
+nur die seitdem angehängten Zeilen ein (z.B. Loot aus einem Kampf über
+append_to_inventory) und liefert sie zurück, damit abhängige Indizes sie
+einzeln nachziehen können, statt neu aufgebaut zu werden.
+"""
+import json
+import os
+import uuid
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+JOURNAL_SUFFIX = ".journal"
+
+# Kompaktieren, sobald mehr als die Hälfte tot ist (und mindestens so viele Einträge)
+COMPACT_MIN_TOMBSTONES = 1024
+COMPACT_MIN_JOURNAL = 1024
+
+
+def new_item_uid() -> str:
+    # uuid4 statt random: verändert den (gesetzten) RNG-Zustand des Kampfes nicht
+    return uuid.uuid4().hex
+
+
+def journal_path(snapshot_path: str) -> str:
+    return snapshot_path + JOURNAL_SUFFIX
+
+
+def append_to_inventory(snapshot_path: str, items: Iterable[Dict[str, Any]]):
+    """Hängt Items ans Journal an, ohne das Inventar zu laden (z.B. Loot nach dem Kampf)"""
+    lines = []
+    for item in items:
+        item.setdefault("uid", new_item_uid())
+        lines.append(json.dumps({"add": item}, ensure_ascii=False))
+    if lines:
+        with open(journal_path(snapshot_path), "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+class ItemStore:
+    def __init__(self, items: Iterable[Dict[str, Any]] = (), path: Optional[str] = None):
+        """
+        Args:
+            items: Anfangsbestand (wird nicht ins Journal geschrieben)
+            path: Schnappschuss-Datei; None = nur im Speicher
+        """
+        self.path = path
+        self._slots: List[Optional[Dict[str, Any]]] = []
+        self._slot_of: Dict[str, int] = {}
+        self.tombstones = 0
+        self.journal_records = 0
+        self._journal_offset = 0        # gelesene bzw. selbst geschriebene Bytes im Journal
+        self._snapshot_stamp = None     # (mtime_ns, Größe) des Schnappschusses beim Laden
+
+        for item in items:
+            self._insert(item)
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+    def __contains__(self, uid: str) -> bool:
+        return uid in self._slot_of
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Lebende Items in Drop-Reihenfolge"""
+        return (item for item in self._slots if item is not None)
+
+    def get(self, uid: str) -> Optional[Dict[str, Any]]:
+        slot = self._slot_of.get(uid)
+        return None if slot is None else self._slots[slot]
+
+    # ------------------------------------------------------------------ #
+    # Ändern
+    # ------------------------------------------------------------------ #
+    def add(self, item: Dict[str, Any]) -> str:
+        """Fügt ein Item am Ende ein und liefert seine uid"""
+        uid = self._insert(item)
+        self._journal({"add": item})
+        return uid
+
+    def remove(self, uid: str) -> Optional[Dict[str, Any]]:
+        """Entfernt ein Item (Tombstone); None, wenn die uid unbekannt ist"""
+        item = self._delete(uid)
+        if item is not None:
+            self._journal({"del": uid})
+            if self.tombstones >= COMPACT_MIN_TOMBSTONES and self.tombstones * 2 > len(self._slots):
+                self._compact_slots()
+        return item
+
+    def _insert(self, item: Dict[str, Any]) -> str:
+        uid = item.get("uid")
+        if not uid or uid in self._slot_of:
+            # Ältere Items ohne uid, oder kopierte Items mit doppelter uid
+            uid = item["uid"] = new_item_uid()
+        self._slot_of[uid] = len(self._slots)
+        self._slots.append(item)
+        return uid
+
+    def _delete(self, uid: str) -> Optional[Dict[str, Any]]:
+        slot = self._slot_of.pop(uid, None)
+        if slot is None:
+            return None
+        item = self._slots[slot]
+        self._slots[slot] = None
+        self.tombstones += 1
+        return item
+
+    def _compact_slots(self):
+        self._slots = [item for item in self._slots if item is not None]
+        self._slot_of = {item["uid"]: slot for slot, item in enumerate(self._slots)}
+        self.tombstones = 0
+
+    # ------------------------------------------------------------------ #
+    # Platte
+    # ------------------------------------------------------------------ #
+    @classmethod
+    def load(cls, path: str) -> "ItemStore":
+        """
+        Lädt Schnappschuss + Journal
+
+        Raises:
+            json.JSONDecodeError: wenn der Schnappschuss beschädigt ist
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                items = json.load(f)
+        except FileNotFoundError:
+            items = []
+
+        # Ältere Saves: beim Laden vergebene uids sofort festschreiben
+        missing_uids = any("uid" not in item for item in items)
+        store = cls(items, path)
+        store._snapshot_stamp = store._stamp()
+        store._replay_journal()
+        if missing_uids or store.journal_records >= max(COMPACT_MIN_JOURNAL, len(store) // 2):
+            store.compact()
+        return store
+
+    def _replay_journal(self):
+        for record in self._read_journal():
+            self._apply(record)
+        if self.tombstones:
+            self._compact_slots()
+
+    def sync(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Spielt seit dem Laden angehängte Journal-Zeilen ein
+
+        Returns:
+            Die wirksamen Einträge ({"add": Item} bzw. {"del": uid}) in
+            Reihenfolge, oder None, wenn die Dateien anderweitig neu
+            geschrieben wurden (dann neu laden)
+        """
+        if self.path is None:
+            return []
+        if self._stamp() != self._snapshot_stamp:
+            return None
+        try:
+            if os.path.getsize(journal_path(self.path)) < self._journal_offset:
+                return None
+        except FileNotFoundError:
+            return [] if self._journal_offset == 0 else None
+        return [record for record in self._read_journal() if self._apply(record)]
+
+    def _read_journal(self) -> List[Dict[str, Any]]:
+        """Vollständige Zeilen ab dem zuletzt gelesenen Offset"""
+        try:
+            f = open(journal_path(self.path), "rb")
+        except FileNotFoundError:
+            return []
+        with f:
+            f.seek(self._journal_offset)
+            data = f.read()
+
+        # Eine noch nicht fertig geschriebene letzte Zeile bleibt für später liegen
+        end = data.rfind(b"\n") + 1
+        self._journal_offset += end
+        records = []
+        for line in data[:end].splitlines():
+            try:
+                records.append(json.loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                # Abgebrochene Zeile (Absturz beim Schreiben)
+                continue
+        self.journal_records += len(records)
+        return records
+
+    def _apply(self, record: Dict[str, Any]) -> bool:
+        """Wendet einen Journal-Eintrag an; False, wenn er nichts ändert"""
+        if "add" in record:
+            item = record["add"]
+            if item.get("uid") in self._slot_of:
+                return False
+            self._insert(item)
+            return True
+        if "del" in record:
+            return self._delete(record["del"]) is not None
+        return False
+
+    def _stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _journal(self, record: Dict[str, Any]):
+        if self.path is None:
+            return
+        with open(journal_path(self.path), "ab") as f:
+            caught_up = f.tell() == self._journal_offset
+            f.write((json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8"))
+            # Hat ein anderer Schreiber ungelesene Zeilen angehängt, bleibt der
+            # Offset stehen; sync() liest die eigene Zeile dann idempotent mit
+            if caught_up:
+                self._journal_offset = f.tell()
+        self.journal_records += 1
+        if self.journal_records >= max(COMPACT_MIN_JOURNAL, len(self) // 2):
+            self.compact()
+
+    def compact(self):
+        """Entfernt Tombstones und schreibt einen neuen Schnappschuss (Journal wird geleert)"""
+        self._compact_slots()
+        if self.path is None:
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._slots, f, ensure_ascii=False, indent=4)
+        os.replace(tmp_path, self.path)
+        # Erst nach dem Schnappschuss leeren: ein Absturz dazwischen spielt
+        # das Journal nur erneut (idempotent)
+        open(journal_path(self.path), "w", encoding="utf-8").close()
+        self.journal_records = 0
+        self._journal_offset = 0
+        self._snapshot_stamp = self._stamp()
@@ -70,3 +70,17 @@ def save_level_settings(level_key: str, settings: dict):
     all_data = _load_all_level_data()
     all_data[level_key] = settings
     _save_all_level_data(all_data)
+
+
+def load_all_level_settings() -> dict:
+    """
+    Lädt die Settings aller Level aus level_data.json (ohne zu schreiben).
+    Fehlende Keys werden mit den Defaults aufgefüllt.
+    """
+    all_data = _load_all_level_data()
+    result = {}
+    for level_key, settings in all_data.items():
+        merged = DEFAULT_LEVEL_SETTINGS.copy()
+        merged.update(settings or {})
+        result[level_key] = merged
+    return result
@@ -4,6 +4,7 @@ import random
 from typing import Any, Dict, List, Optional
 
 from core.constants import BASE_PATH
+from core.item_store import new_item_uid
 
 
 ITEM_FILES = [
@@ -25,7 +26,12 @@ class LootGenerator:
     DROP_CHANCE = 0.5
     ENCHANT_ROLL_CHANCE = 0.05
 
-    def __init__(self):
+    def __init__(self, rng=random):
+        """
+        Args:
+            rng: Zufallsquelle (Modul random oder random.Random, z.B. pro Kampf)
+        """
+        self.rng = rng
         self.data_path = os.path.join(BASE_PATH, "data")
         self.item_pool: List[Dict[str, Any]] = self._load_all_items()
         self.enchantments: List[Dict[str, Any]] = self._load_enchantments()
@@ -57,7 +63,7 @@ class LootGenerator:
         Generiert ein Item, das zu einem Gegnerlevel passt. Kann None zurückgeben,
         wenn kein Drop gerollt wurde oder keine passenden Items existieren.
         """
-        if random.random() > self.DROP_CHANCE:
+        if self.rng.random() > self.DROP_CHANCE:
             return None
 
         candidate = self._pick_item_for_level(monster_level)
@@ -89,10 +95,11 @@ class LootGenerator:
         if not candidates:
             return None
 
-        return random.choice(candidates)
+        return self.rng.choice(candidates)
 
     def _build_item(self, template: Dict[str, Any]) -> Dict[str, Any]:
         item = {
+            "uid": new_item_uid(),
             "id": template.get("id"),
             "name": template.get("name"),
             "item_type": template.get("item_type"),
@@ -120,9 +127,9 @@ class LootGenerator:
             max_val = block.get(f"{base_key}_max", min_val)
 
             if isinstance(min_val, float) or isinstance(max_val, float):
-                rolled_value = random.uniform(float(min_val), float(max_val))
+                rolled_value = self.rng.uniform(float(min_val), float(max_val))
             else:
-                rolled_value = random.randint(int(min_val), int(max_val))
+                rolled_value = self.rng.randint(int(min_val), int(max_val))
 
             rolled[base_key] = rolled_value
 
@@ -146,7 +153,7 @@ class LootGenerator:
             allowed_set = set(allowed_ids)
             candidates = [e for e in candidates if e.get("id") in allowed_set]
 
-        random.shuffle(candidates)
+        self.rng.shuffle(candidates)
 
         results: List[Dict[str, Any]] = []
         tier_cap = self._max_tier_for_level(item_level)
@@ -154,14 +161,14 @@ class LootGenerator:
         for enchant in candidates:
             if len(results) >= max_slots:
                 break
-            if random.random() > self.ENCHANT_ROLL_CHANCE:
+            if self.rng.random() > self.ENCHANT_ROLL_CHANCE:
                 continue
 
             value_min = enchant.get("value_min", 0)
             value_max = enchant.get("value_max", value_min)
-            base_value = random.randint(value_min, value_max) if value_max > value_min else value_min
+            base_value = self.rng.randint(value_min, value_max) if value_max > value_min else value_min
 
-            rolled_tier = random.randint(1, tier_cap)
+            rolled_tier = self.rng.randint(1, tier_cap)
             final_value = base_value * rolled_tier
 
             results.append({
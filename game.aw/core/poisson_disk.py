@@ -0,0 +1,173 @@
+"""
+Poisson-Disk-Sampling (Bridson) mit Hintergrundraster und variablen Radien
+
+Zwei Punkte a, b halten immer den Abstand r_a + r_b ein. Das Raster hat die
+Zellgröße 2 * r_min / sqrt(2), jede Abstandsprüfung betrachtet also nur
+eine feste Zahl von Nachbarzellen.
+
+Es werden nur so viele Punkte erzeugt wie angefragt: Die Kosten hängen von
+der Anzahl der Punkte ab, nicht von der Größe des Bereichs. Bereits belegte
+Positionen liegen von Anfang an im Raster, neue Punkte halten auch zu ihnen
+den Abstand ein.
+"""
+import math
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+# Reserve, damit der Abstand auch nach dem Runden auf ganze Pixel hält
+# (Rundungsfehler pro Punktpaar < sqrt(2))
+ROUNDING_SLACK = 1.5
+
+
+def poisson_disk_sites(
+    min_x: float,
+    min_y: float,
+    max_x: float,
+    max_y: float,
+    radii: Sequence[float],
+    k: int = 30,
+    rng=random,
+    count: Optional[int] = None,
+    occupied: Sequence[Tuple[float, float, float]] = (),
+) -> List[Tuple[float, float, float]]:
+    """
+    Erzeugt Punkte nach Bridson, bis count Punkte angenommen wurden oder
+    kein Platz mehr ist.
+
+    Jeder neue Punkt wird zuerst an einer zufälligen Stelle im ganzen
+    Bereich versucht, damit auch wenige Punkte über den Bereich verteilt
+    liegen. Passt er dort nicht, wächst Bridson von den aktiven Punkten
+    (den neuen und den belegten) aus weiter und findet so auch in vollen
+    Bereichen noch Lücken.
+
+    Die Radien neuer Punkte werden reihum aus radii genommen, damit die
+    Anteile der Radien denen der angefragten Objekte entsprechen.
+
+    Args:
+        min_x, min_y, max_x, max_y: Bereich für die Mittelpunkte
+        radii: Radien (mindestens einer, > 0)
+        k: Kandidaten pro aktivem Punkt
+        rng: Zufallsquelle (Modul random oder random.Random)
+        count: Anzahl gewünschter Punkte (None = Bereich füllen)
+        occupied: bereits belegte (x, y, radius), z.B. lebende Gegner
+
+    Returns:
+        Liste der neuen (x, y, radius), ohne die belegten
+    """
+    radii = [float(r) for r in radii if r > 0]
+    if not radii or max_x < min_x or max_y < min_y or count == 0:
+        return []
+
+    occupied = [(float(x), float(y), float(r)) for x, y, r in occupied]
+    all_radii = radii + [r for _, _, r in occupied if r > 0]
+    r_min = min(all_radii)
+    r_max = max(all_radii)
+    cell = 2 * r_min / math.sqrt(2)
+    # Belegte Positionen halten den Abstand evtl. nicht untereinander ein,
+    # daher eine Liste pro Zelle
+    grid: Dict[Tuple[int, int], List[int]] = {}
+    points: List[Tuple[float, float, float]] = []
+    active: List[int] = []
+
+    order = list(radii)
+    rng.shuffle(order)
+
+    def cell_of(x, y):
+        return int((x - min_x) // cell), int((y - min_y) // cell)
+
+    def fits(x, y, r):
+        if not (min_x <= x <= max_x and min_y <= y <= max_y):
+            return False
+        cx, cy = cell_of(x, y)
+        span = int(math.ceil((r + r_max + ROUNDING_SLACK) / cell))
+        for gx in range(cx - span, cx + span + 1):
+            for gy in range(cy - span, cy + span + 1):
+                for index in grid.get((gx, gy), ()):
+                    sx, sy, sr = points[index]
+                    limit = r + sr + ROUNDING_SLACK
+                    if (sx - x) ** 2 + (sy - y) ** 2 < limit * limit:
+                        return False
+        return True
+
+    def add(x, y, r):
+        grid.setdefault(cell_of(x, y), []).append(len(points))
+        active.append(len(points))
+        points.append((x, y, r))
+
+    for site in occupied:
+        add(*site)
+    first_new = len(points)
+
+    def place(r) -> bool:
+        # Zufällige Stelle im ganzen Bereich
+        x, y = rng.uniform(min_x, max_x), rng.uniform(min_y, max_y)
+        if fits(x, y, r):
+            add(x, y, r)
+            return True
+
+        # Bridson: Kandidaten im Ring [ar + r, 2 * (ar + r)] um aktive Punkte
+        while active:
+            slot = rng.randrange(len(active))
+            ax, ay, ar = points[active[slot]]
+            for _ in range(k):
+                distance = rng.uniform(ar + r, 2 * (ar + r))
+                angle = rng.uniform(0, 2 * math.pi)
+                x = ax + math.cos(angle) * distance
+                y = ay + math.sin(angle) * distance
+                if fits(x, y, r):
+                    add(x, y, r)
+                    return True
+            # Kein Platz mehr um diesen Punkt -> aus der aktiven Liste nehmen (O(1))
+            active[slot] = active[-1]
+            active.pop()
+        return False
+
+    placed = 0
+    while count is None or placed < count:
+        if not place(order[placed % len(order)]):
+            break
+        placed += 1
+
+    return points[first_new:]
+
+
+def sample_positions(
+    radii: Sequence[float],
+    min_x: float,
+    min_y: float,
+    max_x: float,
+    max_y: float,
+    k: int = 30,
+    rng=random,
+    occupied: Sequence[Tuple[float, float, float]] = (),
+) -> List[Optional[Tuple[int, int]]]:
+    """
+    Verteilt Objekte mit den angegebenen Radien überlappungsfrei im Bereich.
+
+    Args:
+        occupied: bereits belegte (x, y, radius), zu denen ebenfalls
+            Abstand gehalten wird (z.B. lebende Gegner früherer Wellen)
+
+    Returns:
+        Pixelposition pro Radius bzw. None, falls das Objekt nicht mehr passt
+    """
+    if not radii:
+        return []
+
+    sites = poisson_disk_sites(min_x, min_y, max_x, max_y, radii, k=k, rng=rng,
+                               count=len(radii), occupied=occupied)
+
+    by_radius: Dict[float, List[Tuple[float, float, float]]] = {}
+    for site in sites:
+        by_radius.setdefault(site[2], []).append(site)
+
+    positions: List[Optional[Tuple[int, int]]] = []
+    for r in radii:
+        group = by_radius.get(float(r))
+        if group:
+            x, y, _ = group.pop()
+            positions.append((int(round(x)), int(round(y))))
+        else:
+            positions.append(None)
+    return positions
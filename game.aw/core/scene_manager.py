@@ -1,11 +1,138 @@
+"""
+Scene Manager - Szenen-Stapel mit pausierten, wiederverwendeten Szenen
+
+Eine Szene gibt aus update() zurück, wohin es weitergeht:
+
+    Push(szene)        neue Szene oben drauf, die aktuelle wird pausiert
+    Pop(fallback)      zurück zur pausierten Szene darunter (sofort, mit
+                       ihrem Zustand und ihren geladenen Assets); ist keine
+                       mehr da, wird fallback() gebaut
+    Replace(szene)     aktuelle Szene ersetzen (wird verworfen)
+    Reset(szene)       ganzen Stapel verwerfen (z.B. zurück ins Hauptmenü)
+    szene              wie Replace (bisheriges Verhalten)
+
+Szenen können on_suspend() (wird verdeckt) und on_resume() (ist wieder
+oben) anbieten, z.B. um Hintergrund-Arbeit anzuhalten oder Hover und
+Dirty-Rects nach der Pause neu aufzusetzen. on_quit() wird beim Beenden
+des Spiels für jede Szene im Stapel aufgerufen (z.B. um noch zu speichern).
+
+Gehalten werden höchstens max_suspended pausierte Szenen; beim Push fällt
+die am längsten nicht aktive (die unterste) heraus. Ein Pop dorthin baut
+dann über den Fallback eine neue.
+"""
+from typing import Any, Callable, List, Optional
+
+
+MAX_SUSPENDED_SCENES = 4
+
+
+class Push:
+    def __init__(self, scene):
+        self.scene = scene
+
+
+class Pop:
+    def __init__(self, fallback: Optional[Callable[[], Any]] = None):
+        self.fallback = fallback
+
+
+class Replace:
+    def __init__(self, scene):
+        self.scene = scene
+
+
+class Reset:
+    def __init__(self, scene):
+        self.scene = scene
+
+
+def _call_hook(scene, name: str):
+    hook = getattr(scene, name, None)
+    if hook is not None:
+        hook()
+
+
 class SceneManager:
-    def __init__(self, start_scene):
-        self.current_scene = start_scene
+    def __init__(self, start_scene, max_suspended: int = MAX_SUSPENDED_SCENES):
+        self.stack: List[Any] = [start_scene]
+        self.max_suspended = max_suspended
+
+    @property
+    def current_scene(self):
+        return self.stack[-1]
+
+    # ------------------------------------------------------------------ #
+    # Übergänge
+    # ------------------------------------------------------------------ #
+    def push(self, scene):
+        _call_hook(self.current_scene, "on_suspend")
+        self.stack.append(scene)
+        # Am längsten nicht aktive pausierte Szenen verwerfen
+        while len(self.stack) - 1 > self.max_suspended:
+            del self.stack[0]
+
+    def pop(self, fallback: Optional[Callable[[], Any]] = None):
+        if len(self.stack) > 1:
+            self.stack.pop()
+            _call_hook(self.current_scene, "on_resume")
+        elif fallback is not None:
+            # Szene darunter wurde verworfen (oder war nie da): neu bauen
+            self.stack = [fallback()]
+        else:
+            print("⚠ Keine Szene zum Zurückkehren, bleibe in der aktuellen")
+
+    def replace(self, scene):
+        self.stack[-1] = scene
+
+    def reset(self, scene):
+        self.stack = [scene]
+
+    def _apply(self, transition):
+        if isinstance(transition, Push):
+            self.push(transition.scene)
+        elif isinstance(transition, Pop):
+            self.pop(transition.fallback)
+        elif isinstance(transition, Replace):
+            self.replace(transition.scene)
+        elif isinstance(transition, Reset):
+            self.reset(transition.scene)
+        else:
+            self.replace(transition)
+
+    def shutdown(self):
+        """Beim Beenden des Spiels: on_quit() aller Szenen, oberste zuerst"""
+        for scene in reversed(self.stack):
+            _call_hook(scene, "on_quit")
+
+    # ------------------------------------------------------------------ #
+    def update(self, events, dt):
+        transition = self.current_scene.update(events, dt)
+        if transition:
+            self._apply(transition)
+
+    def is_animating(self):
+        """
+        Ob sich die Szene ohne Eingabe verändert (Animation, Timer, ...)
+
+        Szenen ohne is_animating() gelten als animiert, werden also wie
+        bisher jeden Frame aktualisiert und gezeichnet.
+        """
+        is_animating = getattr(self.current_scene, "is_animating", None)
+        return True if is_animating is None else is_animating()
+
+    def draw(self, screen, alpha=1.0):
+        self.current_scene.draw(screen, alpha)
 
-    def update(self, events):
-        next_scene = self.current_scene.update(events)
-        if next_scene:
-            self.current_scene = next_scene
+    def draw_dirty(self, screen, alpha=1.0):
+        """
+        Zeichnet im Dirty-Rect-Modus
 
-    def draw(self, screen):
-        self.current_scene.draw(screen)
+        Returns:
+            Geänderte Rechtecke oder None, wenn die Szene den Modus nicht
+            unterstützt (dann wurde voll gezeichnet)
+        """
+        draw_dirty = getattr(self.current_scene, "draw_dirty", None)
+        if draw_dirty is None:
+            self.current_scene.draw(screen, alpha)
+            return None
+        return draw_dirty(screen, alpha)
@@ -0,0 +1,94 @@
+"""
+Spatial Hash - gleichmäßiges Raster für schnelle Punktabfragen
+
+Jede Entität liegt mit ihrem Mittelpunkt in genau einer Zelle. Eine
+Punktabfrage prüft nur die Zellen, die ein Rechteck der halben Kantenlänge
+half_size um den Punkt überdeckt, statt alle Entitäten durchzugehen.
+"""
+from typing import Dict, Hashable, List, Set, Tuple
+
+
+class SpatialHash:
+    def __init__(self, cell_size: int):
+        """
+        Args:
+            cell_size: Kantenlänge einer Zelle in Pixeln (sinnvoll: >= Entitätsgröße)
+        """
+        self.cell_size = max(1, int(cell_size))
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._positions: Dict[Hashable, Tuple[float, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, entity_id: Hashable) -> bool:
+        return entity_id in self._positions
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    # ------------------------------------------------------------------ #
+    # Pflege
+    # ------------------------------------------------------------------ #
+    def insert(self, entity_id: Hashable, x: float, y: float):
+        if entity_id in self._positions:
+            self.move(entity_id, x, y)
+            return
+        self._positions[entity_id] = (x, y)
+        self._cells.setdefault(self._cell(x, y), set()).add(entity_id)
+
+    def remove(self, entity_id: Hashable):
+        position = self._positions.pop(entity_id, None)
+        if position is None:
+            return
+        cell = self._cell(*position)
+        bucket = self._cells.get(cell)
+        if bucket is not None:
+            bucket.discard(entity_id)
+            if not bucket:
+                del self._cells[cell]
+
+    def move(self, entity_id: Hashable, x: float, y: float):
+        old = self._positions.get(entity_id)
+        if old is None:
+            self.insert(entity_id, x, y)
+            return
+        self._positions[entity_id] = (x, y)
+        old_cell, new_cell = self._cell(*old), self._cell(x, y)
+        if old_cell != new_cell:
+            bucket = self._cells[old_cell]
+            bucket.discard(entity_id)
+            if not bucket:
+                del self._cells[old_cell]
+            self._cells.setdefault(new_cell, set()).add(entity_id)
+
+    def clear(self):
+        self._cells.clear()
+        self._positions.clear()
+
+    # ------------------------------------------------------------------ #
+    # Abfragen
+    # ------------------------------------------------------------------ #
+    def query_point(self, x: float, y: float, half_size: float) -> List[Hashable]:
+        """
+        Alle Entitäten, deren achsenparalleles Quadrat (Mittelpunkt ± half_size)
+        den Punkt (x, y) enthält
+
+        Returns:
+            Liste der getroffenen IDs (unsortiert)
+        """
+        min_cx, min_cy = self._cell(x - half_size, y - half_size)
+        max_cx, max_cy = self._cell(x + half_size, y + half_size)
+
+        hits = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = self._cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for entity_id in bucket:
+                    ex, ey = self._positions[entity_id]
+                    # Gleiche Semantik wie pygame.Rect.collidepoint (rechte/untere Kante exklusiv)
+                    if -half_size <= x - ex < half_size and -half_size <= y - ey < half_size:
+                        hits.append(entity_id)
+        return hits
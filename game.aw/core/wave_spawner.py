@@ -0,0 +1,148 @@
+"""
+Wave Spawner - Gegner in Wellen statt alle auf einmal erzeugen
+
+Die Wellen eines Levels kommen aus level_data.json:
+
+    "Feld_7": {
+        ...,
+        "max_active": 100,
+        "waves": [
+            {"count": 50, "repeat": 2000, "monster_level_min": 5}
+        ]
+    }
+
+Jeder Wellen-Eintrag erbt die übrigen Level-Settings und kann sie
+überschreiben; "repeat" wiederholt ihn. Ohne "waves" gibt es genau eine
+Welle mit enemy_count Gegnern (bisheriges Verhalten).
+
+Gegner werden erst erzeugt, wenn sie gebraucht werden: Pro Frame wird ein
+kleiner Teil der nächsten Welle vorab generiert, gespawnt wird sie erst,
+wenn unter max_active genug Platz ist. Im Speicher liegen also nie mehr als
+max_active lebende Gegner plus eine vorbereitete Welle.
+"""
+from typing import Any, Dict, Iterator, List, Optional
+
+from core.enemy_generator import EnemyGenerator
+
+
+# Anzahl Gegner, die pro Frame für die nächste Welle vorab erzeugt werden
+PREFETCH_PER_FRAME = 8
+
+
+def wave_definitions(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Normalisierte Wellen-Einträge eines Levels (mit count und repeat)
+
+    Args:
+        config: Level-Settings aus level_data.json
+    """
+    default_count = max(1, int(config.get("enemy_count", 5)))
+    waves = config.get("waves") or [{}]
+
+    result = []
+    for wave in waves:
+        entry = dict(wave)
+        entry["count"] = max(1, int(entry.get("count", default_count)))
+        entry["repeat"] = max(1, int(entry.get("repeat", 1)))
+        result.append(entry)
+    return result
+
+
+def iter_wave_configs(config: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Liefert die Config jeder einzelnen Welle (Level-Settings + Überschreibungen)
+
+    "repeat" wird erst beim Iterieren aufgelöst, auch 100k Wellen kosten
+    also keinen Speicher.
+    """
+    base = {k: v for k, v in config.items() if k not in ("waves", "max_active")}
+    for wave in wave_definitions(config):
+        wave_config = dict(base)
+        wave_config.update({k: v for k, v in wave.items() if k != "repeat"})
+        for _ in range(wave["repeat"]):
+            yield wave_config
+
+
+class WaveSpawner:
+    def __init__(self, generator: EnemyGenerator, config: Dict[str, Any],
+                 prefetch_per_frame: int = PREFETCH_PER_FRAME):
+        """
+        Args:
+            generator: EnemyGenerator, der die Gegner erzeugt
+            config: Level-Settings (inkl. optional "waves" und "max_active")
+            prefetch_per_frame: Gegner, die prefetch() pro Aufruf höchstens erzeugt
+        """
+        self.generator = generator
+        self.prefetch_per_frame = max(1, int(prefetch_per_frame))
+
+        definitions = wave_definitions(config)
+        self.wave_count = sum(w["repeat"] for w in definitions)
+        self.total = sum(w["count"] * w["repeat"] for w in definitions)
+        largest_wave = max(w["count"] for w in definitions)
+        self.max_active = max(largest_wave, int(config.get("max_active", 0)))
+
+        self.spawned_waves = 0
+        self.spawned = 0
+
+        self._configs = iter_wave_configs(config)
+        self._source: Optional[Iterator[Dict[str, Any]]] = None
+        self._pending: List[Dict[str, Any]] = []
+        self._pending_size = 0
+        self._open_next_wave()
+
+    @property
+    def exhausted(self) -> bool:
+        """True, wenn alle Wellen gespawnt wurden"""
+        return self._source is None
+
+    def _open_next_wave(self):
+        wave_config = next(self._configs, None)
+        if wave_config is None:
+            self._source = None
+            self._pending_size = 0
+            return
+        self._pending_size = wave_config["count"]
+        self._source = self.generator.iter_configured_enemies(wave_config, self._pending_size)
+
+    # ------------------------------------------------------------------ #
+    # Pro Frame
+    # ------------------------------------------------------------------ #
+    def prefetch(self, budget: int = None) -> int:
+        """
+        Erzeugt bis zu budget Gegner der nächsten Welle vorab
+
+        Returns:
+            Anzahl neu erzeugter Gegner
+        """
+        if self._source is None:
+            return 0
+        budget = self.prefetch_per_frame if budget is None else budget
+
+        produced = 0
+        while produced < budget and len(self._pending) < self._pending_size:
+            enemy = next(self._source, None)
+            if enemy is None:
+                break
+            self._pending.append(enemy)
+            produced += 1
+        return produced
+
+    def ready(self, active_count: int) -> bool:
+        """Passt die nächste Welle neben active_count lebende Gegner?"""
+        return self._source is not None and active_count + self._pending_size <= self.max_active
+
+    def take_wave(self) -> List[Dict[str, Any]]:
+        """
+        Gibt die nächste Welle komplett heraus und bereitet die folgende vor
+
+        Noch nicht vorab erzeugte Gegner werden dabei sofort erzeugt.
+        """
+        if self._source is None:
+            return []
+        self.prefetch(self._pending_size)
+
+        wave, self._pending = self._pending, []
+        self.spawned_waves += 1
+        self.spawned += len(wave)
+        self._open_next_wave()
+        return wave
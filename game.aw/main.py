@@ -1,32 +1,186 @@
-import pygame
-from core.constants import WIDTH, HEIGHT
-from core.scene_manager import SceneManager
-from scenes.main_menu import MainMenu
-import os
-from core.constants import SAVE_ROOT
-
-os.makedirs(SAVE_ROOT, exist_ok=True)
-
-pygame.init()
-
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Game")
-clock = pygame.time.Clock()
-
-manager = SceneManager(MainMenu())
-
-while True:
-    events = pygame.event.get()
-
-    for e in events:
-        if e.type == pygame.QUIT:
-            pygame.quit()
-            quit()
-
-    manager.update(events)
-    manager.draw(screen)
-
-    pygame.display.flip()
-    clock.tick(60)
-
-
+import argparse
+import os
+import sys
+import time
+
+STARTED = time.perf_counter()   # Bezugspunkt für --startup-report
+
+import pygame
+from core.constants import WIDTH, HEIGHT
+from core.constants import SAVE_ROOT, SIMULATION_RATE, FRAME_RATE, MAX_FRAME_TIME, IDLE_WAIT_TIMEOUT
+from core.scene_manager import SceneManager
+from core.asset_manager import ASSETS
+from core.dev_settings import save_dev_settings
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Game")
+    parser.add_argument("--sim-rate", type=int, default=SIMULATION_RATE,
+                        help="Logik-Schritte pro Sekunde")
+    parser.add_argument("--fps", type=int, default=FRAME_RATE,
+                        help="Render-Limit (0 = unbegrenzt)")
+    parser.add_argument("--headless", action="store_true",
+                        help="Ohne Fenster: Logik so schnell wie möglich ausführen")
+    parser.add_argument("--duration", type=float, default=10.0,
+                        help="Simulierte Sekunden im Headless-Modus")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="Nur geänderte Bildbereiche zeichnen und ausgeben")
+    parser.add_argument("--record-combat", action="store_true",
+                        help="Kämpfe als Combat-Log im Save-Slot aufzeichnen")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="Startzeiten bis zum ersten Frame ausgeben und beenden")
+    return parser.parse_args()
+
+
+def run(screen, manager, sim_dt, fps, dirty_rects=False):
+    """
+    Fester Zeitschritt mit Akkumulator: die Logik läuft immer mit sim_dt,
+    gezeichnet wird so oft wie fps erlaubt (mit Interpolation dazwischen).
+
+    Mit dirty_rects werden nur die von der Szene gemeldeten Bereiche
+    ausgegeben (Szenen ohne draw_dirty werden voll gezeichnet).
+
+    Leerlauf: animiert die Szene nicht (SceneManager.is_animating) und kam
+    kein Event, ändert sich am Bild nichts. Dann wird weder gezeichnet noch
+    geflippt, sondern mit pygame.event.wait auf das nächste Event gewartet
+    (höchstens IDLE_WAIT_TIMEOUT, danach ein Logik-Schritt ohne Events).
+    """
+    clock = pygame.time.Clock()
+    accumulator = 0.0
+    pending_events = []
+    needs_draw = True
+
+    while True:
+        events = []
+        if not needs_draw and not pending_events and not manager.is_animating():
+            event = pygame.event.wait(IDLE_WAIT_TIMEOUT)
+            if event.type != pygame.NOEVENT:
+                events.append(event)
+            # Die Wartezeit ist keine Spielzeit: genau ein Schritt, damit das
+            # Event sofort verarbeitet wird
+            clock.tick()
+            accumulator = sim_dt
+        else:
+            frame_time = min(clock.tick(fps) / 1000.0, MAX_FRAME_TIME)
+            accumulator += frame_time
+
+        events.extend(pygame.event.get())
+        for e in events:
+            if e.type == pygame.QUIT:
+                manager.shutdown()
+                pygame.quit()
+                quit()
+
+        # Was vor den Schritten animiert war, muss auch danach noch einmal
+        # gezeichnet werden (letztes Bild der Animation)
+        needs_draw = needs_draw or manager.is_animating()
+
+        # Events gehen an den nächsten Simulationsschritt (auch wenn dieser
+        # erst in einem späteren Frame fällig ist)
+        pending_events.extend(events)
+        while accumulator >= sim_dt:
+            scene = manager.current_scene
+            if pending_events:
+                needs_draw = True
+            manager.update(pending_events, sim_dt)
+            if manager.current_scene is not scene:
+                needs_draw = True
+            pending_events = []
+            accumulator -= sim_dt
+
+        if not needs_draw:
+            continue
+
+        if dirty_rects:
+            rects = manager.draw_dirty(screen, accumulator / sim_dt)
+            if rects is None:
+                pygame.display.flip()
+            elif rects:
+                pygame.display.update(rects)
+        else:
+            manager.draw(screen, accumulator / sim_dt)
+            pygame.display.flip()
+        needs_draw = False
+
+
+def run_headless(screen, manager, sim_dt, duration):
+    """Führt duration Sekunden Spiellogik ohne Warten und ohne Zeichnen aus."""
+    steps = max(1, int(duration / sim_dt))
+    started = time.perf_counter()
+
+    for _ in range(steps):
+        manager.update(pygame.event.get(), sim_dt)
+
+    elapsed = time.perf_counter() - started
+    print(f"Headless: {steps} Schritte ({duration:.1f}s Spielzeit) in {elapsed:.3f}s")
+    manager.shutdown()
+    pygame.quit()
+
+
+def init_pygame():
+    """
+    Die einzige Initialisierung von pygame (Module initialisieren beim
+    Import nichts mehr). Gebraucht werden nur Display (inkl. Events) und
+    Fonts - pygame.init() würde zusätzlich Audio und Joysticks starten.
+    """
+    pygame.display.init()
+    pygame.font.init()
+
+
+def mark_startup(marks, name):
+    marks.append((name, (time.perf_counter() - STARTED) * 1000.0))
+
+
+def print_startup_report(marks):
+    """Startphasen in ms seit Beginn von main.py (siehe tools/startup_report.py)"""
+    previous = 0.0
+    for name, ms in marks:
+        print(f"startup: {ms:8.1f} ms  (+{ms - previous:6.1f})  {name}", file=sys.stderr)
+        previous = ms
+
+
+def main():
+    marks = []
+    mark_startup(marks, "Imports")
+    args = parse_args()
+    os.makedirs(SAVE_ROOT, exist_ok=True)
+    if args.record_combat:
+        save_dev_settings({"record_combat": True})
+
+    if args.headless:
+        # Dummy-Videotreiber (muss vor der Initialisierung gesetzt sein)
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+
+    init_pygame()
+    mark_startup(marks, "pygame init")
+
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Game")
+    mark_startup(marks, "Fenster")
+
+    # Hintergründe schon laden, während das Hauptmenü läuft
+    ASSETS.preload()
+
+    # Szenen-Module erst jetzt laden; weitere Szenen importiert jede Szene
+    # selbst beim Wechsel
+    from scenes.main_menu import MainMenu
+    manager = SceneManager(MainMenu())
+    sim_dt = 1.0 / max(1, args.sim_rate)
+    mark_startup(marks, "Hauptmenü")
+
+    if args.startup_report:
+        manager.draw(screen)
+        pygame.display.flip()
+        mark_startup(marks, "erster Frame")
+        print_startup_report(marks)
+        pygame.quit()
+        return
+
+    if args.headless:
+        run_headless(screen, manager, sim_dt, args.duration)
+    else:
+        run(screen, manager, sim_dt, max(0, args.fps), dirty_rects=args.dirty_rects)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,52 @@
 """
 Battle Scene - Kampfszene mit Gegnern
 """
-import json
+import copy
 import os
 import random
-from typing import Any, Dict
+import time
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pygame
 from ui.button import Button
-from ui.fonts import FONT, FONT_SMALL
+from ui.fonts import FONT, FONT_SMALL, TEXT_CACHE, render_text
+from ui.damage_numbers import DamageNumberPool
+from ui.dirty_renderer import DirtyElement, DirtyRenderer, button_element
+from ui.enemy_sprite import EnemySprite
+from ui.widget import UIRoot, Widget
 from core.constants import WIDTH, HEIGHT
-from core.enemy_generator import generate_enemies_for_field
+from core.asset_manager import BATTLE_BACKGROUND, SCREEN_SIZE, load_image
+from core.enemy_generator import EnemyGenerator
 from core.dev_settings import load_dev_settings
 from core.player_stats_calculator import PlayerStatsCalculator
 from core.level_data import load_level_settings, save_level_settings
 from core.loot_generator import LootGenerator
-from core.constants import SAVE_ROOT, SAVE_SLOTS
+from core.scene_manager import Pop
+from core.item_store import append_to_inventory
+from core.combat import calculate_damage, get_player_damage, get_total_defense
+from core.enemy_store import EnemyRecord, EnemyStore
+from core.wave_spawner import WaveSpawner
+from core.attack_scheduler import AttackScheduler
+from core.spatial_hash import SpatialHash
+from core.poisson_disk import sample_positions
+from core.constants import SAVE_ROOT, SAVE_SLOTS, SIMULATION_RATE
+from core.combat_log import (
+    CombatLog, roster_hash, item_hash,
+    EVENT_CLICK, EVENT_HIT, EVENT_DEATH, EVENT_LOOT, EVENT_WAVE, EVENT_DEFEAT, EVENT_END,
+)
 
 
+# Scheduler-ID des Spielers (Gegner verwenden ihre Store-IDs >= 0)
+PLAYER_ID = -1
+
+# Sekunden zwischen zwei Aktualisierungen der Text-Cache-Zeile im Dev-Overlay
+CACHE_STATS_INTERVAL = 0.25
 
 
 class BattleScene:
-    def __init__(self, slot_index, level_type, level_number):
+    def __init__(self, slot_index, level_type, level_number, replay_of: Optional[CombatLog] = None,
+                 seed: Optional[int] = None, level_config: Optional[Dict[str, Any]] = None):
         """
         Initialisiert die Battle Scene
         
@@ -29,115 +54,187 @@ class BattleScene:
             slot_index: Speicher-Slot Index
             level_type: Art des Levels ("Feld" oder "Cave")
             level_number: Nummer des Levels
+            replay_of: Combat-Log, dessen Kampf nachgestellt wird (Seed, Config
+                und Spieler-Stats aus dem Log, Loot wird nicht gespeichert)
+            seed: fester Seed für Gegner, Loot und Platzierung (Default: zufällig)
+            level_config: Level-Settings statt load_level_settings() (schreibt
+                nichts, z.B. für den Vorab-Bau auf einem Worker-Thread)
         """
         self.slot_index = slot_index
         self.level_type = level_type
         self.level_number = level_number
+        self.replay_of = replay_of
         
         # Eindeutiger Key pro Level/Feld
         self.level_key = f"{self.level_type}_{self.level_number}"
 
         # Dev-Level-Settings für dieses Feld
-        self.level_config = load_level_settings(self.level_key)
+        if replay_of is not None:
+            self.level_config = dict(replay_of.meta["level_config"])
+        elif level_config is not None:
+            self.level_config = dict(level_config)
+        else:
+            self.level_config = load_level_settings(self.level_key)
 
         # Globaler Dev-Status (aus Optionen)
         self.dev_settings = load_dev_settings()
         self.dev_enabled = self.dev_settings.get("dev_mode", False)
 
+        # Eigener Zufallsgenerator pro Kampf: Gegner, Loot und Platzierung ziehen
+        # nur hieraus, nie aus dem globalen random (das andere Threads, z.B. der
+        # Vorab-Bau des nächsten Kampfes, gleichzeitig benutzen)
+        recording = replay_of is not None or self.dev_settings.get("record_combat", False)
+        if replay_of is not None:
+            seed = replay_of.seed
+        elif seed is None and recording:
+            seed = random.SystemRandom().getrandbits(63)
+        self.rng = random.Random(seed)
+
+        # Combat-Log: fester Seed, damit der Kampf aus den Eingaben reproduzierbar ist
+        self.tick = 0
+        self.combat_log = None
+        if recording:
+            # Kopie: das Dev-Overlay ändert level_config während des Kampfes
+            self.combat_log = CombatLog(seed, 1.0 / SIMULATION_RATE, {
+                "level_type": level_type,
+                "level_number": level_number,
+                "level_config": copy.deepcopy(self.level_config),
+            })
+        self.combat_log_saved = False
+
         # Flag & Buttons für Dev-Overlay
         self.show_dev_overlay = False
         self.dev_buttons = []
+        self.cache_stats_line = None   # (Zeitpunkt, Surface) der Text-Cache-Zeile
+        
+        # Hintergrundbild (geteilt, konvertiert und auf Bildschirmgröße skaliert)
+        self.background = load_image(BATTLE_BACKGROUND, SCREEN_SIZE)
+        self.renderer = DirtyRenderer(self._draw_static)
+        
+        # Gegner im slotbasierten Store (Templates aus monster.json werden geteilt)
+        enemy_generator = EnemyGenerator(rng=self.rng)
+        self.enemies = EnemyStore(enemy_generator.monsters)
+        self.unplaced_enemy_count = 0
+        self.enemy_size = 50  # Größe des Gegner-Rechtecks (Radius 25)
         
-        # Lade Hintergrundbild
-        # Berechne Pfad: game.aw/scenes/ -> game.aw/ -> root/ -> assets/battle/
-        base_path = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))  # game.aw
-        root_path = os.path.dirname(base_path)  # root
-        battle_bg_path = os.path.join(root_path, "assets", "battle", "2D_test_battle.png")
-        
-        try:
-            self.background = pygame.image.load(battle_bg_path)
-            # Skaliere Hintergrund auf Bildschirmgröße falls nötig
-            bg_width, bg_height = self.background.get_size()
-            if bg_width != WIDTH or bg_height != HEIGHT:
-                self.background = pygame.transform.scale(self.background, (WIDTH, HEIGHT))
-        except Exception as e:
-            print(f"Fehler beim Laden des Hintergrundbildes: {e}")
-            self.background = None
-        
-        # Generiere Gegner nur für "Feld" Level
-        self.enemies = []
+        # Raster für Hover-/Klick-Abfragen (nur Gegner in den Nachbarzellen prüfen)
+        self.enemy_grid = SpatialHash(cell_size=self.enemy_size * 2)
+        
+        # Darstellung: ein vorgerendertes Sprite pro Gegner, gezeichnet in
+        # Store-Slot-Reihenfolge (angelegt erst beim Zeichnen auf dem Main-Thread,
+        # da der Konstruktor auch im Hintergrund laufen kann und Fonts nicht
+        # thread-sicher sind)
+        self.enemy_sprites = {}               # Gegner-ID -> EnemySprite
+        self.new_sprite_ids = set()           # gespawnt, noch ohne Sprite
+        self.drawn_versions = np.zeros(0, dtype=np.uint32)  # Store-Version je Slot beim letzten Sync
+        self.highlighted = (None, None)       # (hovered, Ziel) beim letzten Sync
+        
+        # Gegner nur für "Feld" Level, in Wellen nach der Config dieses Feldes
+        self.spawner = None
         if level_type == "Feld":
-            # Nutzt die Config für dieses Feld
-            self.enemies = generate_enemies_for_field(level_number, config=self.level_config)
-            self._place_enemies_randomly()
+            self.spawner = WaveSpawner(enemy_generator, self.level_config)
+            self._spawn_waves()
         
         # Loot-Generator
-        self.loot_generator = LootGenerator()
+        self.loot_generator = LootGenerator(rng=self.rng)
 
         # Buttons
         self.buttons = []
         self.create_buttons()      # Zurück (+ ggf. Dev-Button)
         if self.dev_enabled:
             self._create_dev_buttons()  # Buttons IM Overlay
+
+        # Dev-Buttons hängen an einem Panel, das nur mit dem Overlay sichtbar ist
+        self.dev_panel = Widget()
+        self.dev_panel.add(*self.dev_buttons)
+        self.dev_panel.visible = False
+        self.ui = UIRoot()
+        self.ui.add(*self.buttons, self.dev_panel)
         
         # Hover und Click Tracking
-        self.hovered_enemy = None  # Index des gehoverten Gegners
-        self.enemy_size = 50  # Größe des Gegner-Rechtecks (Radius 25)
+        self.hovered_enemy = None  # Stabile ID des gehoverten Gegners
+        self.tooltip_cache = {}    # Gegner-ID -> (Store-Version, Tooltip-Surface)
+        self.aoe_radius = 120  # Radius des Flächenangriffs (Rechtsklick)
         
         # Lade Spieler-Stats
         self.stats_calculator = PlayerStatsCalculator()
-        self.player_stats = self.stats_calculator.get_player_stats(slot_index)
+        if replay_of is not None:
+            self.player_stats = replay_of.meta["player_stats"]
+        else:
+            self.player_stats = self.stats_calculator.get_player_stats(slot_index)
+        if self.combat_log is not None:
+            self.combat_log.meta["player_stats"] = copy.deepcopy(self.player_stats)
+            self.combat_log.roster_hash = roster_hash(self.enemies)
         
         # Schadensanzeigen (für visuelles Feedback)
-        self.damage_texts = []  # Liste von (x, y, timer, damage, enemy_index)
+        self.damage_numbers = DamageNumberPool()  # Gehören per stabiler ID zu ihrem Gegner
+
+        # Echtzeit-Kampf: Auto-Angriffe von Spieler und Gegnern über den Scheduler
+        stats = self.player_stats.get("stats", {}) if self.player_stats else {}
+        self.battle_time = 0.0
+        self.scheduler = AttackScheduler()
+        self.target_enemy_id = None  # Stabile ID des Angriffsziels (Linksklick)
+        self.player_hp = stats.get("health", 0)
+        self.player_stats_version = 0   # bei jeder Änderung an Stats/HP erhöhen (Panel-Cache)
+        self.stats_panel_cache = None   # (player_stats_version, Panel-Surface)
+        self.player_defense = get_total_defense(stats)
+        self.player_defeated = False
+        if self.player_stats:
+            self.scheduler.add(PLAYER_ID, stats.get("attack_speed", 1.0), self.battle_time, delay=0.0)
     
-    def _place_enemies_randomly(self):
+    def _spawn_waves(self):
         """
-        Platziert Gegner zufällig auf der Map
+        Spawnt fällige Wellen und erzeugt einen Teil der nächsten Welle vorab
+        """
+        if self.spawner is None:
+            return
+        
+        while self.spawner.ready(len(self.enemies)):
+            self._place_enemies_randomly(self.spawner.take_wave())
+            if self.combat_log is not None:
+                self._log(EVENT_WAVE, roster_hash(self.enemies))
+        self.spawner.prefetch()
+    
+    def _place_enemies_randomly(self, enemies: List[Dict[str, Any]]):
+        """
+        Platziert Gegner zufällig auf der Map (Poisson-Disk-Sampling) und
+        legt sie im Store an
+        
+        Gegner halten garantiert ihren Mindestabstand ein (Radius aus den
+        Monster-Daten, sonst min_distance / 2), auch zu bereits lebenden
+        Gegnern früherer Wellen. Passen nicht alle Gegner auf das Feld,
+        werden die übrigen nicht platziert und gemeldet.
+        
+        Args:
+            enemies: Generierte Gegner-Dictionaries
         """
-        # Definiere Bereiche für zufällige Platzierung
         # Lasse einen Rand frei (z.B. 100 Pixel von den Rändern)
         margin = 100
-        min_x = margin
-        max_x = WIDTH - margin
-        min_y = margin
-        max_y = HEIGHT - margin
-        
-        # Stelle sicher, dass Gegner nicht zu nah beieinander sind
         min_distance = 80
-        placed_positions = []
         
-        for enemy in self.enemies:
-            max_attempts = 50
-            placed = False
-            
-            for attempt in range(max_attempts):
-                x = random.randint(min_x, max_x)
-                y = random.randint(min_y, max_y)
-                
-                # Prüfe Abstand zu bereits platzierten Gegnern
-                too_close = False
-                for px, py in placed_positions:
-                    distance = ((x - px) ** 2 + (y - py) ** 2) ** 0.5
-                    if distance < min_distance:
-                        too_close = True
-                        break
-                
-                if not too_close:
-                    # Füge Position zur enemy-Datenstruktur hinzu
-                    enemy["x"] = x
-                    enemy["y"] = y
-                    placed_positions.append((x, y))
-                    placed = True
-                    break
-            
-            # Falls kein passender Platz gefunden wurde, platziere trotzdem
-            if not placed:
-                x = random.randint(min_x, max_x)
-                y = random.randint(min_y, max_y)
-                enemy["x"] = x
-                enemy["y"] = y
-                placed_positions.append((x, y))
+        # Lebende Gegner als belegte Positionen (nur diese, nicht das ganze Feld)
+        store = self.enemies
+        occupied = [
+            (float(store.x[slot]), float(store.y[slot]),
+             store.records[slot].template.get("radius", min_distance / 2))
+            for slot in store.alive_slots().tolist()
+        ]
+        radii = [enemy.get("radius", min_distance / 2) for enemy in enemies]
+        positions = sample_positions(radii, margin, margin, WIDTH - margin, HEIGHT - margin,
+                                     rng=self.rng, occupied=occupied)
+        
+        placed = 0
+        for enemy, position in zip(enemies, positions):
+            if position is not None:
+                enemy_id = self.enemies.add(enemy, *position)
+                self.enemy_grid.insert(enemy_id, *position)
+                self.new_sprite_ids.add(enemy_id)
+                placed += 1
+        
+        unplaced = len(enemies) - placed
+        self.unplaced_enemy_count += unplaced
+        if unplaced:
+            print(f"⚠️ Nur {placed} von {len(enemies)} Gegnern passen auf das Feld")
     
     def create_buttons(self):
         """Erstellt Buttons für die Battle Scene"""
@@ -160,6 +257,7 @@ class BattleScene:
     
     def toggle_dev_overlay(self):
         self.show_dev_overlay = not self.show_dev_overlay
+        self.dev_panel.set_visible(self.show_dev_overlay)
 
     def _create_dev_buttons(self):
         """
@@ -242,51 +340,41 @@ class BattleScene:
     
     def back_to_level_selection(self):
         """Zurück zur Level-Auswahl"""
+        self._save_combat_log()
         from scenes.level_selection_scene import LevelSelectionScene
-        return LevelSelectionScene(self.slot_index)
-    
-    def _get_enemy_rect(self, enemy: Dict) -> pygame.Rect:
-        """
-        Gibt das Rechteck eines Gegners zurück
-        
-        Args:
-            enemy: Gegner-Dictionary
-            
-        Returns:
-            pygame.Rect des Gegners
-        """
-        x = enemy.get("x", 0)
-        y = enemy.get("y", 0)
-        size = self.enemy_size
-        return pygame.Rect(x - size // 2, y - size // 2, size, size)
+        return Pop(lambda: LevelSelectionScene(self.slot_index, last_played=(self.level_type, self.level_number)))
     
-    def _get_enemy_at_position(self, pos: tuple) -> int:
+    def _get_enemy_at_position(self, pos: tuple) -> Optional[int]:
         """
-        Gibt den Index des Gegners an der gegebenen Position zurück
+        Gibt die ID des Gegners an der gegebenen Position zurück
         
         Args:
             pos: (x, y) Mausposition
             
         Returns:
-            Index des Gegners oder -1 wenn keiner gefunden
+            Stabile Gegner-ID oder None wenn keiner gefunden
         """
         mouse_x, mouse_y = pos
         
-        # Prüfe von hinten nach vorne (zuerst sichtbare Gegner)
-        for i in range(len(self.enemies) - 1, -1, -1):
-            enemy = self.enemies[i]
-            enemy_rect = self._get_enemy_rect(enemy)
-            if enemy_rect.collidepoint(mouse_x, mouse_y):
-                return i
+        # Nur Gegner aus den Rasterzellen um die Position prüfen
+        candidates = self.enemy_grid.query_point(mouse_x, mouse_y, self.enemy_size // 2)
+        
+        # Bei Überlappung gewinnt der zuletzt gezeichnete (höchster Slot)
+        best_id, best_slot = None, -1
+        for enemy_id in candidates:
+            slot = self.enemies.slot_of(enemy_id)
+            if slot > best_slot:
+                best_id, best_slot = enemy_id, slot
         
-        return -1
+        return best_id
     
-    def update(self, events):
+    def update(self, events, dt):
         """
         Update-Logik für die Battle Scene
         
         Args:
             events: Liste von pygame Events
+            dt: Delta-Zeit des Simulationsschritts in Sekunden
             
         Returns:
             Neue Scene oder None
@@ -294,201 +382,307 @@ class BattleScene:
         mouse_pos = pygame.mouse.get_pos()
         
         # Prüfe Hover über Gegnern
-        hovered_index = self._get_enemy_at_position(mouse_pos)
-        self.hovered_enemy = hovered_index
+        self.hovered_enemy = self._get_enemy_at_position(mouse_pos)
         
         for e in events:
-            # Buttons (Zurück + Dev)
-            for btn in self.buttons:
-                result = btn.handle_event(e)
-                if result:
-                    return result
+            # Buttons (Zurück + Dev, bei offenem Overlay auch die Dev-Buttons)
+            result = self.ui.handle_event(e)
+            if result:
+                return result
 
-            # Dev-Overlay aktiv? Dann nur Dev-Buttons verarbeiten, kein Kampf
+            # Dev-Overlay aktiv? Dann kein Kampf
             if self.show_dev_overlay:
-                for btn in self.dev_buttons:
-                    btn.handle_event(e)
                 continue
 
-            # Click auf Gegner - Starte Kampf
-            if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
-                clicked_enemy_index = self._get_enemy_at_position(e.pos)
-                if clicked_enemy_index >= 0 and clicked_enemy_index < len(self.enemies):
-                    # Simuliere Kampf
-                    enemy_died = self._simulate_combat(clicked_enemy_index)
-                    
-                    # Entferne Gegner wenn tot
-                    if enemy_died:
-                        self.enemies.pop(clicked_enemy_index)
-                        # Setze hover zurück falls der entfernte Gegner gehover wurde
-                        if self.hovered_enemy == clicked_enemy_index:
-                            self.hovered_enemy = None
-                        elif self.hovered_enemy > clicked_enemy_index:
-                            # Anpassen des Hover-Index wenn ein vorheriger Gegner entfernt wurde
-                            self.hovered_enemy -= 1
+            # Nach einer Niederlage kein Kampf mehr
+            if self.player_defeated:
+                continue
+
+            if e.type == pygame.MOUSEBUTTONDOWN:
+                self.handle_combat_click(e.button, e.pos)
+        
+        # Fällige Auto-Angriffe ausführen
+        self.battle_time += dt
+        self._process_attacks()
+        
+        # Nächste Welle spawnen bzw. vorbereiten
+        self._spawn_waves()
         
         # Aktualisiere Schadensanzeigen
-        dt = 0.016  # ~60 FPS (wird später durch tatsächliches dt ersetzt wenn nötig)
-        self._update_damage_texts(dt)
+        self.damage_numbers.update(dt)
+        
+        if self.combat_log is not None and self.tick == 0:
+            self.combat_log.sim_dt = dt
+        self.tick += 1
         
         return None
+    
+    def handle_combat_click(self, button: int, pos: tuple):
+        """
+        Verarbeitet einen Klick ins Kampffeld (auch direkt vom Replay genutzt)
+        
+        Args:
+            button: Maustaste (1 = Ziel wählen, 3 = Flächenangriff)
+            pos: (x, y) Klickposition
+        """
+        if button not in (1, 3):
+            return
+        self._log(EVENT_CLICK, button, *pos)
+        
+        # Linksklick auf Gegner - Angriffsziel für Auto-Angriffe setzen
+        if button == 1:
+            clicked_enemy_id = self._get_enemy_at_position(pos)
+            if clicked_enemy_id is not None:
+                self.target_enemy_id = clicked_enemy_id
+                record = self.enemies.records[self.enemies.slot_of(clicked_enemy_id)]
+                print(f"🎯 Ziel: {record.name}")
+        
+        # Rechtsklick - Flächenangriff auf alle Gegner im Radius
+        elif self._simulate_area_attack(pos):
+            self._remove_dead_enemies()
 
+    def _process_attacks(self):
+        """
+        Führt alle bis battle_time fälligen Auto-Angriffe aus (nur fällige
+        Einträge des Schedulers, keine Abfrage aller Gegner)
+        """
+        for combatant_id, _ in self.scheduler.pop_due(self.battle_time):
+            if self.player_defeated:
+                break
+            if combatant_id == PLAYER_ID:
+                self._player_auto_attack()
+            else:
+                self._enemy_auto_attack(combatant_id)
+
+    def _player_auto_attack(self):
+        """Auto-Angriff des Spielers auf das aktuelle Ziel"""
+        if self.target_enemy_id is None:
+            return
         
-    
-    def _update_damage_texts(self, dt: float):
+        slot = self.enemies.slot_of(self.target_enemy_id)
+        if slot < 0:
+            self.target_enemy_id = None
+            return
+        
+        if self._simulate_combat(slot):
+            self._remove_dead_enemies()
+
+    def _enemy_auto_attack(self, enemy_id: int):
+        """Auto-Angriff eines Gegners auf den Spieler"""
+        slot = self.enemies.slot_of(enemy_id)
+        if slot < 0:
+            self.scheduler.remove(enemy_id)
+            return
+        
+        enemy_damage = int(self.enemies.damage[slot])
+        actual_damage = calculate_damage(enemy_damage, self.player_defense)
+        self.player_hp = max(0, self.player_hp - actual_damage)
+        self.player_stats_version += 1
+        self._log(EVENT_HIT, PLAYER_ID, actual_damage, self.player_hp)
+        
+        if self.player_hp <= 0:
+            self.player_defeated = True
+            self._log(EVENT_DEFEAT)
+            self.scheduler.clear()
+            print("☠️ Spieler wurde besiegt!")
+
+    def _aggro_enemies(self, slots):
         """
-        Aktualisiert Schadensanzeigen
+        Angegriffene Gegner schlagen ab jetzt mit ihrer Angriffsgeschwindigkeit zurück
         
         Args:
-            dt: Delta-Zeit
-        """
-        # Entferne abgelaufene Schadensanzeigen und aktualisiere Timer
-        updated_texts = []
-        for dmg in self.damage_texts:
-            # Prüfe ob Gegner noch existiert
-            if 0 <= dmg["enemy_index"] < len(self.enemies):
-                dmg["timer"] -= dt
-                if dmg["timer"] > 0:
-                    # Aktualisiere Position (bewegt sich nach oben)
-                    dmg["y"] -= 50 * dt
-                    updated_texts.append(dmg)
-        
-        self.damage_texts = updated_texts
-    
-    def _simulate_combat(self, enemy_index: int) -> bool:
+            slots: Store-Slots der getroffenen Gegner
+        """
+        for slot in slots:
+            enemy_id = int(self.enemies.ids[slot])
+            if enemy_id not in self.scheduler:
+                attack_speed = float(self.enemies.attack_speed[slot])
+                self.scheduler.add(enemy_id, attack_speed, self.battle_time)
+
+    def _simulate_combat(self, slot: int) -> bool:
         """
         Simuliert einen Kampf zwischen Spieler und Gegner
         
         Args:
-            enemy_index: Index des angegriffenen Gegners
+            slot: Store-Slot des angegriffenen Gegners
             
         Returns:
             True wenn Gegner gestorben ist, False sonst
         """
-        if enemy_index < 0 or enemy_index >= len(self.enemies):
+        if slot < 0 or not self.enemies.alive[slot]:
             return False
         
-        enemy = self.enemies[enemy_index]
-        
+
         # Prüfe ob Spieler-Stats verfügbar sind
         if not self.player_stats:
             print("Keine Spieler-Stats verfügbar!")
             return False
         
         player_stats = self.player_stats.get("stats", {})
-        final_stats = enemy.get("final_stats", enemy.get("generated_stats", {}))
-        
-        # Hole Spieler-Schaden
-        player_damage = player_stats.get("damage", 0)
-        
-        # Wenn kein direkter Schaden vorhanden, berechne aus Stärke/Intelligenz
-        if player_damage <= 0:
-            strength = player_stats.get("strength", 0)
-            intelligence = player_stats.get("intelligence", 0)
-            # Verwende den höheren Wert als Basis-Schaden
-            player_damage = max(strength, intelligence) if max(strength, intelligence) > 0 else 5
-        
-        # Hole Gegner-Verteidigung
-        enemy_defense = final_stats.get("defense", 0)
-        enemy_armour = final_stats.get("armour", 0)
-        total_defense = enemy_defense + enemy_armour
-        
-        # Berechne tatsächlichen Schaden
-        # Schaden = Spieler-Schaden - Gegner-Verteidigung (Minimum 1)
-        actual_damage = max(1, player_damage - total_defense)
-        
-        # Reduziere Gegner-HP
-        current_hp = final_stats.get("hp", 0)
-        new_hp = max(0, current_hp - actual_damage)
-        final_stats["hp"] = new_hp
-        
-        # Aktualisiere Gegner-Stats
-        enemy["final_stats"] = final_stats
-        
-        # Füge Schadensanzeige hinzu
-        enemy_x = enemy.get("x", 0)
-        enemy_y = enemy.get("y", 0)
-        self.damage_texts.append({
-            "x": enemy_x,
-            "y": enemy_y - 30,
-            "timer": 1.5,  # 1.5 Sekunden sichtbar
-            "damage": actual_damage,
-            "enemy_index": enemy_index
-        })
+        
+        # Hole Spieler-Schaden und Gegner-Verteidigung
+        player_damage = get_player_damage(player_stats)
+        total_defense = int(self.enemies.defense[slot] + self.enemies.armour[slot])
+        
+        # Schaden = Spieler-Schaden - Gegner-Verteidigung (Minimum 1), HP im Store
+        actual_damage, current_hp, new_hp = self.enemies.hit(slot, player_damage)
+        self._log(EVENT_HIT, self.enemies.ids[slot], actual_damage, new_hp)
+        
+        # Füge Schadensanzeige hinzu, Gegner greift ab jetzt zurück an
+        self._add_damage_text(slot, actual_damage)
+        self._aggro_enemies([slot])
         
         print(f"⚔️ Kampf: {player_damage} Schaden - {total_defense} Verteidigung = {actual_damage} Schaden")
         print(f"   Gegner HP: {current_hp} -> {new_hp}")
         
         # Prüfe ob Gegner tot ist
         if new_hp <= 0:
-            print(f"   ✝️ Gegner '{enemy.get('name', 'Unbekannt')}' ist gestorben!")
-            self._handle_enemy_death(enemy)
+            print(f"   ✝️ Gegner '{self.enemies.records[slot].name}' ist gestorben!")
             return True
         
         return False
 
-    def _handle_enemy_death(self, enemy: Dict[str, Any]):
+    def _simulate_area_attack(self, pos: tuple) -> bool:
         """
-        Versucht einen Itemdrop zu generieren und speichert ihn im Inventar.
+        Flächenangriff auf alle Gegner im Radius um pos (eine Vektoroperation)
+        
+        Args:
+            pos: (x, y) Zentrum des Angriffs
+            
+        Returns:
+            True wenn mindestens ein Gegner gestorben ist
         """
-        monster_level = enemy.get("level", 1)
-        loot_item = self.loot_generator.generate_loot(monster_level)
+        if not self.player_stats or len(self.enemies) == 0:
+            return False
+        
+        player_damage = get_player_damage(self.player_stats.get("stats", {}))
+        slots, damage = self.enemies.hit_area(pos[0], pos[1], self.aoe_radius, player_damage)
+        if len(slots) == 0:
+            return False
+        
+        for slot, actual_damage in zip(slots.tolist(), damage.tolist()):
+            self._add_damage_text(slot, actual_damage)
+            self._log(EVENT_HIT, self.enemies.ids[slot], actual_damage, self.enemies.hp[slot])
+        self._aggro_enemies(slots.tolist())
+        
+        deaths = int((self.enemies.hp[slots] <= 0).sum())
+        print(f"💥 Flächenangriff: {len(slots)} Gegner getroffen, {deaths} gestorben")
+        return deaths > 0
 
-        if not loot_item:
-            return
+    def _add_damage_text(self, slot: int, damage: int):
+        """Fügt eine Schadensanzeige über einem Gegner hinzu"""
+        self.damage_numbers.spawn(
+            float(self.enemies.x[slot]),
+            float(self.enemies.y[slot]) - 30,
+            damage,
+            owner=int(self.enemies.ids[slot]),
+        )
 
-        self._add_item_to_inventory(loot_item)
-        item_name = loot_item.get("name", loot_item.get("id", "Item"))
-        print(f"💰 Loot erhalten: {item_name}")
+    def _remove_dead_enemies(self):
+        """
+        Entfernt alle toten Gegner in einem Schritt und verteilt deren Loot
+        """
+        removed, removed_ids = self.enemies.remove_dead()
+        if not removed:
+            return
+        
+        # Tote Gegner greifen nicht mehr an, sind kein Ziel und nicht mehr anklickbar
+        for enemy_id in removed_ids:
+            self.scheduler.remove(enemy_id)
+            self.enemy_grid.remove(enemy_id)
+            self._log(EVENT_DEATH, enemy_id)
+        if self.target_enemy_id in removed_ids:
+            self.target_enemy_id = None
+        if self.hovered_enemy in removed_ids:
+            self.hovered_enemy = None
+        self.damage_numbers.release_owners(removed_ids)
+        for enemy_id in removed_ids:
+            self.tooltip_cache.pop(enemy_id, None)
+            self.new_sprite_ids.discard(enemy_id)
+            self.enemy_sprites.pop(enemy_id, None)
+        
+        self._handle_enemy_deaths(removed)
 
-    def _add_item_to_inventory(self, item: Dict[str, Any]):
+    def _handle_enemy_deaths(self, records: List[EnemyRecord]):
         """
-        Speichert ein Item im globalen Inventar des aktuellen Slots.
+        Versucht für jeden gestorbenen Gegner einen Itemdrop zu generieren und
+        speichert alle Drops gemeinsam im Inventar.
         """
-        save_dir = os.path.join(SAVE_ROOT, SAVE_SLOTS[self.slot_index])
-        os.makedirs(save_dir, exist_ok=True)
-        inventory_path = os.path.join(save_dir, "global_inventory.json")
+        loot_items = []
+        for record in records:
+            loot_item = self.loot_generator.generate_loot(record.level)
+            if loot_item:
+                loot_items.append(loot_item)
+                if self.combat_log is not None:
+                    self._log(EVENT_LOOT, item_hash(loot_item))
+        
+        if not loot_items:
+            return
+        
+        # Beim Replay nichts ins Inventar schreiben
+        if self.replay_of is None:
+            self._add_items_to_inventory(loot_items)
+        for loot_item in loot_items:
+            item_name = loot_item.get("name", loot_item.get("id", "Item"))
+            print(f"💰 Loot erhalten: {item_name}")
+
+    def _log(self, kind: int, *payload):
+        """Schreibt ein Ereignis ins Combat-Log (falls aktiv)"""
+        if self.combat_log is not None:
+            self.combat_log.record(self.tick, kind, *payload)
 
-        try:
-            with open(inventory_path, "r", encoding="utf-8") as f:
-                inventory = json.load(f)
-        except FileNotFoundError:
-            inventory = []
-        except json.JSONDecodeError:
-            inventory = []
+    def finish_combat_log(self) -> Optional[CombatLog]:
+        """Schließt das Combat-Log mit einem End-Ereignis ab"""
+        if self.combat_log is None:
+            return None
+        if not self.combat_log.events or self.combat_log.events[-1][1] != EVENT_END:
+            self._log(EVENT_END)
+        return self.combat_log
 
-        inventory.append(item)
+    def on_quit(self):
+        """Spiel wird während des Kampfes beendet: Combat-Log trotzdem speichern"""
+        self._save_combat_log()
 
-        with open(inventory_path, "w", encoding="utf-8") as f:
-            json.dump(inventory, f, ensure_ascii=False, indent=4)
+    def _save_combat_log(self):
+        """Speichert das Combat-Log im Save-Slot (nicht beim Replay, nur einmal)"""
+        if self.combat_log is None or self.replay_of is not None or self.combat_log_saved:
+            return
+        self.combat_log_saved = True
+        log_dir = os.path.join(SAVE_ROOT, SAVE_SLOTS[self.slot_index], "combat_logs")
+        os.makedirs(log_dir, exist_ok=True)
+        filename = f"{time.strftime('%Y%m%d-%H%M%S')}_{self.level_key}.clog"
+        size = self.finish_combat_log().save(os.path.join(log_dir, filename))
+        print(f"📝 Combat-Log gespeichert: {filename} ({size} Bytes)")
+
+    def _add_items_to_inventory(self, items: List[Dict[str, Any]]):
+        """
+        Speichert Items im globalen Inventar des aktuellen Slots.
+        Nur angehängt (Journal), das Inventar wird dafür nicht gelesen.
+        """
+        save_dir = os.path.join(SAVE_ROOT, SAVE_SLOTS[self.slot_index])
+        os.makedirs(save_dir, exist_ok=True)
+        append_to_inventory(os.path.join(save_dir, "global_inventory.json"), items)
     
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         """
         Zeichnet die Battle Scene
         
         Args:
             screen: pygame Screen Surface
+            alpha: Interpolationsfaktor zwischen letztem und aktuellem Simulationsschritt
         """
-        # Hintergrund zeichnen
-        if self.background:
-            screen.blit(self.background, (0, 0))
-        else:
-            screen.fill((30, 50, 30))  # Fallback-Hintergrund
-        
-        # Titel
-        title_text = f"{self.level_type} {self.level_number}"
-        title = FONT.render(title_text, True, (255, 255, 255))
-        screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 20))
+        self._draw_static(screen)
         
         # Zeichne Gegner
         self._draw_enemies(screen)
         
         # Zeichne Tooltip wenn über einem Gegner gehover wird
-        if self.hovered_enemy is not None and 0 <= self.hovered_enemy < len(self.enemies):
-            self._draw_enemy_tooltip(screen, self.enemies[self.hovered_enemy], mouse_pos=pygame.mouse.get_pos())
+        hovered_slot = self.enemies.slot_of(self.hovered_enemy)
+        if hovered_slot >= 0:
+            self._draw_enemy_tooltip(screen, hovered_slot, mouse_pos=pygame.mouse.get_pos())
         
         # Zeichne Schadensanzeigen
-        self._draw_damage_texts(screen)
+        self.damage_numbers.draw(screen, alpha)
         
         # Zeichne Spieler-Stats
         if self.player_stats:
@@ -498,10 +692,74 @@ class BattleScene:
         for btn in self.buttons:
             btn.draw(screen)
         
+        # Niederlage anzeigen
+        if self.player_defeated:
+            defeat = render_text(FONT, "Du wurdest besiegt!", True, (255, 80, 80))
+            screen.blit(defeat, (WIDTH // 2 - defeat.get_width() // 2, HEIGHT // 2 - defeat.get_height() // 2))
+        
         # Dev-Overlay zeichnen, falls aktiv
         if self.show_dev_overlay:
             self._draw_dev_overlay(screen)
     
+    def _draw_static(self, screen):
+        """Hintergrund und Titel (im Dirty-Rect-Modus der statische Layer)"""
+        # Hintergrund zeichnen
+        if self.background:
+            screen.blit(self.background, (0, 0))
+        else:
+            screen.fill((30, 50, 30))  # Fallback-Hintergrund
+        
+        # Titel
+        title_text = f"{self.level_type} {self.level_number}"
+        title = render_text(FONT, title_text, True, (255, 255, 255))
+        screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 20))
+    
+    def draw_dirty(self, screen, alpha=1.0):
+        """
+        Wie draw(), zeichnet aber nur geänderte Bereiche neu (siehe ui.dirty_renderer)
+        
+        Returns:
+            Liste der geänderten Bildschirm-Rechtecke
+        """
+        elements = []
+        
+        self._sync_enemy_sprites()
+        for sprite in self._ordered_enemy_sprites():
+            elements.append(DirtyElement(
+                ("enemy", sprite.enemy_id), sprite.bounds, sprite.version, sprite.draw
+            ))
+        
+        hovered_slot = self.enemies.slot_of(self.hovered_enemy)
+        if hovered_slot >= 0:
+            tooltip_rect, tooltip_surface = self._enemy_tooltip_layout(hovered_slot, pygame.mouse.get_pos())
+            elements.append(DirtyElement(
+                "tooltip", tooltip_rect, (self.hovered_enemy, int(self.enemies.version[hovered_slot])),
+                lambda surface: self._blit_enemy_tooltip(surface, tooltip_rect, tooltip_surface),
+            ))
+        
+        elements.extend(self.damage_numbers.dirty_elements(alpha))
+        
+        if self.player_stats:
+            panel_rect = self._player_stats_surface().get_rect(topleft=(20, HEIGHT - 240))
+            elements.append(DirtyElement(
+                "player_stats", panel_rect, self.player_stats_version, self._draw_player_stats
+            ))
+        
+        elements.extend(button_element(btn) for btn in self.buttons)
+        
+        if self.player_defeated:
+            defeat = render_text(FONT, "Du wurdest besiegt!", True, (255, 80, 80))
+            defeat_rect = defeat.get_rect(center=(WIDTH // 2, HEIGHT // 2))
+            elements.append(DirtyElement(
+                "defeat", defeat_rect, None, lambda surface: surface.blit(defeat, defeat_rect)
+            ))
+        
+        if self.show_dev_overlay:
+            # Dev-Overlay (Zähler, Cache-Statistik, Buttons) wird immer komplett neu gezeichnet
+            elements.append(DirtyElement("dev_overlay", screen.get_rect(), object(), self._draw_dev_overlay))
+        
+        return self.renderer.render(screen, elements)
+    
     def _draw_enemies(self, screen):
         """
         Zeichnet die Gegner auf dem Bildschirm
@@ -509,155 +767,166 @@ class BattleScene:
         Args:
             screen: pygame Screen Surface
         """
-        for i, enemy in enumerate(self.enemies):
-            x = enemy.get("x", 100 + i * 100)
-            y = enemy.get("y", 200 + i * 50)
-            
-            # Zeichne Gegner als Rechteck (später kann dies durch Sprites ersetzt werden)
-            # Hover-Effekt: Heller wenn gehover
-            is_hovered = (i == self.hovered_enemy)
-            color = (255, 100, 100) if is_hovered else (200, 50, 50)  # Helleres Rot wenn gehover
-            border_color = (255, 255, 0) if is_hovered else (255, 255, 255)  # Gelber Rand wenn gehover
-            
-            # Größeres Rechteck für bessere Sichtbarkeit
-            enemy_rect = pygame.Rect(x - self.enemy_size // 2, y - self.enemy_size // 2, 
-                                   self.enemy_size, self.enemy_size)
-            pygame.draw.rect(screen, color, enemy_rect)
-            pygame.draw.rect(screen, border_color, enemy_rect, 3 if is_hovered else 2)
-            
-            # Zeichne Monster-Name mit Farbe je nach "Stufe"
-            monster_name = enemy.get("name", "Gegner")
-
-            # Anzahl der Verzauberungen
-            enchantments = enemy.get("enchantments", [])
-            enchant_count = len(enchantments)
-
-            # Optional: Unique-Info aus Daten
-            loot_quality = str(enemy.get("loot_quality", "")).lower()
-            is_unique = enemy.get("is_unique", False) or loot_quality == "unique"
-
-            # Farben definieren
-            WHITE       = (255, 255, 255)
-            BLUE        = (100, 149, 237)   # 1–2 Enchants
-            PURPLE      = (186, 85, 211)    # 3–4 Enchants
-            GOLD        = (255, 215, 0)     # 5–6 Enchants
-            DARK_ORANGE = (210, 120, 0)     # Unique
-
-            # Farbe nach Regel bestimmen
-            if is_unique:
-                name_color = DARK_ORANGE
-            elif enchant_count >= 5:
-                name_color = GOLD
-            elif enchant_count >= 3:
-                name_color = PURPLE
-            elif enchant_count >= 1:
-                name_color = BLUE
-            else:
-                name_color = WHITE
-
-            name_text = FONT_SMALL.render(monster_name, True, name_color)
-            screen.blit(name_text, (x - name_text.get_width() // 2, y - 40))
-            
-            # Zeichne HP-Balken (verwende finale Stats mit Verzauberungen)
-            final_stats = enemy.get("final_stats", enemy.get("generated_stats", {}))
-            hp = final_stats.get("hp", 0)
-            max_hp = final_stats.get("max_hp", hp)
-            
-            if max_hp > 0:
-                hp_bar_width = 60
-                hp_bar_height = 6
-                hp_percent = hp / max_hp
-                
-                # Hintergrund (schwarz)
-                bar_x = x - hp_bar_width // 2
-                bar_y = y + 30
-                pygame.draw.rect(screen, (0, 0, 0), 
-                               (bar_x, bar_y, hp_bar_width, hp_bar_height))
-                
-                # HP (grün zu rot basierend auf HP%)
-                hp_color = (
-                    int(255 * (1 - hp_percent)),
-                    int(255 * hp_percent),
-                    0
-                )
-                hp_width = int(hp_bar_width * hp_percent)
-                pygame.draw.rect(screen, hp_color,
-                               (bar_x, bar_y, hp_width, hp_bar_height))
-            
-            # Zeichne Verzauberungs-Anzahl wenn vorhanden
-            enchantments = enemy.get("enchantments", [])
-            if enchantments:
-                enchant_text = FONT_SMALL.render(
-                    f"{len(enchantments)} Verz.", True, (255, 215, 0)
-                )
-                screen.blit(enchant_text, (x - enchant_text.get_width() // 2, y + 40))
+        self._sync_enemy_sprites()
+        # Der Hintergrund wurde komplett neu gezeichnet: alle Sprites in einem Aufruf
+        screen.blits([item for sprite in self._ordered_enemy_sprites() for item in sprite.blits], doreturn=False)
+    
+    def _ordered_enemy_sprites(self) -> List[EnemySprite]:
+        """
+        Sprites aller lebenden Gegner nach Store-Slot (wie der Hit-Test:
+        höherer Slot liegt oben)
+        """
+        store = self.enemies
+        return [self.enemy_sprites[enemy_id] for enemy_id in store.ids[store.alive_slots()].tolist()]
     
-    def _draw_enemy_tooltip(self, screen: pygame.Surface, enemy: Dict, mouse_pos: tuple):
+    def _sync_enemy_sprites(self):
+        """
+        Gleicht die Sprites mit dem Store ab: legt Sprites neu gespawnter
+        Gegner an, aktualisiert HP-Balken geänderter Gegner (per Store-Version)
+        und die Hervorhebung von gehovertem Gegner und Angriffsziel
+        """
+        store = self.enemies
+        
+        for enemy_id in self.new_sprite_ids:
+            slot = store.slot_of(enemy_id)
+            sprite = EnemySprite(
+                enemy_id, store.records[slot], int(store.x[slot]), int(store.y[slot]),
+                int(store.hp[slot]), int(store.max_hp[slot]), int(store.enchant_count[slot]),
+                self.enemy_size,
+            )
+            sprite.set_highlight(enemy_id == self.hovered_enemy, enemy_id == self.target_enemy_id)
+            self.enemy_sprites[enemy_id] = sprite
+        self.new_sprite_ids.clear()
+        
+        # HP-Balken nur für Gegner, deren Zustand sich seit dem letzten Sync geändert hat
+        if len(self.drawn_versions) != store.capacity:
+            versions = np.zeros(store.capacity, dtype=np.uint32)
+            versions[:len(self.drawn_versions)] = self.drawn_versions
+            self.drawn_versions = versions
+        stale = np.nonzero(store.alive & (store.version != self.drawn_versions))[0]
+        for slot in stale.tolist():
+            sprite = self.enemy_sprites[int(store.ids[slot])]
+            sprite.set_hp(int(store.hp[slot]), int(store.max_hp[slot]))
+        self.drawn_versions[stale] = store.version[stale]
+        
+        highlighted = (self.hovered_enemy, self.target_enemy_id)
+        if highlighted != self.highlighted:
+            for enemy_id in set(self.highlighted + highlighted):
+                sprite = self.enemy_sprites.get(enemy_id)
+                if sprite is not None:
+                    sprite.set_highlight(enemy_id == self.hovered_enemy, enemy_id == self.target_enemy_id)
+            self.highlighted = highlighted
+    
+    def _draw_enemy_tooltip(self, screen: pygame.Surface, slot: int, mouse_pos: tuple):
         """
         Zeichnet ein Tooltip mit Stats und Verzauberungen des Gegners
         
         Args:
             screen: pygame Screen Surface
-            enemy: Gegner-Dictionary
+            slot: Store-Slot des Gegners
             mouse_pos: (x, y) Mausposition
         """
+        self._blit_enemy_tooltip(screen, *self._enemy_tooltip_layout(slot, mouse_pos))
+    
+    def _blit_enemy_tooltip(self, screen: pygame.Surface, tooltip_rect: pygame.Rect,
+                            tooltip_surface: pygame.Surface):
+        """Zeichnet ein fertig positioniertes Tooltip (siehe _enemy_tooltip_layout)"""
+        screen.blit(tooltip_surface, tooltip_rect.topleft)
+    
+    def _enemy_tooltip_layout(self, slot: int, mouse_pos: tuple):
+        """
+        Positioniert das (gecachte) Tooltip eines Gegners an der Maus
+        
+        Returns:
+            (Tooltip-Rechteck, Tooltip-Surface)
+        """
+        tooltip_surface = self._enemy_tooltip_surface(slot)
+        tooltip_width, tooltip_height = tooltip_surface.get_size()
         mouse_x, mouse_y = mouse_pos
         
+        # Positioniere Tooltip (rechts und unterhalb der Maus, aber nicht außerhalb des Bildschirms)
+        tooltip_x = mouse_x + 15
+        tooltip_y = mouse_y + 15
+        
+        # Prüfe ob Tooltip außerhalb des Bildschirms wäre
+        if tooltip_x + tooltip_width > WIDTH:
+            tooltip_x = mouse_x - tooltip_width - 15  # Links von der Maus
+        if tooltip_y + tooltip_height > HEIGHT:
+            tooltip_y = mouse_y - tooltip_height - 15  # Oberhalb der Maus
+        
+        return pygame.Rect(tooltip_x, tooltip_y, tooltip_width, tooltip_height), tooltip_surface
+    
+    def _enemy_tooltip_surface(self, slot: int) -> pygame.Surface:
+        """Tooltip-Surface eines Gegners, neu gerendert nur wenn sich sein Zustand geändert hat"""
+        enemy_id = int(self.enemies.ids[slot])
+        version = int(self.enemies.version[slot])
+        cached = self.tooltip_cache.get(enemy_id)
+        if cached is None or cached[0] != version:
+            cached = (version, self._render_enemy_tooltip(slot))
+            self.tooltip_cache[enemy_id] = cached
+        return cached[1]
+    
+    def _render_enemy_tooltip(self, slot: int) -> pygame.Surface:
+        """
+        Rendert das Tooltip eines Gegners (Stats und Verzauberungen) in eine Surface
+        
+        Args:
+            slot: Store-Slot des Gegners
+        """
+        store = self.enemies
+        record = store.records[slot]
+        
         # Sammle alle Tooltip-Informationen
         lines = []
         
         # Name
-        monster_name = enemy.get("name", "Unbekannter Gegner")
-        monster_level = enemy.get("level", 1)
-        lines.append(f"{monster_name} (Level {monster_level})")
+        lines.append(f"{record.name} (Level {record.level})")
         lines.append("")  # Leerzeile
         
-        # Stats (mit Verzauberungen berechnet)
-        final_stats = enemy.get("final_stats", enemy.get("generated_stats", {}))
-        enchantment_bonuses = enemy.get("enchantment_bonuses", {})
+        # Stats (mit Verzauberungen berechnet, aktuelle Werte aus dem Store)
+        enchantment_bonuses = record.bonuses
         
-        if final_stats:
-            lines.append("Stats:")
-            
-            # HP mit Verzauberungsbonus
-            hp = final_stats.get("hp", 0)
-            max_hp = final_stats.get("max_hp", hp)
-            hp_bonus = enchantment_bonuses.get("hp", 0)
-            if hp_bonus > 0:
-                lines.append(f"  HP: {hp}/{max_hp} ({hp_bonus:+d} von Verzauberung)")
-            else:
-                lines.append(f"  HP: {hp}/{max_hp}")
-            
-            # Schaden mit Verzauberungsbonus
-            damage = final_stats.get("damage", 0)
-            damage_bonus = enchantment_bonuses.get("damage", 0)
-            if damage_bonus > 0:
-                lines.append(f"  Schaden: {damage} ({damage_bonus:+d} von Verzauberung)")
-            else:
-                lines.append(f"  Schaden: {damage}")
-            
-            # Verteidigung mit Verzauberungsbonus
-            defense = final_stats.get("defense", 0)
-            defense_bonus = enchantment_bonuses.get("defense", 0)
-            if defense_bonus > 0:
-                lines.append(f"  Verteidigung: {defense} ({defense_bonus:+d} von Verzauberung)")
-            else:
-                lines.append(f"  Verteidigung: {defense}")
-            
-            # Angriffsgeschwindigkeit mit Verzauberungsbonus
-            attack_speed = final_stats.get("attack_speed", 1.0)
-            attack_speed_bonus = enchantment_bonuses.get("attack_speed", 0.0)
-            if attack_speed_bonus > 0:
-                lines.append(f"  Angriffsgeschw.: {attack_speed:.1f} ({attack_speed_bonus:+.2f} von Verzauberung)")
-            else:
-                lines.append(f"  Angriffsgeschw.: {attack_speed:.1f}")
-            
-            # Ausweichen
-            evasion = final_stats.get("evasion", 0)
-            lines.append(f"  Ausweichen: {evasion}")
+        lines.append("Stats:")
+        
+        # HP mit Verzauberungsbonus
+        hp = int(store.hp[slot])
+        max_hp = int(store.max_hp[slot])
+        hp_bonus = enchantment_bonuses.get("hp", 0)
+        if hp_bonus > 0:
+            lines.append(f"  HP: {hp}/{max_hp} ({hp_bonus:+d} von Verzauberung)")
+        else:
+            lines.append(f"  HP: {hp}/{max_hp}")
+        
+        # Schaden mit Verzauberungsbonus
+        damage = int(store.damage[slot])
+        damage_bonus = enchantment_bonuses.get("damage", 0)
+        if damage_bonus > 0:
+            lines.append(f"  Schaden: {damage} ({damage_bonus:+d} von Verzauberung)")
+        else:
+            lines.append(f"  Schaden: {damage}")
+        
+        # Verteidigung mit Verzauberungsbonus
+        defense = int(store.defense[slot])
+        defense_bonus = enchantment_bonuses.get("defense", 0)
+        if defense_bonus > 0:
+            lines.append(f"  Verteidigung: {defense} ({defense_bonus:+d} von Verzauberung)")
+        else:
+            lines.append(f"  Verteidigung: {defense}")
+        
+        # Angriffsgeschwindigkeit mit Verzauberungsbonus
+        attack_speed = float(store.attack_speed[slot])
+        attack_speed_bonus = enchantment_bonuses.get("attack_speed", 0.0)
+        if attack_speed_bonus > 0:
+            lines.append(f"  Angriffsgeschw.: {attack_speed:.1f} ({attack_speed_bonus:+.2f} von Verzauberung)")
+        else:
+            lines.append(f"  Angriffsgeschw.: {attack_speed:.1f}")
+        
+        # Ausweichen
+        evasion = int(store.evasion[slot])
+        lines.append(f"  Ausweichen: {evasion}")
         
         # Verzauberungen
-        enchantments = enemy.get("enchantments", [])
+        enchantments = record.enchantments
         if enchantments:
             lines.append("")  # Leerzeile
             lines.append(f"Verzauberungen ({len(enchantments)}):")
@@ -685,7 +954,7 @@ class BattleScene:
         
         for line in lines:
             if line:  # Nicht-leere Zeile
-                surf = FONT_SMALL.render(line, True, (255, 255, 255))
+                surf = render_text(FONT_SMALL, line, True, (255, 255, 255))
                 line_surfaces.append((surf, line))
                 max_width = max(max_width, surf.get_width())
             else:  # Leerzeile
@@ -693,39 +962,26 @@ class BattleScene:
         
         tooltip_width = max_width + padding * 2
         tooltip_height = len(lines) * line_height + padding * 2
-        
-        # Positioniere Tooltip (rechts und unterhalb der Maus, aber nicht außerhalb des Bildschirms)
-        tooltip_x = mouse_x + 15
-        tooltip_y = mouse_y + 15
-        
-        # Prüfe ob Tooltip außerhalb des Bildschirms wäre
-        if tooltip_x + tooltip_width > WIDTH:
-            tooltip_x = mouse_x - tooltip_width - 15  # Links von der Maus
-        if tooltip_y + tooltip_height > HEIGHT:
-            tooltip_y = mouse_y - tooltip_height - 15  # Oberhalb der Maus
-        
-        # Zeichne Tooltip-Hintergrund
-        tooltip_rect = pygame.Rect(tooltip_x, tooltip_y, tooltip_width, tooltip_height)
+        tooltip_rect = pygame.Rect(0, 0, tooltip_width, tooltip_height)
         
         # Dunkler Hintergrund mit Transparenz-Effekt
-        tooltip_surface = pygame.Surface((tooltip_width, tooltip_height))
-        tooltip_surface.set_alpha(240)
-        tooltip_surface.fill((20, 20, 30))
-        screen.blit(tooltip_surface, (tooltip_x, tooltip_y))
+        tooltip_surface = pygame.Surface(tooltip_rect.size, pygame.SRCALPHA)
+        tooltip_surface.fill((20, 20, 30, 240))
         
         # Rand
-        pygame.draw.rect(screen, (100, 150, 255), tooltip_rect, 2)
+        pygame.draw.rect(tooltip_surface, (100, 150, 255), tooltip_rect, 2)
         
         # Zeichne Text
-        current_y = tooltip_y + padding
+        current_y = padding
         for surf, line in line_surfaces:
             if surf:
-                screen.blit(surf, (tooltip_x + padding, current_y))
+                tooltip_surface.blit(surf, (padding, current_y))
             current_y += line_height
+        return tooltip_surface
     
     def _draw_player_stats(self, screen: pygame.Surface):
         """
-        Zeichnet Spieler-Stats auf dem Bildschirm
+        Zeichnet Spieler-Stats auf dem Bildschirm (Panel links unten)
         
         Args:
             screen: pygame Screen Surface
@@ -733,36 +989,47 @@ class BattleScene:
         if not self.player_stats:
             return
         
+        screen.blit(self._player_stats_surface(), (20, HEIGHT - 240))
+    
+    def _player_stats_surface(self) -> pygame.Surface:
+        """Stats-Panel, neu gerendert nur wenn sich player_stats_version geändert hat"""
+        if self.stats_panel_cache is None or self.stats_panel_cache[0] != self.player_stats_version:
+            self.stats_panel_cache = (self.player_stats_version, self._render_player_stats())
+        return self.stats_panel_cache[1]
+    
+    def _render_player_stats(self) -> pygame.Surface:
+        """Rendert das Stats-Panel in eine eigene Surface"""
         stats = self.player_stats.get("stats", {})
         player_name = self.player_stats.get("name", "Unbekannt")
         class_name = self.player_stats.get("class_name", "Unbekannt")
         level = self.player_stats.get("level", 1)
         
-        # Position des Stats-Panels (links unten)
-        panel_x = 20
-        panel_y = HEIGHT - 240
+        # Koordinaten relativ zum Panel
+        panel_x = 0
+        panel_y = 0
         panel_width = 280
         panel_height = 220
         padding = 10
         
+        # Titel (darf über das Panel hinausragen)
+        title_text = f"{player_name} ({class_name})"
+        title_surf = render_text(FONT, title_text, True, (255, 255, 255))
+        panel = pygame.Surface(
+            (max(panel_width, padding + title_surf.get_width()), panel_height), pygame.SRCALPHA
+        )
+        
         # Zeichne Panel-Hintergrund
         panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        panel_surface = pygame.Surface((panel_width, panel_height))
-        panel_surface.set_alpha(220)
-        panel_surface.fill((20, 20, 40))
-        screen.blit(panel_surface, (panel_x, panel_y))
+        panel.fill((20, 20, 40, 220), panel_rect)
         
         # Rand
-        pygame.draw.rect(screen, (100, 150, 255), panel_rect, 2)
+        pygame.draw.rect(panel, (100, 150, 255), panel_rect, 2)
         
-        # Titel
-        title_text = f"{player_name} ({class_name})"
-        title_surf = FONT.render(title_text, True, (255, 255, 255))
-        screen.blit(title_surf, (panel_x + padding, panel_y + padding))
+        panel.blit(title_surf, (panel_x + padding, panel_y + padding))
         
         level_text = f"Level {level}"
-        level_surf = FONT_SMALL.render(level_text, True, (200, 200, 255))
-        screen.blit(level_surf, (panel_x + padding, panel_y + padding + 25))
+        level_surf = render_text(FONT_SMALL, level_text, True, (200, 200, 255))
+        panel.blit(level_surf, (panel_x + padding, panel_y + padding + 25))
         
         # Stats
         current_y = panel_y + padding + 50
@@ -770,7 +1037,7 @@ class BattleScene:
         
         # Grundwerte
         stat_lines = [
-            ("HP", stats.get("health", 0), stats.get("max_health", 0), True),
+            ("HP", self.player_hp, stats.get("max_health", 0), True),
             ("Stärke", stats.get("strength", 0), None, False),
             ("Intelligenz", stats.get("intelligence", 0), None, False),
             ("Geschick", stats.get("dexterity", 0), None, False),
@@ -783,8 +1050,8 @@ class BattleScene:
             else:
                 text = f"{label}: {value}"
             
-            stat_surf = FONT_SMALL.render(text, True, (255, 255, 255))
-            screen.blit(stat_surf, (panel_x + padding, current_y))
+            stat_surf = render_text(FONT_SMALL, text, True, (255, 255, 255))
+            panel.blit(stat_surf, (panel_x + padding, current_y))
             current_y += line_height
         
         # Kampf-Stats
@@ -800,38 +1067,36 @@ class BattleScene:
         for label, value in combat_stats:
             if value > 0:  # Nur anzeigen wenn > 0
                 text = f"{label}: {value}"
-                stat_surf = FONT_SMALL.render(text, True, (200, 255, 200))
-                screen.blit(stat_surf, (panel_x + padding, current_y))
+                stat_surf = render_text(FONT_SMALL, text, True, (200, 255, 200))
+                panel.blit(stat_surf, (panel_x + padding, current_y))
                 current_y += line_height
         
         # Attack Speed
         attack_speed = stats.get("attack_speed", 1.0)
         if attack_speed != 1.0:
             text = f"Angriffsgeschw.: {attack_speed:.2f}"
-            stat_surf = FONT_SMALL.render(text, True, (200, 255, 200))
-            screen.blit(stat_surf, (panel_x + padding, current_y))
+            stat_surf = render_text(FONT_SMALL, text, True, (200, 255, 200))
+            panel.blit(stat_surf, (panel_x + padding, current_y))
+        return panel
     
-    def _draw_damage_texts(self, screen: pygame.Surface):
+    def _cache_stats_surface(self) -> pygame.Surface:
         """
-        Zeichnet Schadensanzeigen über Gegnern
-        
-        Args:
-            screen: pygame Screen Surface
+        Zeile mit der Text-Cache-Statistik, höchstens alle
+        CACHE_STATS_INTERVAL Sekunden neu gerendert
+
+        Bewusst ohne render_text: die Zahlen ändern sich ständig, jede
+        Version wäre ein Cache-Eintrag, der nie wieder gebraucht wird und
+        die gezeigte Statistik selbst verfälscht.
         """
-        for dmg in self.damage_texts:
-            if dmg["timer"] > 0:
-                # Berechne Alpha (Transparenz) basierend auf verbleibender Zeit
-                alpha = int(255 * min(1.0, dmg["timer"] / 1.5))
-                
-                # Erstelle Schadens-Text
-                damage_text = f"-{dmg['damage']}"
-                damage_surf = FONT_SMALL.render(damage_text, True, (255, 100, 100))
-                damage_surf.set_alpha(alpha)
-                
-                # Zeichne Text
-                text_x = dmg["x"] - damage_surf.get_width() // 2
-                text_y = int(dmg["y"])
-                screen.blit(damage_surf, (text_x, text_y))
+        now = time.perf_counter()
+        if self.cache_stats_line is None or now - self.cache_stats_line[0] >= CACHE_STATS_INTERVAL:
+            cache = TEXT_CACHE.stats()
+            text = (
+                f"Text-Cache: {cache['hits']} Treffer / {cache['misses']} Fehlzugriffe, "
+                f"{cache['bytes'] // 1024} KB"
+            )
+            self.cache_stats_line = (now, FONT.render(text, True, (230, 230, 230)))
+        return self.cache_stats_line[1]
 
     def _draw_dev_overlay(self, screen):
         import pygame as pg
@@ -849,7 +1114,7 @@ class BattleScene:
 
         pg.draw.rect(screen, (150, 180, 255), (panel_x, panel_y, panel_width, panel_height), 3)
 
-        title = FONT.render(f"Dev Level-Settings: {self.level_key}", True, (255, 255, 255))
+        title = render_text(FONT, f"Dev Level-Settings: {self.level_key}", True, (255, 255, 255))
         screen.blit(title, (panel_x + 20, panel_y + 20))
 
         s = self.level_config
@@ -859,12 +1124,22 @@ class BattleScene:
             f"Monster-Levelbereich: {s.get('monster_level_min', 1)} - {s.get('monster_level_max', 10)}",
         ]
 
+        if self.unplaced_enemy_count:
+            lines.append(f"Nicht platzierbar: {self.unplaced_enemy_count} (Feld zu voll)")
+        if self.spawner is not None and self.spawner.wave_count > 1:
+            lines.append(
+                f"Welle {self.spawner.spawned_waves}/{self.spawner.wave_count} "
+                f"({self.spawner.spawned}/{self.spawner.total} Gegner, max. {self.spawner.max_active} aktiv)"
+            )
+
         y = panel_y + 80
         for line in lines:
-            txt = FONT.render(line, True, (230, 230, 230))
+            txt = render_text(FONT, line, True, (230, 230, 230))
             screen.blit(txt, (panel_x + 20, y))
             y += 40
 
+        screen.blit(self._cache_stats_surface(), (panel_x + 20, y))
+
         # Dev-Buttons zeichnen
         for btn in self.dev_buttons:
             btn.draw(screen)
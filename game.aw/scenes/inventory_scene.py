@@ -3,8 +3,15 @@ import os
 import pygame
 
 from core.constants import SAVE_ROOT, SAVE_SLOTS, WIDTH, HEIGHT
+from core.inventory_cache import INVENTORIES
+from core.inventory_index import InventoryIndex, InventoryQuery
+from core.item_store import ItemStore
+from core.scene_manager import Pop
 from ui.button import Button
-from ui.fonts import FONT, FONT_SMALL, FONT_BIG
+from ui.fonts import FONT, FONT_SMALL, FONT_BIG, render_text
+from ui.text_input import TextInput
+from ui.virtual_list import VirtualList
+from ui.widget import UIRoot
 
 
 # Zuordnung von Item-Typen zu Equipment-Slots
@@ -21,6 +28,17 @@ SLOT_MAP = {
 }
 
 
+INVENTORY_ROW_HEIGHT = 30
+
+# (Feld für InventoryIndex.query, Button-Text), absteigend sortiert
+SORT_OPTIONS = [
+    (None, "Reihenfolge"),
+    ("level", "Level"),
+    ("damage", "Schaden"),
+    ("armour", "Rüstung"),
+]
+
+
 class InventoryScene:
     """
     Einfache Inventar-Ansicht.
@@ -33,13 +51,16 @@ class InventoryScene:
         self.player_name = "Unbekannt"
         self.player_level = 1
         self.equipped_items = {}
-        self.inventory_items = []
+        self.inventory = ItemStore()
+        self.inventory_index = InventoryIndex()
+        self.inventory_results = self.inventory_index.query()
+        self.query = InventoryQuery()
+        self.sort_option = 0
         self.error_message = ""
         self.info_message = ""
-        self.selected_inventory_index = None
         self.selected_equipped_slot = None
+        self.selected_item_uid = None
         self._equipped_hitboxes = []
-        self._inventory_hitboxes = []
 
         self.player_path = None
         self.inventory_path = None
@@ -47,6 +68,13 @@ class InventoryScene:
 
         self._load_data()
         self._create_buttons()
+        self._create_inventory_list()
+        self._run_query(reset=True)
+
+        # Tasten ohne Fokus (Pfeile, Bild auf/ab, ...) steuern die Liste
+        self.ui = UIRoot()
+        self.ui.add(*self.buttons, self.query_input, self.sort_button, self.inventory_list)
+        self.ui.key_target = self.inventory_list
 
     # ------------------------------------------------------------------ #
     # Daten laden
@@ -74,14 +102,13 @@ class InventoryScene:
         self.player_level = player_data.get("level", player_data.get("stats", {}).get("level", 1))
         self.equipped_items = player_data.get("equipped", {})
 
-        # Inventar laden
+        # Inventar laden: beim ersten Mal Schnappschuss + Journal, danach
+        # nur neue Journal-Zeilen (Index wird nachgezogen, nicht neu gebaut)
         try:
-            with open(self.inventory_path, "r", encoding="utf-8") as f:
-                self.inventory_items = json.load(f)
-        except FileNotFoundError:
-            self.inventory_items = []
+            self.inventory, self.inventory_index = INVENTORIES.open(self.inventory_path)
         except json.JSONDecodeError:
-            self.inventory_items = []
+            self.inventory = ItemStore(path=self.inventory_path)
+            self.inventory_index = InventoryIndex()
             self.error_message = "Inventardatei ist beschädigt."
 
     # ------------------------------------------------------------------ #
@@ -97,49 +124,106 @@ class InventoryScene:
             Button("Zurück", right, base_y + (h + 10) * 3, w, h, self._back_to_town),
         ]
 
+    def _create_inventory_list(self):
+        # Rechts neben der Ausrüstung, bis kurz vor die Buttons:
+        # Suchzeile mit Sortier-Button, darunter die Liste
+        x = WIDTH // 2 - 10
+        y = 246
+        right = self.buttons[0].rect.left - 30
+        sort_w, bar_h = 200, 36
+
+        self.query_input = TextInput(
+            x, y, right - x - sort_w - 10, bar_h, self._on_query_change,
+            placeholder="Suche: Name  typ:weapon  level:10-20  ench:<id>",
+        )
+        self.sort_button = Button(SORT_OPTIONS[self.sort_option][1], right - sort_w, y,
+                                  sort_w, bar_h, self._cycle_sort)
+
+        list_y = y + bar_h + 10
+        self.inventory_list = VirtualList(
+            (x, list_y, right - x, HEIGHT - 60 - list_y),
+            INVENTORY_ROW_HEIGHT,
+            self._render_inventory_row,
+            on_select=self._on_inventory_select,
+        )
+
+    # ------------------------------------------------------------------ #
+    # Suche / Sortierung
+    # ------------------------------------------------------------------ #
+    def _run_query(self, reset: bool = False):
+        """
+        Fragt den Index neu ab; reset=False behält die Scroll-Position.
+        Die Auswahl hängt an der uid und bleibt erhalten, solange das Item
+        noch angezeigt wird (sonst würde ein unsichtbares Item angelegt).
+        """
+        sort = SORT_OPTIONS[self.sort_option][0]
+        self.inventory_results = self.inventory_index.query(self.query, sort=sort)
+        self.inventory_list.set_items(self.inventory_results, reset=reset)
+
+        handle = self.inventory_index.handle_of(self.selected_item_uid)
+        position = None if handle is None else self.inventory_results.index(handle)
+        if position is None:
+            self.selected_item_uid = None
+        self.inventory_list.selected = position
+
+    def _on_query_change(self, text: str):
+        self.query = InventoryQuery.parse(text)
+        self._run_query(reset=True)
+
+    def _cycle_sort(self):
+        self.sort_option = (self.sort_option + 1) % len(SORT_OPTIONS)
+        self.sort_button.text = SORT_OPTIONS[self.sort_option][1]
+        self._run_query(reset=True)
+
     # ------------------------------------------------------------------ #
     def _reload_data(self):
         self.selected_equipped_slot = None
-        self.selected_inventory_index = None
+        self.selected_item_uid = None
         self.info_message = ""
         self._load_data()
+        self._run_query(reset=True)
 
     def _back_to_town(self):
         from scenes.town_scene import TownScene
 
-        return TownScene(self.slot_index)
+        return Pop(lambda: TownScene(self.slot_index))
 
     # ------------------------------------------------------------------ #
     # Update / Draw
     # ------------------------------------------------------------------ #
-    def update(self, events):
+    def update(self, events, dt):
         for e in events:
-            if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
+            result = self.ui.handle_event(e)
+            if result:
+                return result
+            # Ausrüstungs-Zeilen sind keine Widgets
+            if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1 and self.ui.widget_at(e.pos) is None:
                 self._handle_click(e.pos)
 
-            for btn in self.buttons:
-                result = btn.handle_event(e)
-                if result:
-                    return result
+        self.inventory_list.update(dt)
 
-    def draw(self, screen):
+    def is_animating(self):
+        # Nur das weiche Scrollen der Liste läuft ohne Eingabe weiter
+        return self.inventory_list.is_scrolling
+
+    def draw(self, screen, alpha=1.0):
         screen.fill((22, 24, 32))
 
-        title = FONT_BIG.render("Inventar", True, (255, 255, 255))
-        subtitle = FONT.render(
-            f"{self.player_name}  |  Level {self.player_level}", True, (200, 200, 200)
+        title = render_text(FONT_BIG, "Inventar", True, (255, 255, 255))
+        subtitle = render_text(
+            FONT, f"{self.player_name}  |  Level {self.player_level}", True, (200, 200, 200)
         )
         screen.blit(title, (40, 40))
         screen.blit(subtitle, (40, 120))
 
         y_error_start = 180
         if self.error_message:
-            err = FONT.render(self.error_message, True, (255, 80, 80))
+            err = render_text(FONT, self.error_message, True, (255, 80, 80))
             screen.blit(err, (40, y_error_start))
             y_error_start += 50
 
         if self.info_message:
-            info = FONT_SMALL.render(self.info_message, True, (160, 220, 160))
+            info = render_text(FONT_SMALL, self.info_message, True, (160, 220, 160))
             screen.blit(info, (40, HEIGHT - 100))
 
         self._draw_equipped(screen, start_x=40, start_y=200)
@@ -150,12 +234,12 @@ class InventoryScene:
 
     # ------------------------------------------------------------------ #
     def _draw_equipped(self, screen, start_x: int, start_y: int):
-        header = FONT.render("Ausgerüstet", True, (255, 255, 255))
+        header = render_text(FONT, "Ausgerüstet", True, (255, 255, 255))
         screen.blit(header, (start_x, start_y))
 
         y = start_y + 50
         if not self.equipped_items:
-            txt = FONT_SMALL.render("Keine Ausrüstung gefunden.", True, (200, 200, 200))
+            txt = render_text(FONT_SMALL, "Keine Ausrüstung gefunden.", True, (200, 200, 200))
             screen.blit(txt, (start_x, y))
             return
 
@@ -169,43 +253,39 @@ class InventoryScene:
             if slot == self.selected_equipped_slot:
                 pygame.draw.rect(screen, (60, 70, 110), row_rect, border_radius=6)
 
-            slot_txt = FONT.render(f"{slot.capitalize()}:", True, (180, 200, 255))
+            slot_txt = render_text(FONT, f"{slot.capitalize()}:", True, (180, 200, 255))
             screen.blit(slot_txt, (start_x, y))
 
-            item_txt = FONT_SMALL.render(label, True, (220, 220, 220))
+            item_txt = render_text(FONT_SMALL, label, True, (220, 220, 220))
             screen.blit(item_txt, (start_x + 220, y + 6))
 
             self._equipped_hitboxes.append((slot, row_rect))
             y += 40
 
     def _draw_inventory(self, screen, start_x: int, start_y: int):
-        header = FONT.render("Inventar", True, (255, 255, 255))
+        total = len(self.inventory_index)
+        if self.query.is_empty():
+            count = f"{total}"
+        else:
+            count = f"{len(self.inventory_results)} von {total}"
+        header = render_text(FONT, f"Inventar ({count})", True, (255, 255, 255))
         screen.blit(header, (start_x, start_y))
 
-        y = start_y + 50
-        if not self.inventory_items:
-            txt = FONT_SMALL.render("Inventar ist leer.", True, (200, 200, 200))
-            screen.blit(txt, (start_x, y))
-            return
-
-        self._inventory_hitboxes = []
-        max_visible = 20
-        for idx, item in enumerate(self.inventory_items[:max_visible]):
-            label = self._format_item_line(item)
-            row_rect = pygame.Rect(start_x - 10, y - 4, (WIDTH // 2) - 80, 30)
-
-            if idx == self.selected_inventory_index:
-                pygame.draw.rect(screen, (50, 90, 70), row_rect, border_radius=4)
+        self.query_input.draw(screen)
+        self.sort_button.draw(screen)
 
-            bullet = FONT_SMALL.render(f"- {label}", True, (220, 220, 220))
-            screen.blit(bullet, (start_x, y))
+        if not self.inventory_results:
+            text = "Inventar ist leer." if not total else "Keine Treffer."
+            txt = render_text(FONT_SMALL, text, True, (200, 200, 200))
+            screen.blit(txt, (start_x, self.inventory_list.rect.y + 4))
+            return
 
-            self._inventory_hitboxes.append((idx, row_rect))
-            y += 30
+        self.inventory_list.draw(screen)
 
-        if len(self.inventory_items) > max_visible:
-            more = FONT_SMALL.render(f"... (+{len(self.inventory_items) - max_visible} weitere)", True, (180, 180, 180))
-            screen.blit(more, (start_x, y))
+    def _render_inventory_row(self, item):
+        # Direkt gerendert statt über den Text-Cache: die Liste cacht ihre
+        # Zeilen selbst, und tausende Einmal-Texte würden den Cache fluten
+        return FONT_SMALL.render(f"- {self._format_item_line(item)}", True, (220, 220, 220))
 
     # ------------------------------------------------------------------ #
     @staticmethod
@@ -226,39 +306,41 @@ class InventoryScene:
                 self.info_message = f"Slot '{slot}' ausgewählt."
                 return
 
-        for idx, rect in self._inventory_hitboxes:
-            if rect.collidepoint(pos):
-                if idx < len(self.inventory_items):
-                    self.selected_inventory_index = idx
-                    name = self.inventory_items[idx].get("name") or self.inventory_items[idx].get("id", "Item")
-                    self.info_message = f"Inventar-Item '{name}' ausgewählt."
-                return
+    def _on_inventory_select(self, index: int):
+        item = self.inventory_results[index]
+        self.selected_item_uid = item["uid"]
+        name = item.get("name") or item.get("id", "Item")
+        self.info_message = f"Inventar-Item '{name}' ausgewählt."
 
     def _equip_selected_inventory(self):
-        if self.selected_inventory_index is None:
+        if self.selected_item_uid is None:
             self.info_message = "Kein Inventar-Item ausgewählt."
             return
 
-        if self.selected_inventory_index >= len(self.inventory_items):
+        item = self.inventory.get(self.selected_item_uid)
+        if item is None:
             self.info_message = "Auswahl ist ungültig."
-            self.selected_inventory_index = None
+            self.selected_item_uid = None
+            self.inventory_list.select(None)
             return
 
-        item = self.inventory_items[self.selected_inventory_index]
         target_slot = self._resolve_slot(item.get("item_type"))
         if not target_slot:
             self.info_message = "Für diesen Item-Typ existiert kein Slot."
             return
 
-        # Entferne Item aus Inventar
-        item = self.inventory_items.pop(self.selected_inventory_index)
         prev_item = self.equipped_items.get(target_slot)
         self.equipped_items[target_slot] = item
+        # Spieler zuerst speichern: bricht danach etwas ab, ist das Item
+        # höchstens doppelt vorhanden statt verloren
+        self._persist_player()
+
+        self._remove_from_inventory(item["uid"])
         if prev_item:
-            self.inventory_items.append(prev_item)
+            self._add_to_inventory(prev_item)
 
-        self.selected_inventory_index = None
-        self._persist_changes()
+        self.selected_item_uid = None
+        self._run_query()
         name = item.get("name") or item.get("id", "Item")
         self.info_message = f"{name} wurde ausgerüstet."
 
@@ -272,21 +354,31 @@ class InventoryScene:
             self.info_message = "Dieser Slot ist leer."
             return
 
-        self.inventory_items.append(item)
         self.equipped_items[self.selected_equipped_slot] = None
-        self._persist_changes()
+        self._add_to_inventory(item)
+        self._persist_player()
+        self._run_query()
         self.info_message = f"{item.get('name', item.get('id', 'Item'))} abgelegt."
 
-    def _persist_changes(self):
+    # ------------------------------------------------------------------ #
+    # Inventar ändern: Store (mit Journal) und Index, beides O(1)
+    # ------------------------------------------------------------------ #
+    def _add_to_inventory(self, item):
+        self.inventory.add(item)
+        self.inventory_index.add(item)
+
+    def _remove_from_inventory(self, uid: str):
+        self.inventory.remove(uid)
+        handle = self.inventory_index.handle_of(uid)
+        if handle is not None:
+            self.inventory_index.remove(handle)
+
+    def _persist_player(self):
         if self._player_data is not None and self.player_path:
             self._player_data["equipped"] = self.equipped_items
             with open(self.player_path, "w", encoding="utf-8") as f:
                 json.dump(self._player_data, f, ensure_ascii=False, indent=4)
 
-        if self.inventory_path:
-            with open(self.inventory_path, "w", encoding="utf-8") as f:
-                json.dump(self.inventory_items, f, ensure_ascii=False, indent=4)
-
     @staticmethod
     def _resolve_slot(item_type: str):
         if not item_type:
@@ -1,14 +1,44 @@
-import pygame
+import json
+
 from ui.button import Button
-from ui.fonts import FONT
-from core.constants import WIDTH, HEIGHT
+from ui.fonts import FONT, render_text
+from ui.dirty_renderer import DirtyRenderer, button_element
+from ui.widget import UIRoot
+from core.scene_manager import Pop, Push
+from core.constants import WIDTH
+from core.background_builder import BackgroundBuilder
+from core.dev_settings import dev_settings_version
+from core.level_data import DEFAULT_LEVEL_SETTINGS, load_all_level_settings
+
+
+# So lange muss ein Level-Button gehovert sein, bevor sein Kampf vorab gebaut wird
+PREFETCH_HOVER_DELAY = 0.15
 
 
 class LevelSelectionScene:
-    def __init__(self, slot_index):
+    def __init__(self, slot_index, last_played=None):
+        """
+        Args:
+            slot_index: Speicher-Slot Index
+            last_played: (level_type, level_number) des zuletzt gespielten Levels
+        """
         self.slot_index = slot_index
         self.buttons = []
+        self.level_buttons = []  # (Button, level_type, level_number)
         self.create_buttons()
+        self.ui = UIRoot()
+        self.ui.add(*self.buttons)
+        self.renderer = DirtyRenderer(self._draw_static)
+
+        # Kampf für das gehoverte bzw. zuletzt gespielte Level im Hintergrund vorbereiten
+        self.battle_builder = BackgroundBuilder(self._build_battle, name="battle-prefetch")
+        self.last_played = last_played
+        self.prefetch_target = last_played
+        self.hover_target = None
+        self.hover_time = 0.0
+        self.dev_version = dev_settings_version()
+        if last_played:
+            self.battle_builder.request(self._battle_key(*last_played))
 
     # --------------------------------------------------------
     # Buttons erzeugen
@@ -25,31 +55,31 @@ class LevelSelectionScene:
         for i in range(1, 6):
             x = center_x - w - 40
             y = start_y + gap * (i - 1)
-            self.buttons.append(
-                Button(
-                    f"Feld {i}",
-                    x,
-                    y,
-                    w,
-                    h,
-                    lambda level=i: self.start_battle("Feld", level)
-                )
+            btn = Button(
+                f"Feld {i}",
+                x,
+                y,
+                w,
+                h,
+                lambda level=i: self.start_battle("Feld", level)
             )
+            self.buttons.append(btn)
+            self.level_buttons.append((btn, "Feld", i))
 
         # Cave 1–5 (rechte Spalte)
         for i in range(1, 6):
             x = center_x + 40
             y = start_y + gap * (i - 1)
-            self.buttons.append(
-                Button(
-                    f"Cave {i}",
-                    x,
-                    y,
-                    w,
-                    h,
-                    lambda level=i: self.start_battle("Cave", level)
-                )
+            btn = Button(
+                f"Cave {i}",
+                x,
+                y,
+                w,
+                h,
+                lambda level=i: self.start_battle("Cave", level)
             )
+            self.buttons.append(btn)
+            self.level_buttons.append((btn, "Cave", i))
 
         # Zurück-Button unten
         back_w, back_h = 180, 50
@@ -66,42 +96,133 @@ class LevelSelectionScene:
             )
         )
 
+    # --------------------------------------------------------
+    # Kampf im Hintergrund vorbereiten
+    # --------------------------------------------------------
+    def _battle_key(self, level_type, level_number):
+        """
+        Key eines vorab gebauten Kampfes
+
+        Enthält Dev-Settings-Version und Level-Settings, damit ein Kampf mit
+        veralteten Einstellungen nie übergeben wird.
+        """
+        level_key = f"{level_type}_{level_number}"
+        level_config = load_all_level_settings().get(level_key, DEFAULT_LEVEL_SETTINGS)
+        return (
+            self.slot_index,
+            level_type,
+            level_number,
+            dev_settings_version(),
+            json.dumps(level_config, sort_keys=True),
+        )
+
+    def _build_battle(self, key):
+        # Läuft im Worker-Thread; BattleScene erzeugt im Konstruktor nichts,
+        # was den Display braucht, und zieht Zufall nur aus ihrem eigenen RNG.
+        # Die Level-Settings kommen aus dem Key, damit der Thread
+        # level_data.json nie schreibt (load_level_settings legt Defaults an)
+        slot_index, level_type, level_number, _, level_config = key
+        from scenes.battle_scene import BattleScene
+        return BattleScene(slot_index, level_type, level_number, level_config=json.loads(level_config))
+
+    def _update_prefetch(self, dt):
+        """Wählt das vorab zu bauende Level (gehovert, sonst zuletzt gespielt)"""
+        # Dev-Settings geändert -> vorbereitete Kämpfe verwerfen
+        version = dev_settings_version()
+        if version != self.dev_version:
+            self.dev_version = version
+            self.battle_builder.cancel()
+            self.prefetch_target = None
+
+        # Hover-Zustand pflegt der UIRoot (nur bei Mausbewegung)
+        hovered = None
+        for btn, level_type, level_number in self.level_buttons:
+            if btn.hovered:
+                hovered = (level_type, level_number)
+                break
+
+        if hovered != self.hover_target:
+            self.hover_target = hovered
+            self.hover_time = 0.0
+        else:
+            self.hover_time += dt
+
+        # Nur nach kurzem Verweilen, damit Überfahren der Buttons nichts startet
+        target = hovered if hovered and self.hover_time >= PREFETCH_HOVER_DELAY else None
+        target = target or self.prefetch_target or self.last_played
+        if target and target != self.prefetch_target:
+            self.prefetch_target = target
+            self.battle_builder.request(self._battle_key(*target))
+
     # --------------------------------------------------------
     # Button-Callbacks
     # --------------------------------------------------------
     def start_battle(self, level_type, level_number):
         print(f"⚔️ {level_type} {level_number} gestartet!")
-        from scenes.battle_scene import BattleScene
-        return BattleScene(self.slot_index, level_type, level_number)
+        self.last_played = (level_type, level_number)
+        scene = self.battle_builder.take(self._battle_key(level_type, level_number))
+        # Ein Build für ein anderes Level darf nicht neben dem Kampf weiterlaufen
+        self.battle_builder.cancel(wait=True)
+        if scene is None:
+            from scenes.battle_scene import BattleScene
+            scene = BattleScene(self.slot_index, level_type, level_number)
+        return Push(scene)
 
     def back_to_town(self):
         print("⬅ Zurück zur Stadt")
+        self.battle_builder.cancel()
         from scenes.town_scene import TownScene
-        return TownScene(self.slot_index)
+        return Pop(lambda: TownScene(self.slot_index))
+
+    # --------------------------------------------------------
+    # Pausieren (Kampf läuft darüber)
+    # --------------------------------------------------------
+    def on_suspend(self):
+        # Während des Kampfes nichts im Hintergrund bauen (auch kein laufender Build)
+        self.battle_builder.cancel(wait=True)
+
+    def on_resume(self):
+        self.ui.sync_pointer()
+        self.renderer.invalidate()
+        # Neuen Kampf für das gerade gespielte Level vorbereiten
+        self.hover_target = None
+        self.hover_time = 0.0
+        self.prefetch_target = self.last_played
+        if self.last_played:
+            self.battle_builder.request(self._battle_key(*self.last_played))
 
     # --------------------------------------------------------
     # Update
     # --------------------------------------------------------
-    def update(self, events):
+    def update(self, events, dt):
+        self._update_prefetch(dt)
+
         for e in events:
-            for btn in self.buttons:
-                result = btn.handle_event(e)
-                if result:
-                    return result
+            result = self.ui.handle_event(e)
+            if result:
+                return result
+
+    def is_animating(self):
+        # Solange ein gehoverter Level-Button auf seinen Prefetch wartet,
+        # muss die Hover-Zeit weiterlaufen
+        for btn, level_type, level_number in self.level_buttons:
+            if btn.hovered:
+                return (level_type, level_number) != self.prefetch_target
+        return False
 
     # --------------------------------------------------------
     # Draw
     # --------------------------------------------------------
-    def draw(self, screen):
+    def _draw_static(self, screen):
         screen.fill((40, 40, 60))
 
         # Titel
-        title = FONT.render("Level Auswahl", True, (255, 255, 255))
+        title = render_text(FONT, "Level Auswahl", True, (255, 255, 255))
         screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 50))
 
         # Kategorien-Labels
-        feld_label = FONT.render("Feld", True, (200, 255, 200))
-        cave_label = FONT.render("Cave", True, (200, 200, 255))
+        feld_label = render_text(FONT, "Feld", True, (200, 255, 200))
+        cave_label = render_text(FONT, "Cave", True, (200, 200, 255))
 
         center_x = WIDTH // 2
         label_y = 120
@@ -114,6 +235,9 @@ class LevelSelectionScene:
             (center_x + 200 - cave_label.get_width() // 2, label_y)
         )
 
-        # Buttons zeichnen
-        for btn in self.buttons:
-            btn.draw(screen)
+    def draw(self, screen, alpha=1.0):
+        self._draw_static(screen)
+        self.ui.draw(screen)
+
+    def draw_dirty(self, screen, alpha=1.0):
+        return self.renderer.render(screen, [button_element(btn) for btn in self.buttons])
@@ -4,8 +4,9 @@ import pygame
 
 from ui.button import Button
 from core.constants import SAVE_SLOTS, SAVE_ROOT, WIDTH
-from ui.fonts import FONT, FONT_BIG, FONT_SMALL
-from scenes.town_scene import TownScene
+from ui.fonts import FONT, FONT_BIG, FONT_SMALL, render_text
+from ui.dirty_renderer import DirtyRenderer
+from ui.widget import UIRoot
 
 
 class LoadMenu:
@@ -15,6 +16,8 @@ class LoadMenu:
 
         self.buttons = []
         self.slots_data = []
+        self.ui = UIRoot()
+        self.renderer = DirtyRenderer(self.draw)
 
         self.build_menu()   # <-- direkt bauen
 
@@ -61,6 +64,13 @@ class LoadMenu:
         # nach Erstellen neu aufbauen!
         self.build_menu()
 
+        return self.open_slot(slot_index)
+
+    # ------------------------------------------------------------------
+    # Spielstand öffnen (Stadt erst hier importieren, nicht beim Start)
+    # ------------------------------------------------------------------
+    def open_slot(self, slot_index):
+        from scenes.town_scene import TownScene
         return TownScene(slot_index)
 
     # ------------------------------------------------------------------
@@ -87,7 +97,7 @@ class LoadMenu:
             # Wenn Save vorhanden → laden
             if pdata:
                 def make_load_cb(index=i):
-                    return lambda: TownScene(index)
+                    return lambda: self.open_slot(index)
                 callback = make_load_cb()
                 text = f"{i+1}. Spiel laden"
 
@@ -101,13 +111,21 @@ class LoadMenu:
             btn = Button(text, x, y + i * spacing, width, height, callback)
             self.buttons.append(btn)
 
+        self.ui.clear()
+        self.ui.add(*self.buttons)
+        self.renderer.invalidate()
+
     # ------------------------------------------------------------------
-    def update(self, events):
+    def update(self, events, dt):
         for ev in events:
-            for btn in self.buttons:
-                res = btn.handle_event(ev)
-                if res:
-                    return res
+            res = self.ui.handle_event(ev)
+            if res:
+                return res
+
+    # ------------------------------------------------------------------
+    def is_animating(self):
+        # Ändert sich nur durch Eingaben
+        return False
 
     # ------------------------------------------------------------------
     def draw_slot(self, screen, btn, pdata):
@@ -122,15 +140,16 @@ class LoadMenu:
         )
 
         # Button text
-        text_surf = FONT.render(btn.text, True, (255, 255, 255))
+        text_surf = render_text(FONT, btn.text, True, (255, 255, 255))
         screen.blit(text_surf, (r.centerx - text_surf.get_width() // 2, r.y + 15))
 
         if pdata is None:
             return
 
         # Save-Infos
-        name_txt = FONT.render(pdata["name"], True, (255, 255, 255))
-        lvl_txt = FONT_SMALL.render(
+        name_txt = render_text(FONT, pdata["name"], True, (255, 255, 255))
+        lvl_txt = render_text(
+            FONT_SMALL,
             f"Level {pdata['level']} – {pdata['class_name']}",
             True,
             (200, 200, 200)
@@ -140,12 +159,17 @@ class LoadMenu:
         screen.blit(lvl_txt, (r.x + 80, r.y + 100))
 
     # ------------------------------------------------------------------
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
         screen.fill((25, 25, 25))
 
-        title = FONT_BIG.render("Spielstand laden", True, (255, 255, 255))
+        title = render_text(FONT_BIG, "Spielstand laden", True, (255, 255, 255))
         screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 40))
 
         for i, btn in enumerate(self.buttons):
             btn.draw(screen)
             self.draw_slot(screen, btn, self.slots_data[i])
+
+    def draw_dirty(self, screen, alpha=1.0):
+        # Die Slot-Kacheln überdecken die Buttons komplett (kein Hover sichtbar):
+        # die ganze Szene ist statisch
+        return self.renderer.render(screen, [])
@@ -1,12 +1,12 @@
 import sys
 import pygame
 from ui.button import Button
-from ui.fonts import FONT_BIG
+from ui.fonts import FONT_BIG, render_text
+from ui.dirty_renderer import DirtyRenderer, button_element
+from ui.widget import UIRoot
+from core.scene_manager import Push
 from core.constants import WIDTH
-from scenes.load_menu import LoadMenu
-from scenes.town_scene import TownScene
 import os
-import json
 from core.constants import SAVE_ROOT, SAVE_SLOTS
 
 
@@ -41,6 +41,10 @@ class MainMenu:
                 Button("Beenden",             x, start_y + gap * 2, w, h, self.quit_game),
             ]
 
+        self.ui = UIRoot()
+        self.ui.add(*self.buttons)
+        self.renderer = DirtyRenderer(self._draw_static)
+
     # ---------------- CALLBACKS ---------------- #
 
     def start_new_game(self):
@@ -75,7 +79,7 @@ class MainMenu:
     def options(self):
         # Statt nur printen: echte OptionsScene öffnen
         from scenes.options_scene import OptionsScene
-        return OptionsScene()
+        return Push(OptionsScene())
 
     # -----------------------------------------------------------------
     def quit_game(self):
@@ -83,17 +87,29 @@ class MainMenu:
         sys.exit()
 
     # -----------------------------------------------------------------
-    def update(self, events):
+    def update(self, events, dt):
         for e in events:
-            for b in self.buttons:
-                result = b.handle_event(e)
-                if result:
-                    return result
+            result = self.ui.handle_event(e)
+            if result:
+                return result
+
+    def is_animating(self):
+        # Ändert sich nur durch Eingaben
+        return False
 
-    def draw(self, screen):
+    def on_resume(self):
+        # Bildschirm und Maus haben sich verändert, während die Szene verdeckt war
+        self.ui.sync_pointer()
+        self.renderer.invalidate()
+
+    def _draw_static(self, screen):
         screen.fill((30, 30, 30))
-        title = FONT_BIG.render("Hauptmenü", True, (255, 255, 255))
+        title = render_text(FONT_BIG, "Hauptmenü", True, (255, 255, 255))
         screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 50))
 
-        for b in self.buttons:
-            b.draw(screen)
+    def draw(self, screen, alpha=1.0):
+        self._draw_static(screen)
+        self.ui.draw(screen)
+
+    def draw_dirty(self, screen, alpha=1.0):
+        return self.renderer.render(screen, [button_element(b) for b in self.buttons])
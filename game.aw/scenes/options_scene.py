@@ -1,7 +1,9 @@
-import pygame
 from ui.button import Button
-from ui.fonts import FONT, FONT_BIG
-from core.constants import WIDTH, HEIGHT
+from ui.fonts import FONT, FONT_BIG, render_text
+from ui.dirty_renderer import DirtyRenderer, button_element
+from ui.widget import UIRoot
+from core.scene_manager import Pop
+from core.constants import WIDTH
 from core.dev_settings import load_dev_settings, save_dev_settings, set_dev_mode
 
 
@@ -10,6 +12,9 @@ class OptionsScene:
         self.settings = load_dev_settings()
         self.buttons = []
         self.create_buttons()
+        self.ui = UIRoot()
+        self.ui.add(*self.buttons)
+        self.renderer = DirtyRenderer(self._draw_static)
 
     def create_buttons(self):
         center_x = WIDTH // 2
@@ -54,27 +59,35 @@ class OptionsScene:
 
     def back_to_main_menu(self):
         from scenes.main_menu import MainMenu
-        return MainMenu()
+        return Pop(MainMenu)
 
-    def update(self, events):
+    def update(self, events, dt):
         for e in events:
-            for b in self.buttons:
-                result = b.handle_event(e)
-                if result:
-                    return result
+            result = self.ui.handle_event(e)
+            if result:
+                return result
 
-    def draw(self, screen):
+    def is_animating(self):
+        # Ändert sich nur durch Eingaben
+        return False
+
+    def _draw_static(self, screen):
         screen.fill((20, 20, 30))
 
-        title = FONT_BIG.render("Optionen", True, (255, 255, 255))
+        title = render_text(FONT_BIG, "Optionen", True, (255, 255, 255))
         screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 60))
 
-        info = FONT.render(
+        info = render_text(
+            FONT,
             "Dev-Modus: zeigt extra Balancing-Panel in der Level Auswahl",
             True,
             (200, 200, 200)
         )
         screen.blit(info, (WIDTH // 2 - info.get_width() // 2, 120))
 
-        for b in self.buttons:
-            b.draw(screen)
+    def draw(self, screen, alpha=1.0):
+        self._draw_static(screen)
+        self.ui.draw(screen)
+
+    def draw_dirty(self, screen, alpha=1.0):
+        return self.renderer.render(screen, [button_element(b) for b in self.buttons])
@@ -1,7 +1,12 @@
-import pygame
+import os
+
 from ui.button import Button
-from ui.fonts import FONT
-from core.constants import WIDTH, HEIGHT
+from ui.fonts import FONT, render_text
+from ui.dirty_renderer import DirtyRenderer, button_element
+from ui.widget import UIRoot
+from core.scene_manager import Push, Reset
+from core.constants import SAVE_ROOT, SAVE_SLOTS, WIDTH
+from core.asset_manager import TOWN_BACKGROUND, SCREEN_SIZE, load_image
 
 
 
@@ -10,11 +15,20 @@ class TownScene:
         self.slot_index = slot_index
         self.buttons = []
         self.create_buttons()
+        self.ui = UIRoot()
+        self.ui.add(*self.buttons)
+
+        self.TOWN_BG = load_image(TOWN_BACKGROUND, SCREEN_SIZE)
+        self._prefetch_inventory()
+
+        self.renderer = DirtyRenderer(self._draw_static)
+
+    def _prefetch_inventory(self):
+        # Suchindex schon im Hintergrund bauen, bevor das Inventar geöffnet wird
+        from core.inventory_cache import INVENTORIES
 
-        try:
-            self.TOWN_BG = pygame.image.load("assets/town/background.png")
-        except:
-            self.TOWN_BG = None
+        save_dir = os.path.join(SAVE_ROOT, SAVE_SLOTS[self.slot_index])
+        INVENTORIES.prefetch(os.path.join(save_dir, "global_inventory.json"))
 
     # --------------------------------------------------------
     # Buttons erzeugen
@@ -39,7 +53,7 @@ class TownScene:
     def inventory(self):
         from scenes.inventory_scene import InventoryScene
 
-        return InventoryScene(self.slot_index)
+        return Push(InventoryScene(self.slot_index))
 
     def smith(self):
         print("🛠 Schmied geöffnet!")
@@ -50,35 +64,47 @@ class TownScene:
     def fight(self):
         print("⚔️ Kampf gestartet!")
         from scenes.level_selection_scene import LevelSelectionScene
-        return LevelSelectionScene(self.slot_index)
+        return Push(LevelSelectionScene(self.slot_index))
 
     def exit_to_menu(self):
         print("⬅ Zurück zum Hauptmenü")
         from scenes.main_menu import MainMenu   # <- WICHTIG: Import hier, nicht oben!
-        return MainMenu()
+        return Reset(MainMenu())   # Spielstand verlassen: pausierte Szenen verwerfen
     # <<--- Szenenwechsel
 
     # --------------------------------------------------------
     # Update
     # --------------------------------------------------------
-    def update(self, events):
+    def update(self, events, dt):
         for e in events:
-            for btn in self.buttons:
-                result = btn.handle_event(e)
-                if result:
-                    return result
+            result = self.ui.handle_event(e)
+            if result:
+                return result
+
+    def is_animating(self):
+        # Ändert sich nur durch Eingaben
+        return False
+
+    def on_resume(self):
+        # Bildschirm und Maus haben sich verändert, während die Szene verdeckt war
+        self.ui.sync_pointer()
+        self.renderer.invalidate()
 
     # --------------------------------------------------------
     # Draw
     # --------------------------------------------------------
-    def draw(self, screen):
+    def _draw_static(self, screen):
         if self.TOWN_BG:
             screen.blit(self.TOWN_BG, (0, 0))
         else:
             screen.fill((80, 120, 80))
 
-        title = FONT.render("Town", True, (255, 255, 255))
+        title = render_text(FONT, "Town", True, (255, 255, 255))
         screen.blit(title, (40, 40))
 
-        for btn in self.buttons:
-            btn.draw(screen)
+    def draw(self, screen, alpha=1.0):
+        self._draw_static(screen)
+        self.ui.draw(screen)
+
+    def draw_dirty(self, screen, alpha=1.0):
+        return self.renderer.render(screen, [button_element(btn) for btn in self.buttons])
@@ -0,0 +1,391 @@
+"""
+Balancing-Simulation - Monte-Carlo-Feldräumungen über level_data.json
+
+Simuliert für jede Level-Konfiguration tausende komplette Feldräumungen mit
+den Stats eines Save-Slots (Wellen aus dem WaveSpawner wie im Spiel,
+Kampfregeln aus core.combat) und wertet Time-to-Kill, Treffer pro Räumung
+und Loot-Drops statistisch aus.
+
+Die Räumungen werden in Shards fester Größe auf einen Prozess-Pool verteilt.
+Jeder Worker lädt die Generatoren nur einmal und liefert nur Histogramme
+(Counter) zurück, dadurch skaliert die Laufzeit linear mit der Kernanzahl.
+
+Aufruf (aus game.aw/):
+    python -m tools.balance_sim --slot 1 --runs 5000 --workers 8
+    python -m tools.balance_sim --slot 1 --levels Feld_1 Feld_2 --format csv --out balance.csv
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Deque, Dict, List, Optional
+
+from core.combat import calculate_damage, get_player_damage, get_total_defense
+from core.constants import SAVE_SLOTS
+from core.enemy_generator import EnemyGenerator
+from core.level_data import load_all_level_settings
+from core.loot_generator import LootGenerator
+from core.player_stats_calculator import PlayerStatsCalculator
+from core.wave_spawner import WaveSpawner
+
+
+PERCENTILES = (50, 90, 95, 99)
+DEFAULT_SHARD_SIZE = 250
+
+# Generatoren pro Worker-Prozess (werden in _init_worker einmalig geladen)
+_ENEMY_GENERATOR: Optional[EnemyGenerator] = None
+_LOOT_GENERATOR: Optional[LootGenerator] = None
+
+
+# ---------------------------------------------------
+# SIMULATION
+# ---------------------------------------------------
+def _init_worker():
+    global _ENEMY_GENERATOR, _LOOT_GENERATOR
+    _ENEMY_GENERATOR = EnemyGenerator()
+    _LOOT_GENERATOR = LootGenerator()
+
+
+def simulate_clear(
+    enemy_generator: EnemyGenerator,
+    loot_generator: LootGenerator,
+    config: Dict[str, Any],
+    player_stats: Dict[str, Any],
+) -> Dict[str, List[Any]]:
+    """
+    Simuliert eine komplette Feldräumung (ein Klick = ein Treffer)
+
+    Die Gegner kommen wie im Spiel aus dem WaveSpawner: alle Wellen aus
+    "waves" (mit ihren Überschreibungen und "repeat"), eine neue Welle erst,
+    wenn sie neben den lebenden Gegnern unter "max_active" passt. Getötet
+    wird der am längsten lebende Gegner zuerst.
+
+    Returns:
+        {"enemy_hits": Treffer pro Gegner, "drops": item_type pro Drop}
+    """
+    spawner = WaveSpawner(enemy_generator, config)
+    player_damage = get_player_damage(player_stats)
+
+    enemy_hits = []
+    drops = []
+    active: Deque[Dict[str, Any]] = deque()
+    while True:
+        while spawner.ready(len(active)):
+            active.extend(spawner.take_wave())
+        if not active:
+            break
+
+        enemy = active.popleft()
+        final_stats = enemy.get("final_stats", enemy.get("generated_stats", {}))
+        actual_damage = calculate_damage(player_damage, get_total_defense(final_stats))
+        hp = final_stats.get("hp", 0)
+        enemy_hits.append(max(1, math.ceil(hp / actual_damage)))
+
+        loot_item = loot_generator.generate_loot(enemy.get("level", 1))
+        if loot_item:
+            drops.append(loot_item.get("item_type") or "?")
+
+    return {"enemy_hits": enemy_hits, "drops": drops}
+
+
+def _run_shard(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Simuliert einen Shard und liefert nur aggregierte Histogramme zurück."""
+    random.seed(task["seed"])
+
+    hits_per_clear: Counter = Counter()
+    hits_per_enemy: Counter = Counter()
+    drops_per_clear: Counter = Counter()
+    drops_by_type: Counter = Counter()
+
+    for _ in range(task["runs"]):
+        result = simulate_clear(
+            _ENEMY_GENERATOR,
+            _LOOT_GENERATOR,
+            task["config"],
+            task["player_stats"],
+        )
+        hits_per_clear[sum(result["enemy_hits"])] += 1
+        hits_per_enemy.update(result["enemy_hits"])
+        drops_per_clear[len(result["drops"])] += 1
+        drops_by_type.update(result["drops"])
+
+    return {
+        "level_key": task["level_key"],
+        "hits_per_clear": hits_per_clear,
+        "hits_per_enemy": hits_per_enemy,
+        "drops_per_clear": drops_per_clear,
+        "drops_by_type": drops_by_type,
+    }
+
+
+def build_tasks(
+    level_configs: Dict[str, Dict[str, Any]],
+    player_stats: Dict[str, Any],
+    runs: int,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    seed: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Teilt die Räumungen jedes Levels in Shards fester Größe auf.
+
+    Die Seeds hängen nur von seed und der Shard-Nummer ab, dadurch sind die
+    Ergebnisse unabhängig von der Worker-Anzahl reproduzierbar.
+    """
+    seed_rng = random.Random(seed)
+    tasks = []
+    for level_key, config in level_configs.items():
+        remaining = runs
+        while remaining > 0:
+            shard_runs = min(shard_size, remaining)
+            tasks.append({
+                "level_key": level_key,
+                "config": config,
+                "player_stats": player_stats,
+                "runs": shard_runs,
+                "seed": seed_rng.randrange(2 ** 32),
+            })
+            remaining -= shard_runs
+    return tasks
+
+
+def _empty_histograms() -> Dict[str, Counter]:
+    return {
+        "hits_per_clear": Counter(),
+        "hits_per_enemy": Counter(),
+        "drops_per_clear": Counter(),
+        "drops_by_type": Counter(),
+    }
+
+
+def run_tasks(
+    tasks: List[Dict[str, Any]],
+    workers: int = 1,
+    pool: Optional[ProcessPoolExecutor] = None,
+) -> Dict[str, Dict[str, Counter]]:
+    """
+    Führt Shards aus und führt die Histogramme pro level_key zusammen.
+
+    Mit pool wird ein bestehender Prozess-Pool (mit _init_worker als
+    initializer) wiederverwendet, sonst wird bei workers > 1 einer erzeugt.
+    """
+    merged: Dict[str, Dict[str, Counter]] = {}
+    for task in tasks:
+        merged.setdefault(task["level_key"], _empty_histograms())
+
+    if pool is not None:
+        _merge_results(merged, pool.map(_run_shard, tasks))
+    elif workers <= 1:
+        if _ENEMY_GENERATOR is None:
+            _init_worker()
+        _merge_results(merged, map(_run_shard, tasks))
+    else:
+        with create_pool(workers) as own_pool:
+            _merge_results(merged, own_pool.map(_run_shard, tasks))
+
+    return merged
+
+
+def run_simulation(
+    level_configs: Dict[str, Dict[str, Any]],
+    player_stats: Dict[str, Any],
+    runs: int,
+    workers: int = 1,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    seed: Optional[int] = None,
+) -> Dict[str, Dict[str, Counter]]:
+    """Simuliert runs Räumungen pro Level und liefert die Histogramme pro Level."""
+    tasks = build_tasks(level_configs, player_stats, runs, shard_size, seed)
+    return run_tasks(tasks, workers=workers)
+
+
+def create_pool(workers: int) -> ProcessPoolExecutor:
+    """Prozess-Pool, dessen Worker die Generatoren einmalig laden"""
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+
+def _merge_results(merged, results):
+    for result in results:
+        target = merged[result["level_key"]]
+        for name, counter in target.items():
+            counter.update(result[name])
+
+
+# ---------------------------------------------------
+# AUSWERTUNG
+# ---------------------------------------------------
+def summarize(histogram: Counter, scale: float = 1.0) -> Dict[str, float]:
+    """
+    Kennzahlen (Mittelwert, Min/Max, Perzentile) eines Werte-Histogramms
+
+    Args:
+        histogram: Counter {Wert: Anzahl}
+        scale: Faktor, mit dem alle Werte multipliziert werden (z.B. Treffer -> Sekunden)
+    """
+    total = sum(histogram.values())
+    if total == 0:
+        return {"count": 0}
+
+    values = sorted(histogram)
+    mean = sum(value * count for value, count in histogram.items()) / total
+    summary = {
+        "count": total,
+        "mean": round(mean * scale, 3),
+        "min": round(values[0] * scale, 3),
+        "max": round(values[-1] * scale, 3),
+    }
+
+    # Perzentile nach Nearest-Rank in einem Durchlauf über die sortierten Werte
+    ranks = [(p, max(1, math.ceil(p / 100 * total))) for p in PERCENTILES]
+    cumulative = 0
+    for value in values:
+        cumulative += histogram[value]
+        while ranks and cumulative >= ranks[0][1]:
+            summary[f"p{ranks[0][0]}"] = round(value * scale, 3)
+            ranks.pop(0)
+    return summary
+
+
+def summarize_level(data: Dict[str, Counter], player_stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Kennzahlen eines Levels aus den zusammengeführten Histogrammen"""
+    attack_speed = player_stats.get("attack_speed", 1.0) or 1.0
+    seconds_per_hit = 1.0 / attack_speed
+
+    clear_time = summarize(data["hits_per_clear"], seconds_per_hit)
+    drops = summarize(data["drops_per_clear"])
+    loot_per_minute = 0.0
+    if clear_time.get("mean"):
+        loot_per_minute = round(drops["mean"] / clear_time["mean"] * 60, 3)
+
+    return {
+        "hits_per_clear": summarize(data["hits_per_clear"]),
+        "clear_time_s": clear_time,
+        "time_to_kill_s": summarize(data["hits_per_enemy"], seconds_per_hit),
+        "loot_drops_per_clear": drops,
+        "loot_per_minute": loot_per_minute,
+        "loot_by_type": dict(data["drops_by_type"].most_common()),
+    }
+
+
+def build_report(
+    merged: Dict[str, Dict[str, Counter]],
+    level_configs: Dict[str, Dict[str, Any]],
+    player_stats: Dict[str, Any],
+) -> Dict[str, Any]:
+    levels = {}
+    for level_key, data in merged.items():
+        levels[level_key] = {"config": level_configs[level_key]}
+        levels[level_key].update(summarize_level(data, player_stats))
+    return levels
+
+
+def write_csv(report: Dict[str, Any], stream):
+    metrics = ("hits_per_clear", "clear_time_s", "time_to_kill_s", "loot_drops_per_clear")
+    columns = ["count", "mean", "min"] + [f"p{p}" for p in PERCENTILES] + ["max"]
+
+    writer = csv.writer(stream)
+    writer.writerow(["level", "metric"] + columns)
+    for level_key, level in report["levels"].items():
+        for metric in metrics:
+            summary = level[metric]
+            writer.writerow([level_key, metric] + [summary.get(c, "") for c in columns])
+        for item_type, count in level["loot_by_type"].items():
+            writer.writerow([level_key, f"loot_{item_type}", count])
+
+
+# ---------------------------------------------------
+# CLI
+# ---------------------------------------------------
+def load_player_stats(slot: int) -> Optional[Dict[str, Any]]:
+    """Gesamt-Stats für Save-Slot (1-basiert wie im Lade-Menü)"""
+    player = PlayerStatsCalculator().get_player_stats(slot - 1)
+    if not player:
+        return None
+    return player["stats"]
+
+
+def select_levels(level_keys: Optional[List[str]]) -> Dict[str, Dict[str, Any]]:
+    """Level-Konfigurationen (nur 'Feld'-Level erzeugen Gegner)"""
+    all_levels = load_all_level_settings()
+    if level_keys:
+        missing = [k for k in level_keys if k not in all_levels]
+        if missing:
+            raise SystemExit(f"Unbekannte Level in level_data.json: {', '.join(missing)}")
+        return {k: all_levels[k] for k in level_keys}
+    return {k: v for k, v in all_levels.items() if k.startswith("Feld_")}
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Monte-Carlo-Balancing über level_data.json")
+    parser.add_argument("--slot", type=int, default=1, choices=range(1, len(SAVE_SLOTS) + 1),
+                        help="Save-Slot, dessen Spieler-Stats verwendet werden (1-3)")
+    parser.add_argument("--levels", nargs="*", help="Level-Keys (Default: alle Feld_N)")
+    parser.add_argument("--runs", type=int, default=2000, help="Räumungen pro Level")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Anzahl Worker-Prozesse (1 = ohne Pool)")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE,
+                        help="Räumungen pro Shard")
+    parser.add_argument("--seed", type=int, default=None, help="Seed für reproduzierbare Läufe")
+    parser.add_argument("--format", choices=("json", "csv"), default="json")
+    parser.add_argument("--out", help="Ausgabedatei (Default: stdout)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+
+    player_stats = load_player_stats(args.slot)
+    if not player_stats:
+        print(f"Keine Spielerdaten in Slot {args.slot} gefunden.", file=sys.stderr)
+        return 1
+
+    level_configs = select_levels(args.levels)
+    if not level_configs:
+        print("Keine Level-Konfigurationen gefunden.", file=sys.stderr)
+        return 1
+
+    started = time.perf_counter()
+    merged = run_simulation(
+        level_configs,
+        player_stats,
+        runs=max(1, args.runs),
+        workers=max(1, args.workers),
+        shard_size=max(1, args.shard_size),
+        seed=args.seed,
+    )
+    elapsed = time.perf_counter() - started
+    total_clears = len(level_configs) * max(1, args.runs)
+
+    report = {
+        "slot": args.slot,
+        "runs_per_level": max(1, args.runs),
+        "workers": max(1, args.workers),
+        "seed": args.seed,
+        "elapsed_s": round(elapsed, 3),
+        "clears_per_s": round(total_clears / elapsed, 1) if elapsed > 0 else None,
+        "player_stats": player_stats,
+        "levels": build_report(merged, level_configs, player_stats),
+    }
+
+    stream = open(args.out, "w", encoding="utf-8", newline="") if args.out else sys.stdout
+    try:
+        if args.format == "csv":
+            write_csv(report, stream)
+        else:
+            json.dump(report, stream, indent=4, ensure_ascii=False)
+            stream.write("\n")
+    finally:
+        if args.out:
+            stream.close()
+
+    print(f"{total_clears} Räumungen in {elapsed:.2f}s ({args.workers} Worker)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
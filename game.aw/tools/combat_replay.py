@@ -0,0 +1,127 @@
+"""
+Combat Replay - spielt ein aufgezeichnetes Combat-Log headless nach
+
+Baut die BattleScene mit Seed, Level-Config und Spieler-Stats aus dem Log
+neu auf, spielt die aufgezeichneten Klicks in denselben Ticks ein und
+vergleicht alle entstehenden Ereignisse (Treffer, Tode, Loot, Wellen) mit
+dem Log. Abweichungen werden mit dem ersten unterschiedlichen Ereignis
+gemeldet.
+
+Aufzeichnen: python main.py --record-combat (Logs unter save/<slot>/combat_logs/)
+
+Aufruf (aus game.aw/):
+    python -m tools.combat_replay save/save1/combat_logs/20250101-120000_Feld_1.clog
+    python -m tools.combat_replay LOG --dump
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+from typing import List, Optional
+
+# Ohne Fenster (muss vor dem ersten pygame-Import gesetzt sein)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from core.combat_log import CombatLog, EVENT_NAMES, EVENT_END
+from core.constants import WIDTH, HEIGHT
+
+
+def replay(log: CombatLog, verbose: bool = False) -> CombatLog:
+    """
+    Simuliert den Kampf aus dem Log erneut
+
+    Returns:
+        Neu aufgezeichnetes Log des nachgestellten Kampfes
+    """
+    from scenes.battle_scene import BattleScene
+
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    clicks = log.clicks_by_tick()
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+
+    with output:
+        scene = BattleScene(0, log.meta["level_type"], log.meta["level_number"], replay_of=log)
+        for tick in range(log.end_tick):
+            events = [
+                pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=button, pos=(x, y))
+                for button, x, y in clicks.get(tick, [])
+            ]
+            scene.update(events, log.sim_dt)
+        # Klicks im Tick, in dem die Szene verlassen wurde (Rest des Ticks lief nicht mehr)
+        for button, x, y in clicks.get(log.end_tick, []):
+            scene.handle_combat_click(button, (x, y))
+        return scene.finish_combat_log()
+
+
+def first_difference(expected: CombatLog, actual: CombatLog) -> Optional[int]:
+    """Index des ersten abweichenden Ereignisses (None = identisch)"""
+    if expected.roster_hash != actual.roster_hash:
+        return -1
+    for i, (a, b) in enumerate(zip(expected.events, actual.events)):
+        if a != b:
+            return i
+    if len(expected.events) != len(actual.events):
+        return min(len(expected.events), len(actual.events))
+    return None
+
+
+def format_event(event) -> str:
+    tick, kind, payload = event
+    return f"Tick {tick:>6}  {EVENT_NAMES.get(kind, kind):<7} {' '.join(str(v) for v in payload)}"
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Combat-Log headless nachspielen und prüfen")
+    parser.add_argument("log", help="Pfad zur .clog-Datei")
+    parser.add_argument("--dump", action="store_true", help="Ereignisse des Logs ausgeben")
+    parser.add_argument("--verbose", action="store_true", help="Ausgaben der BattleScene zeigen")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+
+    try:
+        log = CombatLog.load(args.log)
+    except (OSError, ValueError) as e:
+        print(f"Combat-Log kann nicht gelesen werden: {e}", file=sys.stderr)
+        return 2
+
+    meta = log.meta
+    print(f"{meta['level_type']} {meta['level_number']}: Seed {log.seed}, "
+          f"{len(log.events)} Ereignisse, {log.end_tick} Ticks ({log.end_tick * log.sim_dt:.1f}s), "
+          f"{os.path.getsize(args.log)} Bytes")
+    if args.dump:
+        for event in log.events:
+            print(format_event(event))
+
+    if not log.events or log.events[-1][1] != EVENT_END:
+        print("Warnung: Log ohne End-Ereignis (Kampf nicht regulär verlassen)", file=sys.stderr)
+
+    started = time.perf_counter()
+    result = replay(log, verbose=args.verbose)
+    elapsed = time.perf_counter() - started
+
+    index = first_difference(log, result)
+    if index is None:
+        print(f"OK: Replay identisch ({elapsed:.2f}s)")
+        return 0
+
+    if index < 0:
+        print(f"ABWEICHUNG: Start-Roster {log.roster_hash:08x} != {result.roster_hash:08x}")
+    else:
+        expected = log.events[index] if index < len(log.events) else None
+        actual = result.events[index] if index < len(result.events) else None
+        print(f"ABWEICHUNG bei Ereignis {index}:")
+        print(f"  Log:    {format_event(expected) if expected else '-'}")
+        print(f"  Replay: {format_event(actual) if actual else '-'}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
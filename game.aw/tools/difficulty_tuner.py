@@ -0,0 +1,251 @@
+"""
+Difficulty-Tuner - sucht Level-Konfigurationen für vorgegebene Zielwerte
+
+Für jeden Level-Key aus level_data.json werden enemy_count,
+enchantment_min/max und monster_level_min/max so gewählt, dass die
+Monte-Carlo-Simulation aus tools.balance_sim die Zielwerte des Designers
+(z.B. Median-Treffer pro Räumung, Loot pro Minute) für einen Referenz-Save
+möglichst gut trifft.
+
+Statt das Gitter komplett abzusuchen wird Successive Halving verwendet:
+viele zufällige Kandidaten werden mit wenigen Räumungen bewertet, nur das
+beste 1/eta kommt mit eta-fachem Budget in die nächste Runde. Alle
+Kandidaten einer Runde laufen gemeinsam im Prozess-Pool.
+
+Aufruf (aus game.aw/):
+    python -m tools.difficulty_tuner --slot 1 --target-hits 60 --target-loot-per-minute 4
+    python -m tools.difficulty_tuner --slot 1 --levels Feld_2 --target-clear-time 45 --write
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.constants import SAVE_SLOTS
+from core.level_data import save_level_settings
+from tools.balance_sim import (
+    build_tasks,
+    create_pool,
+    load_player_stats,
+    run_tasks,
+    select_levels,
+    summarize_level,
+)
+
+
+# Suchraum (entspricht den Grenzen im Dev-Overlay der BattleScene)
+SEARCH_SPACE = {
+    "enemy_count": (1, 50),
+    "enchantment": (0, 10),
+    "monster_level": (1, 200),
+}
+
+# Zielwert-Name -> Funktion, die den Wert aus summarize_level() liest
+TARGET_METRICS = {
+    "hits": lambda summary: summary["hits_per_clear"].get("p50", 0),
+    "clear_time": lambda summary: summary["clear_time_s"].get("p50", 0),
+    "loot_per_minute": lambda summary: summary["loot_per_minute"],
+}
+
+
+# ---------------------------------------------------
+# KANDIDATEN
+# ---------------------------------------------------
+def _random_range(rng: random.Random, low: int, high: int) -> Tuple[int, int]:
+    a = rng.randint(low, high)
+    b = rng.randint(low, high)
+    return min(a, b), max(a, b)
+
+
+def sample_candidate(rng: random.Random) -> Dict[str, int]:
+    """Zufällige, gültige Konfiguration (min <= max) aus dem Suchraum"""
+    ench_min, ench_max = _random_range(rng, *SEARCH_SPACE["enchantment"])
+    lvl_min, lvl_max = _random_range(rng, *SEARCH_SPACE["monster_level"])
+    return {
+        "enemy_count": rng.randint(*SEARCH_SPACE["enemy_count"]),
+        "enchantment_min": ench_min,
+        "enchantment_max": ench_max,
+        "monster_level_min": lvl_min,
+        "monster_level_max": lvl_max,
+    }
+
+
+def loss(summary: Dict[str, Any], targets: Dict[str, float]) -> float:
+    """Summe der relativen Abweichungen aller Zielwerte"""
+    total = 0.0
+    for name, target in targets.items():
+        observed = TARGET_METRICS[name](summary)
+        total += abs(observed - target) / max(abs(target), 1e-9)
+    return total
+
+
+# ---------------------------------------------------
+# SUCCESSIVE HALVING
+# ---------------------------------------------------
+def tune_level(
+    level_key: str,
+    current_config: Dict[str, Any],
+    player_stats: Dict[str, Any],
+    targets: Dict[str, float],
+    candidates: int,
+    min_runs: int,
+    eta: int,
+    rng: random.Random,
+    workers: int,
+    pool=None,
+) -> Dict[str, Any]:
+    """
+    Sucht die beste Konfiguration für ein Level.
+
+    Die aktuelle Konfiguration ist Kandidat 0 und bleibt in jeder Runde
+    dabei (auch wenn sie nach Rauschen in einer frühen Runde herausfiele).
+    In der letzten Runde treten Gewinner und Ist-Zustand mit demselben,
+    höchsten Budget gegeneinander an; ein Kandidat ersetzt die aktuelle
+    Konfiguration also nur, wenn er dort besser abschneidet.
+    """
+    # Kandidaten erben die übrigen Level-Settings (z.B. "waves", "max_active"),
+    # damit derselbe Kampf bewertet wird, den das Spiel später erzeugt
+    pool_configs = [dict(current_config)]
+    pool_configs += [dict(current_config, **sample_candidate(rng)) for _ in range(max(0, candidates - 1))]
+    alive = list(range(len(pool_configs)))
+
+    runs = min_runs
+    evaluations = 0
+    scores: Dict[int, float] = {}
+    summaries: Dict[int, Dict[str, Any]] = {}
+
+    while True:
+        tasks = []
+        for index in alive:
+            shard_tasks = build_tasks(
+                {level_key: pool_configs[index]},
+                player_stats,
+                runs,
+                shard_size=max(1, math.ceil(runs / max(1, workers))),
+                seed=rng.randrange(2 ** 32),
+            )
+            for task in shard_tasks:
+                task["level_key"] = str(index)
+            tasks.extend(shard_tasks)
+
+        merged = run_tasks(tasks, workers=workers, pool=pool)
+        evaluations += runs * len(alive)
+
+        for index in alive:
+            summaries[index] = summarize_level(merged[str(index)], player_stats)
+            scores[index] = loss(summaries[index], targets)
+
+        # Nur noch ein Herausforderer: er und der Ist-Zustand liefen gerade
+        # mit demselben, höchsten Budget
+        challengers = sorted((i for i in alive if i != 0), key=lambda i: scores[i])
+        if len(challengers) <= 1:
+            break
+
+        alive = [0] + challengers[:max(1, len(alive) // eta)]
+        runs *= eta
+
+    best = min(alive, key=lambda i: scores[i])
+    return {
+        "config": pool_configs[best],
+        "loss": round(scores[best], 4),
+        "metrics": {name: TARGET_METRICS[name](summaries[best]) for name in TARGET_METRICS},
+        "final_runs": runs,
+        "simulated_clears": evaluations,
+        "kept_current": best == 0,
+    }
+
+
+# ---------------------------------------------------
+# CLI
+# ---------------------------------------------------
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Sucht Level-Konfigurationen für Zielwerte")
+    parser.add_argument("--slot", type=int, default=1, choices=range(1, len(SAVE_SLOTS) + 1),
+                        help="Referenz-Save-Slot (1-3)")
+    parser.add_argument("--levels", nargs="*", help="Level-Keys (Default: alle Feld_N)")
+    parser.add_argument("--target-hits", type=float, help="Ziel: Median-Treffer pro Räumung")
+    parser.add_argument("--target-clear-time", type=float, help="Ziel: Median-Räumzeit in Sekunden")
+    parser.add_argument("--target-loot-per-minute", type=float, help="Ziel: Loot-Drops pro Minute")
+    parser.add_argument("--candidates", type=int, default=27, help="Startkandidaten pro Level")
+    parser.add_argument("--min-runs", type=int, default=40, help="Räumungen pro Kandidat in Runde 1")
+    parser.add_argument("--eta", type=int, default=3, help="Reduktionsfaktor pro Runde")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--write", action="store_true",
+                        help="Beste Konfigurationen über save_level_settings speichern")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+
+    targets = {
+        name: value
+        for name, value in (
+            ("hits", args.target_hits),
+            ("clear_time", args.target_clear_time),
+            ("loot_per_minute", args.target_loot_per_minute),
+        )
+        if value is not None
+    }
+    if not targets:
+        print("Mindestens ein Zielwert (--target-...) ist nötig.", file=sys.stderr)
+        return 1
+
+    player_stats = load_player_stats(args.slot)
+    if not player_stats:
+        print(f"Keine Spielerdaten in Slot {args.slot} gefunden.", file=sys.stderr)
+        return 1
+
+    level_configs = select_levels(args.levels)
+    rng = random.Random(args.seed)
+    workers = max(1, args.workers)
+    eta = max(2, args.eta)
+
+    started = time.perf_counter()
+    results = {}
+    pool = create_pool(workers) if workers > 1 else None
+    try:
+        for level_key, config in level_configs.items():
+            result = tune_level(
+                level_key,
+                config,
+                player_stats,
+                targets,
+                candidates=max(1, args.candidates),
+                min_runs=max(1, args.min_runs),
+                eta=eta,
+                rng=rng,
+                workers=workers,
+                pool=pool,
+            )
+            results[level_key] = result
+            print(f"{level_key}: Verlust {result['loss']} -> {result['config']}", file=sys.stderr)
+
+            if args.write:
+                # Nur die gesuchten Keys überschreiben, sonstige Level-Daten bleiben erhalten
+                tuned = dict(config)
+                tuned.update(result["config"])
+                save_level_settings(level_key, tuned)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    report = {
+        "slot": args.slot,
+        "targets": targets,
+        "written": args.write,
+        "elapsed_s": round(time.perf_counter() - started, 3),
+        "levels": results,
+    }
+    json.dump(report, sys.stdout, indent=4, ensure_ascii=False)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
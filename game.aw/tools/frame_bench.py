@@ -0,0 +1,439 @@
+"""
+Frame-Benchmark - misst Update- und Zeichenzeiten aller Szenen ohne Fenster
+
+Läuft mit dem SDL-Dummy-Treiber (auch ohne Display, z.B. in CI). Zuerst
+wird ein Fixture-Save in einem temporären Ordner angelegt (Spieler +
+global_inventory.json mit --items zufälligen Items, siehe GAME_SAVE_ROOT
+in core/constants.py). Dann wird jede Szene gebaut und --frames Frames
+lang mit geskripteter Eingabe (Mausbewegung, Klicks, Mausrad, Tasten)
+betrieben. Pro Frame werden update(), draw() + flip und die Summe
+gemessen; die ersten --warmup Frames zählen nicht. Jede Szene läuft
+--repeat mal, pro Kennzahl zählt der beste Lauf (dämpft Störungen durch
+andere Prozesse).
+
+Die Skripte klicken nie auf Buttons (kein Szenenwechsel, keine
+Änderungen am Save). Der Dummy-Treiber bewegt die echte Maus nicht:
+alles, was pygame.mouse.get_pos() liest (Gegner-Tooltip im Kampf),
+wird nicht mitgemessen.
+
+Ergebnis ist JSON mit mean/p50/p95/p99/max in Millisekunden pro Szene.
+Mit --baseline wird gegen ein früheres Ergebnis verglichen; ein
+Perzentil gilt als Regression, wenn es um mehr als --threshold (relativ)
+und mehr als --min-delta-ms (absolut) langsamer ist. Exit-Code 1 bei
+Regressionen.
+
+Aufruf (aus game.aw/):
+    python -m tools.frame_bench --out bench.json
+    python -m tools.frame_bench --scenes InventoryScene --items 100000 --frames 1200
+    python -m tools.frame_bench --baseline bench.json --threshold 0.3
+"""
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Ohne Fenster (muss vor dem ersten pygame-Import gesetzt sein)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")   # stdout bleibt reines JSON
+
+import pygame
+
+
+SCENE_NAMES = ("MainMenu", "LoadMenu", "TownScene", "LevelSelectionScene", "InventoryScene", "BattleScene")
+METRICS = ("update_ms", "draw_ms", "frame_ms")
+PERCENTILES = (50, 95, 99)
+
+FIXTURE_PLAYER_LEVEL = 20
+FIXTURE_MAX_ITEM_LEVEL = 50
+
+
+# ---------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------
+def write_fixture_saves(save_root: str, item_count: int, seed: int):
+    """
+    Legt in save_root einen Spieler in Slot 1 mit item_count Inventar-Items an
+
+    Muss laufen, nachdem GAME_SAVE_ROOT gesetzt ist (Import von core.*).
+    """
+    from core.constants import SAVE_SLOTS
+    from core.loot_generator import LootGenerator
+    from scenes.inventory_scene import InventoryScene
+
+    rng = random.Random(seed)
+    generator = LootGenerator(rng=rng)
+    if not generator.item_pool:
+        raise RuntimeError("Keine Item-Daten gefunden (data/*.json)")
+
+    items = []
+    equipped = {}
+    while len(items) < item_count:
+        item = generator.generate_loot(rng.randint(1, FIXTURE_MAX_ITEM_LEVEL))
+        if item is None:
+            continue
+        slot = InventoryScene._resolve_slot(item.get("item_type", ""))
+        # Ohne Waffe zählt die Stärke als Schaden (siehe core.combat.get_player_damage)
+        if slot and slot != "weapon" and slot not in equipped:
+            equipped[slot] = item
+        else:
+            items.append(item)
+
+    player = {
+        "name": "Benchmark",
+        "class_id": "warrior",
+        "class_name": "Krieger",
+        "level": FIXTURE_PLAYER_LEVEL,
+        "experience": 0,
+        "stats": {
+            # Übersteht den ganzen Lauf und räumt Gegner weg (Wellen, Loot, Sprites)
+            "health": 1000000,
+            "strength": 150,
+            "intelligence": 10,
+            "dexterity": 10,
+            "speed": 12,
+            "level": FIXTURE_PLAYER_LEVEL,
+            "experience": 0,
+        },
+        "equipped": equipped,
+    }
+
+    slot_dir = os.path.join(save_root, SAVE_SLOTS[0])
+    os.makedirs(slot_dir, exist_ok=True)
+    with open(os.path.join(slot_dir, "player.json"), "w", encoding="utf-8") as f:
+        json.dump(player, f, ensure_ascii=False)
+    with open(os.path.join(slot_dir, "global_inventory.json"), "w", encoding="utf-8") as f:
+        json.dump(items, f, ensure_ascii=False)
+
+
+def build_scene(name: str, seed: int):
+    if name == "MainMenu":
+        from scenes.main_menu import MainMenu
+        return MainMenu()
+    if name == "LoadMenu":
+        from scenes.load_menu import LoadMenu
+        return LoadMenu()
+    if name == "TownScene":
+        from scenes.town_scene import TownScene
+        return TownScene(0)
+    if name == "LevelSelectionScene":
+        from scenes.level_selection_scene import LevelSelectionScene
+        return LevelSelectionScene(0, last_played=("Feld", 1))
+    if name == "InventoryScene":
+        from scenes.inventory_scene import InventoryScene
+        return InventoryScene(0)
+    if name == "BattleScene":
+        from scenes.battle_scene import BattleScene
+        return BattleScene(0, "Feld", 1, seed=seed)
+    raise ValueError(f"Unbekannte Szene: {name}")
+
+
+# ---------------------------------------------------
+# GESKRIPTETE EINGABE
+# ---------------------------------------------------
+def _motion(pos) -> pygame.event.Event:
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+
+
+def _click(pos, button: int = 1) -> List[pygame.event.Event]:
+    return [
+        pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=button),
+        pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=button),
+    ]
+
+
+def _key(key: int, unicode: str = "") -> pygame.event.Event:
+    return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode, mod=0)
+
+
+def _sweep_pos(frame: int):
+    """Lissajous-Bahn über den ganzen Bildschirm (trifft nach und nach alle Buttons)"""
+    from core.constants import WIDTH, HEIGHT
+    t = frame / 60.0
+    return (int(WIDTH / 2 + WIDTH * 0.45 * math.sin(t * 1.3)),
+            int(HEIGHT / 2 + HEIGHT * 0.45 * math.sin(t * 2.1)))
+
+
+def menu_script(scene, frame: int, rng: random.Random) -> List[pygame.event.Event]:
+    return [_motion(_sweep_pos(frame))]
+
+
+INVENTORY_QUERY = "typ:weapon level:10-"
+
+
+def inventory_script(scene, frame: int, rng: random.Random) -> List[pygame.event.Event]:
+    """Scrollen und Blättern in der Liste, Suchtext tippen und löschen, Sortierung wechseln"""
+    listing = scene.inventory_list
+    events = [_motion((listing.rect.centerx, listing.rect.y + (frame * 7) % listing.rect.height))]
+
+    phase = frame % 240
+    if phase < 120:
+        if frame % 4 == 0:
+            events.append(pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=-1 if phase < 80 else 2, flipped=False))
+        if frame % 15 == 0:
+            events.append(_key(pygame.K_DOWN if phase < 60 else pygame.K_PAGEDOWN))
+    elif phase == 120:
+        events.extend(_click(scene.query_input.rect.center))
+    elif phase <= 120 + len(INVENTORY_QUERY):
+        char = INVENTORY_QUERY[phase - 121]
+        events.append(_key(pygame.K_SPACE if char == " " else 0, char))
+    elif phase < 200:
+        if phase % 3 == 0 and scene.query_input.text:
+            events.append(_key(pygame.K_BACKSPACE))
+    elif phase == 200:
+        events.append(_key(pygame.K_ESCAPE))
+        events.extend(_click(scene.sort_button.rect.center))
+    return events
+
+
+def battle_script(scene, frame: int, rng: random.Random) -> List[pygame.event.Event]:
+    """Ziel-Klicks auf zufällige Gegner und Flächenangriffe ins Kampffeld (nie auf Buttons)"""
+    from core.constants import WIDTH, HEIGHT
+    events = [_motion(_sweep_pos(frame))]
+    pos = None
+    if frame % 20 == 0:
+        slots = scene.enemies.alive_slots()
+        if len(slots):
+            slot = slots[rng.randrange(len(slots))]
+            pos = (int(scene.enemies.x[slot]), int(scene.enemies.y[slot]))
+            button = 1
+    elif frame % 45 == 0:
+        pos = (rng.randrange(WIDTH), rng.randrange(100, HEIGHT))
+        button = 3
+    if pos is not None and scene.ui.widget_at(pos) is None:
+        events.extend(_click(pos, button))
+    return events
+
+
+SCRIPTS: Dict[str, Callable[[Any, int, random.Random], List[pygame.event.Event]]] = {
+    "MainMenu": menu_script,
+    "LoadMenu": menu_script,
+    "TownScene": menu_script,
+    "LevelSelectionScene": menu_script,
+    "InventoryScene": inventory_script,
+    "BattleScene": battle_script,
+}
+
+
+# ---------------------------------------------------
+# MESSUNG
+# ---------------------------------------------------
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """mean/p50/p95/p99/max (Nearest-Rank) in Millisekunden"""
+    if not samples:
+        return {"count": 0}
+    values = sorted(samples)
+    summary = {"mean": round(sum(values) / len(values), 4)}
+    for p in PERCENTILES:
+        summary[f"p{p}"] = round(values[max(1, math.ceil(p / 100 * len(values))) - 1], 4)
+    summary["max"] = round(values[-1], 4)
+    return summary
+
+
+def bench_scene(name: str, screen: pygame.Surface, frames: int, warmup: int, seed: int,
+                sim_dt: float, dirty_rects: bool) -> Dict[str, Any]:
+    # Gleicher Zufall in jedem Lauf (Skript, über den Seed der Szene auch Gegner und Loot)
+    rng = random.Random(seed)
+    script = SCRIPTS[name]
+
+    started = time.perf_counter()
+    scene = build_scene(name, seed)
+    setup_ms = (time.perf_counter() - started) * 1000.0
+
+    samples = {metric: [] for metric in METRICS}
+    perf_counter = time.perf_counter
+    for frame in range(warmup + frames):
+        events = script(scene, frame, rng)
+
+        t0 = perf_counter()
+        # Szenenwechsel werden ignoriert: gemessen wird immer dieselbe Szene
+        scene.update(events, sim_dt)
+        t1 = perf_counter()
+        draw_dirty = getattr(scene, "draw_dirty", None) if dirty_rects else None
+        if draw_dirty is not None:
+            rects = draw_dirty(screen, 1.0)
+            if rects:
+                pygame.display.update(rects)
+        else:
+            scene.draw(screen, 1.0)
+            pygame.display.flip()
+        t2 = perf_counter()
+
+        if frame >= warmup:
+            samples["update_ms"].append((t1 - t0) * 1000.0)
+            samples["draw_ms"].append((t2 - t1) * 1000.0)
+            samples["frame_ms"].append((t2 - t0) * 1000.0)
+
+    # Vorab-Aufbau der Level-Auswahl darf nicht in die nächste Szene laufen
+    builder = getattr(scene, "battle_builder", None)
+    if builder is not None:
+        builder.cancel()
+        while builder.busy:
+            time.sleep(0.01)
+
+    result = {"frames": frames, "setup_ms": round(setup_ms, 3)}
+    for metric in METRICS:
+        result[metric] = summarize(samples[metric])
+    return result
+
+
+def best_of(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Fasst Wiederholungen zusammen: pro Kennzahl der kleinste Wert"""
+    best = dict(results[0])
+    best["setup_ms"] = min(r["setup_ms"] for r in results)
+    for metric in METRICS:
+        best[metric] = {key: min(r[metric][key] for r in results) for key in results[0][metric]}
+    return best
+
+
+def run_benchmark(scene_names: List[str], frames: int, warmup: int, items: int, seed: int,
+                  dirty_rects: bool, repeat: int = 1, verbose: bool = False) -> Dict[str, Any]:
+    save_root = tempfile.mkdtemp(prefix="frame_bench_")
+    os.environ["GAME_SAVE_ROOT"] = save_root
+    try:
+        from core.constants import WIDTH, HEIGHT, SIMULATION_RATE
+
+        pygame.init()
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        write_fixture_saves(save_root, items, seed)
+
+        scenes = {}
+        output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+        for name in scene_names:
+            with output:
+                runs = [bench_scene(name, screen, frames, warmup, seed, 1.0 / SIMULATION_RATE, dirty_rects)
+                        for _ in range(repeat)]
+            scenes[name] = best_of(runs)
+            frame_ms = scenes[name]["frame_ms"]
+            print(f"{name:<20} p50 {frame_ms['p50']:8.3f} ms  p95 {frame_ms['p95']:8.3f} ms  "
+                  f"p99 {frame_ms['p99']:8.3f} ms", file=sys.stderr)
+    finally:
+        shutil.rmtree(save_root, ignore_errors=True)
+
+    return {
+        "config": {
+            "frames": frames,
+            "warmup": warmup,
+            "items": items,
+            "seed": seed,
+            "repeat": repeat,
+            "dirty_rects": dirty_rects,
+            "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+        },
+        "scenes": scenes,
+    }
+
+
+# ---------------------------------------------------
+# VERGLEICH
+# ---------------------------------------------------
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float,
+            min_delta_ms: float) -> List[Dict[str, Any]]:
+    """
+    Perzentile, die gegenüber der Baseline langsamer geworden sind
+
+    Returns:
+        Liste von {scene, metric, percentile, baseline_ms, current_ms, change}
+    """
+    regressions = []
+    for name, result in current["scenes"].items():
+        base = baseline.get("scenes", {}).get(name)
+        if base is None:
+            continue
+        for metric in METRICS:
+            for p in PERCENTILES:
+                key = f"p{p}"
+                old = base.get(metric, {}).get(key)
+                new = result[metric].get(key)
+                if old is None or new is None:
+                    continue
+                if new - old > min_delta_ms and new > old * (1.0 + threshold):
+                    regressions.append({
+                        "scene": name,
+                        "metric": metric,
+                        "percentile": key,
+                        "baseline_ms": old,
+                        "current_ms": new,
+                        "change": round(new / old - 1.0, 3) if old > 0 else None,
+                    })
+    return regressions
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Frame-Zeiten aller Szenen headless messen")
+    parser.add_argument("--scenes", nargs="*", choices=SCENE_NAMES, help="Szenen (Default: alle)")
+    parser.add_argument("--frames", type=int, default=600, help="gemessene Frames pro Szene")
+    parser.add_argument("--warmup", type=int, default=60, help="Frames vor der Messung")
+    parser.add_argument("--items", type=int, default=1000, help="Items im Fixture-Inventar")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3, help="Läufe pro Szene (bester zählt)")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="draw_dirty() statt draw() messen (wie main.py --dirty-rects)")
+    parser.add_argument("--out", help="Ausgabedatei (Default: stdout)")
+    parser.add_argument("--baseline", help="früheres Ergebnis, gegen das verglichen wird")
+    parser.add_argument("--threshold", type=float, default=0.20,
+                        help="relative Verschlechterung, ab der eine Regression gemeldet wird")
+    parser.add_argument("--min-delta-ms", type=float, default=0.1,
+                        help="kleinere absolute Verschlechterungen gelten als Rauschen")
+    parser.add_argument("--verbose", action="store_true", help="Ausgaben der Szenen zeigen")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+
+    baseline = None
+    if args.baseline:
+        try:
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Baseline kann nicht gelesen werden: {e}", file=sys.stderr)
+            return 2
+
+    report = run_benchmark(
+        args.scenes or list(SCENE_NAMES),
+        frames=max(1, args.frames),
+        warmup=max(0, args.warmup),
+        items=max(0, args.items),
+        seed=args.seed,
+        dirty_rects=args.dirty_rects,
+        repeat=max(1, args.repeat),
+        verbose=args.verbose,
+    )
+
+    regressions = []
+    if baseline is not None:
+        differing = [key for key, value in report["config"].items()
+                     if baseline.get("config", {}).get(key) != value]
+        if differing:
+            print(f"Warnung: Baseline mit anderer Konfiguration ({', '.join(differing)})", file=sys.stderr)
+        regressions = compare(baseline, report, args.threshold, args.min_delta_ms)
+        report["regressions"] = regressions
+        for r in regressions:
+            print(f"REGRESSION {r['scene']} {r['metric']} {r['percentile']}: "
+                  f"{r['baseline_ms']:.3f} -> {r['current_ms']:.3f} ms", file=sys.stderr)
+        if not regressions:
+            print("Keine Regressionen gegenüber der Baseline", file=sys.stderr)
+
+    stream = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    try:
+        json.dump(report, stream, indent=4, ensure_ascii=False)
+        stream.write("\n")
+    finally:
+        if args.out:
+            stream.close()
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+Startup-Report - wie lange dauert es bis zum ersten Frame des Hauptmenüs?
+
+Startet main.py --startup-report mehrfach als eigenen Prozess (Dummy-
+Videotreiber) und gibt den Median jeder Startphase aus, dazu die Wandzeit
+des ganzen Prozesses (inkl. Interpreter-Start). Ein weiterer Lauf mit
+python -X importtime zeigt, welche Module beim Start geladen werden:
+Summe pro Paket und die teuersten Imports (kumuliert, in ms).
+
+Aufruf (aus game.aw/):
+    python -m tools.startup_report
+    python -m tools.startup_report --runs 20 --top 25
+    python -m tools.startup_report --json > startup.json
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+GAME_ROOT = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+
+STARTUP_LINE = re.compile(r"^startup:\s+([\d.]+) ms\s+\(\+\s*[\d.]+\)\s+(.+)$")
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+# Eigene Pakete; alles andere wird nach seinem obersten Paket gruppiert
+GAME_PACKAGES = ("core", "ui", "scenes", "tools")
+
+
+def _run_game(extra_args: List[str]) -> Tuple[float, str]:
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, *extra_args, "main.py", "--startup-report"],
+        cwd=GAME_ROOT, env=env, capture_output=True, text=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000.0
+    if result.returncode != 0:
+        raise RuntimeError(f"main.py --startup-report fehlgeschlagen:\n{result.stderr}")
+    return wall_ms, result.stderr
+
+
+def parse_phases(stderr: str) -> List[Tuple[str, float]]:
+    phases = []
+    for line in stderr.splitlines():
+        match = STARTUP_LINE.match(line)
+        if match:
+            phases.append((match.group(2), float(match.group(1))))
+    return phases
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """(Modul, eigene µs, kumulierte µs, Tiefe) pro Zeile von -X importtime"""
+    imports = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            depth = (len(match.group(3)) - 1) // 2
+            imports.append((match.group(4), int(match.group(1)), int(match.group(2)), depth))
+    return imports
+
+
+def measure_phases(runs: int) -> Dict[str, Any]:
+    """Median (und Minimum) jeder Startphase über runs Prozesse"""
+    walls = []
+    samples: Dict[str, List[float]] = defaultdict(list)
+    order: List[str] = []
+    for _ in range(runs):
+        wall_ms, stderr = _run_game([])
+        walls.append(wall_ms)
+        for name, ms in parse_phases(stderr):
+            if name not in samples:
+                order.append(name)
+            samples[name].append(ms)
+
+    phases = {
+        name: {"median_ms": round(statistics.median(samples[name]), 1), "min_ms": round(min(samples[name]), 1)}
+        for name in order
+    }
+    return {
+        "runs": runs,
+        "phases": phases,
+        "process_ms": {"median_ms": round(statistics.median(walls), 1), "min_ms": round(min(walls), 1)},
+    }
+
+
+def measure_imports(top: int) -> Dict[str, Any]:
+    _, stderr = _run_game(["-X", "importtime"])
+    imports = parse_importtime(stderr)
+
+    by_package: Dict[str, int] = defaultdict(int)
+    for module, self_us, _, _ in imports:
+        by_package[module.split(".", 1)[0]] += self_us
+
+    game_modules = [
+        (module, cumulative) for module, _, cumulative, _ in imports
+        if "." in module and module.split(".", 1)[0] in GAME_PACKAGES
+    ]
+    slowest = sorted(imports, key=lambda entry: entry[2], reverse=True)[:top]
+    return {
+        "modules": len(imports),
+        "total_ms": round(sum(entry[1] for entry in imports) / 1000.0, 1),
+        "by_package_ms": {
+            package: round(us / 1000.0, 1)
+            for package, us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]
+        },
+        "slowest_ms": [
+            {"module": module, "self_ms": round(self_us / 1000.0, 1),
+             "cumulative_ms": round(cumulative / 1000.0, 1), "depth": depth}
+            for module, self_us, cumulative, depth in slowest
+        ],
+        "game_modules_ms": {module: round(cumulative / 1000.0, 1) for module, cumulative in game_modules},
+    }
+
+
+def print_report(report: Dict[str, Any]):
+    startup = report["startup"]
+    print(f"Startphasen (Median aus {startup['runs']} Läufen, ms seit Beginn von main.py):")
+    for name, values in startup["phases"].items():
+        print(f"  {name:<16} {values['median_ms']:8.1f}   (min {values['min_ms']:.1f})")
+    process = startup["process_ms"]
+    print(f"  {'Prozess gesamt':<16} {process['median_ms']:8.1f}   (min {process['min_ms']:.1f}, inkl. Interpreter)")
+
+    imports = report["imports"]
+    print(f"\nImports: {imports['modules']} Module, {imports['total_ms']:.1f} ms (mit -X importtime)")
+    print("  nach Paket (eigene Zeit):")
+    for package, ms in imports["by_package_ms"].items():
+        print(f"    {package:<44} {ms:8.1f}")
+    print("  teuerste Imports (kumuliert):")
+    for entry in imports["slowest_ms"]:
+        label = "  " * entry["depth"] + entry["module"]
+        print(f"    {label:<44} {entry['cumulative_ms']:8.1f}")
+    print("  Spiel-Module (kumuliert):")
+    for module, ms in imports["game_modules_ms"].items():
+        print(f"    {module:<44} {ms:8.1f}")
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Startzeit bis zum ersten Frame messen")
+    parser.add_argument("--runs", type=int, default=10, help="Prozesse für die Startphasen")
+    parser.add_argument("--top", type=int, default=15, help="Zeilen pro Import-Tabelle")
+    parser.add_argument("--json", action="store_true", help="Ergebnis als JSON ausgeben")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+
+    try:
+        report = {
+            "startup": measure_phases(max(1, args.runs)),
+            "imports": measure_imports(max(1, args.top)),
+        }
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=4, ensure_ascii=False)
+        sys.stdout.write("\n")
+    else:
+        print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,30 +1,61 @@
 import pygame
-from ui.fonts import FONT
+from ui.fonts import FONT, render_text
+from ui.widget import Widget
+
+
+BUTTON_COLOR = (80, 80, 80)
+BUTTON_HOVER_COLOR = (120, 120, 120)
+
+
+class Button(Widget):
+    """
+    Button als Widget. Normal- und Hover-Bild werden beim ersten Zeichnen
+    (und nach Textänderung) einmal vorgerendert; draw() blittet nur noch.
+    Den Hover-Zustand setzt der UIRoot bei Mausbewegung.
+
+    Erzeugen rendert nichts, Buttons dürfen also auch in Szenen entstehen,
+    die auf einem Worker-Thread vorgebaut werden.
+    """
 
-class Button:
     def __init__(self, text, x, y, w, h, callback):
-        self.text = text
-        self.rect = pygame.Rect(x, y, w, h)
+        super().__init__((x, y, w, h))
         self.callback = callback
-        self.is_pressed = False
+        self._text = text
+        self._images = None
 
-    def draw(self, surface):
-        mouse = pygame.mouse.get_pos()
-        color = (120, 120, 120) if self.rect.collidepoint(mouse) else (80, 80, 80)
-        pygame.draw.rect(surface, color, self.rect, border_radius=10)
+    @property
+    def text(self):
+        return self._text
 
-        txt = FONT.render(self.text, True, (255, 255, 255))
-        surface.blit(txt, (self.rect.centerx - txt.get_width() // 2,
-                           self.rect.centery - txt.get_height() // 2))
+    @text.setter
+    def text(self, text):
+        if text != self._text:
+            self._text = text
+            self._images = None
 
-    def handle_event(self, ev):
-        if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
-            if self.rect.collidepoint(ev.pos):
-                self.is_pressed = True
+    def _render_images(self):
+        images = []
+        for color in (BUTTON_COLOR, BUTTON_HOVER_COLOR):
+            image = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(image, color, image.get_rect(), border_radius=10)
+            txt = render_text(FONT, self._text, True, (255, 255, 255))
+            image.blit(txt, (self.rect.width // 2 - txt.get_width() // 2,
+                             self.rect.height // 2 - txt.get_height() // 2))
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
+            images.append(image)
+        return images
+
+    def draw(self, surface):
+        if self._images is None:
+            self._images = self._render_images()
+        surface.blit(self._images[self.hovered], self.rect)
 
-        if ev.type == pygame.MOUSEBUTTONUP and ev.button == 1:
-            if self.is_pressed and self.rect.collidepoint(ev.pos):
-                return self.callback()
-            self.is_pressed = False
+    def on_mouse_down(self, ev):
+        return ev.button == 1
 
-        return None
+    def on_mouse_up(self, ev, inside):
+        if inside:
+            result = self.callback()
+            return True if result is None else result
+        return True
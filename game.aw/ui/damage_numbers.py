@@ -0,0 +1,157 @@
+"""
+Schadenszahlen - Partikel-Pool mit fester Kapazität und Glyphen-Cache
+
+Alle Zahlen liegen als Struct-of-Arrays (x, y, timer, value, owner) in
+NumPy-Spalten fester Größe; pro Frame wird nichts neu angelegt. Gezeichnet
+wird aus vorgerenderten Ziffern-Glyphen (pro Alpha-Stufe gecacht) statt
+jede Zahl jedes Frame neu zu rendern.
+"""
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import pygame
+
+from ui.fonts import FONT_SMALL, render_text
+from ui.dirty_renderer import DirtyElement
+
+
+DAMAGE_COLOR = (255, 100, 100)
+LIFETIME = 1.5       # Sekunden sichtbar
+RISE_SPEED = 50      # Pixel pro Sekunde nach oben
+ALPHA_LEVELS = 16    # Abstufungen der Transparenz im Glyphen-Cache
+
+
+class DamageNumberPool:
+    def __init__(self, capacity: int = 512):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.prev_y = np.zeros(capacity, dtype=np.float32)
+        self.timer = np.zeros(capacity, dtype=np.float32)
+        self.value = np.zeros(capacity, dtype=np.int32)
+        self.owner = np.full(capacity, -1, dtype=np.int64)
+        self.active = np.zeros(capacity, dtype=bool)
+
+        # Freie Slots als Stack (O(1) beim Anlegen)
+        self._free = list(range(capacity - 1, -1, -1))
+
+        # (Zeichen, Alpha-Stufe) -> Surface
+        self._glyphs: Dict[Tuple[str, int], pygame.Surface] = {}
+
+    def __len__(self) -> int:
+        return self.capacity - len(self._free)
+
+    # ------------------------------------------------------------------ #
+    # Verwaltung
+    # ------------------------------------------------------------------ #
+    def spawn(self, x: float, y: float, value: int, owner: int):
+        """
+        Legt eine Schadenszahl an. Ist der Pool voll, wird die älteste ersetzt.
+
+        Args:
+            x, y: Startposition (Mitte der Zahl)
+            value: angezeigter Schaden
+            owner: stabile ID des Gegners, zu dem die Zahl gehört
+        """
+        if self._free:
+            slot = self._free.pop()
+        else:
+            slot = int(np.argmin(self.timer))
+
+        self.x[slot] = x
+        self.y[slot] = y
+        self.prev_y[slot] = y
+        self.timer[slot] = LIFETIME
+        self.value[slot] = value
+        self.owner[slot] = owner
+        self.active[slot] = True
+
+    def update(self, dt: float):
+        """Bewegt alle aktiven Zahlen nach oben und gibt abgelaufene Slots frei."""
+        active = self.active
+        if not active.any():
+            return
+
+        self.timer[active] -= dt
+        self.prev_y[active] = self.y[active]
+        self.y[active] -= RISE_SPEED * dt
+
+        self._release(active & (self.timer <= 0))
+
+    def release_owners(self, owner_ids: Iterable[int]):
+        """Entfernt alle Zahlen der angegebenen (z.B. gestorbenen) Gegner."""
+        owner_ids = list(owner_ids)
+        if owner_ids:
+            self._release(self.active & np.isin(self.owner, owner_ids))
+
+    def clear(self):
+        self._release(self.active.copy())
+
+    def _release(self, mask: np.ndarray):
+        slots = np.nonzero(mask)[0]
+        if len(slots) == 0:
+            return
+        self.active[slots] = False
+        self.owner[slots] = -1
+        self._free.extend(slots.tolist())
+
+    # ------------------------------------------------------------------ #
+    # Zeichnen
+    # ------------------------------------------------------------------ #
+    def _glyph(self, char: str, alpha_level: int) -> pygame.Surface:
+        key = (char, alpha_level)
+        glyph = self._glyphs.get(key)
+        if glyph is None:
+            # Kopie, da Surfaces aus dem Text-Cache geteilt werden
+            glyph = render_text(FONT_SMALL, char, True, DAMAGE_COLOR).copy()
+            glyph.set_alpha(int(255 * alpha_level / (ALPHA_LEVELS - 1)))
+            self._glyphs[key] = glyph
+        return glyph
+
+    def _layout(self, alpha: float) -> List[Tuple[int, int, int, int, int, List[pygame.Surface]]]:
+        """(Slot, x, y, Alpha-Stufe, Wert, Glyphen) aller aktiven Zahlen, x/y = linke obere Ecke"""
+        slots = np.nonzero(self.active)[0]
+        if len(slots) == 0:
+            return []
+
+        draw_y = self.prev_y[slots] + (self.y[slots] - self.prev_y[slots]) * alpha
+        levels = np.clip(
+            (self.timer[slots] / LIFETIME * (ALPHA_LEVELS - 1)).round(), 0, ALPHA_LEVELS - 1
+        ).astype(np.int32)
+
+        layout = []
+        for slot, x, y, value, level in zip(slots.tolist(), self.x[slots].tolist(), draw_y.tolist(),
+                                            self.value[slots].tolist(), levels.tolist()):
+            glyphs = [self._glyph(char, level) for char in f"-{value}"]
+            text_x = int(x) - sum(g.get_width() for g in glyphs) // 2
+            layout.append((slot, text_x, int(y), level, value, glyphs))
+        return layout
+
+    @staticmethod
+    def _blit_glyphs(screen: pygame.Surface, x: int, y: int, glyphs: List[pygame.Surface]):
+        for glyph in glyphs:
+            screen.blit(glyph, (x, y))
+            x += glyph.get_width()
+
+    def draw(self, screen: pygame.Surface, alpha: float = 1.0):
+        """
+        Zeichnet alle aktiven Zahlen aus gecachten Glyphen
+
+        Args:
+            screen: pygame Screen Surface
+            alpha: Interpolationsfaktor zwischen prev_y und y
+        """
+        for _, x, y, _, _, glyphs in self._layout(alpha):
+            self._blit_glyphs(screen, x, y, glyphs)
+
+    def dirty_elements(self, alpha: float = 1.0) -> List[DirtyElement]:
+        """Aktive Zahlen als DirtyElements (für den Dirty-Rect-Modus)"""
+        elements = []
+        for slot, x, y, level, value, glyphs in self._layout(alpha):
+            rect = pygame.Rect(x, y, sum(g.get_width() for g in glyphs),
+                               max(g.get_height() for g in glyphs))
+            elements.append(DirtyElement(
+                ("damage", slot), rect, (x, y, level, value),
+                lambda screen, x=x, y=y, glyphs=glyphs: self._blit_glyphs(screen, x, y, glyphs),
+            ))
+        return elements
@@ -0,0 +1,128 @@
+"""
+Dirty Renderer - Zeichnen nur der geänderten Bildbereiche
+
+Optionaler Render-Modus (python main.py --dirty-rects): Alles Unveränderliche
+einer Szene (Hintergrund, Titel, Labels) wird einmal in einen statischen
+Layer gezeichnet. Alles Veränderliche meldet die Szene pro Frame als
+DirtyElement mit Rechteck und "Version" (beliebiger Wert, der sich ändert,
+sobald das Element anders aussieht).
+
+Neu gezeichnet werden nur Bereiche, deren Elemente sich geändert, bewegt
+oder die verschwunden sind: dort wird der statische Layer zurückkopiert und
+jedes überlappende Element (in Zeichenreihenfolge) neu gezeichnet. Der
+Main-Loop gibt nur diese Rechtecke per pygame.display.update() aus.
+
+Die Elemente zeichnen ungeclippt auf eine Arbeitsfläche, von der nur die
+Dirty-Rechtecke auf den Bildschirm kommen: pygame.draw.rect mit Randbreite
+zeichnet unter set_clip() den Rand des *geclippten* Rechtecks.
+"""
+from typing import Callable, Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+import pygame
+
+
+# Ab diesem Anteil geänderter Fläche wird einfach alles neu gezeichnet
+FULL_REDRAW_RATIO = 0.5
+
+
+class DirtyElement(NamedTuple):
+    key: Hashable                                # stabil über Frames (z.B. id(button))
+    rect: pygame.Rect                            # deckt alles ab, was draw() zeichnet
+    version: Hashable                            # ändert sich mit dem Aussehen
+    draw: Callable[[pygame.Surface], None]
+
+
+def button_element(button) -> DirtyElement:
+    """DirtyElement für einen ui.button.Button (Hover ändert die Farbe)"""
+    return DirtyElement(id(button), button.rect, (button.hovered, button.text), button.draw)
+
+
+def merge_rects(rects: Sequence[pygame.Rect]) -> List[pygame.Rect]:
+    """Vereinigt sich überlappende Rechtecke, bis keine mehr überlappen"""
+    merged: List[pygame.Rect] = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        if rect.width <= 0 or rect.height <= 0:
+            continue
+        changed = True
+        while changed:
+            changed = False
+            for i, other in enumerate(merged):
+                if rect.colliderect(other):
+                    rect.union_ip(merged.pop(i))
+                    changed = True
+                    break
+        merged.append(rect)
+    return merged
+
+
+class DirtyRenderer:
+    def __init__(self, draw_static: Callable[[pygame.Surface], None]):
+        """
+        Args:
+            draw_static: zeichnet den statischen Layer (wird nur bei Bedarf aufgerufen)
+        """
+        self._draw_static = draw_static
+        self._static: Optional[pygame.Surface] = None
+        self._scratch: Optional[pygame.Surface] = None
+        self._last: Dict[Hashable, Tuple[pygame.Rect, Hashable]] = {}
+
+    def invalidate(self):
+        """Statischen Layer neu aufbauen und im nächsten Frame alles zeichnen"""
+        self._static = None
+
+    def render(self, screen: pygame.Surface, elements: Sequence[DirtyElement]) -> List[pygame.Rect]:
+        """
+        Zeichnet einen Frame und liefert die geänderten Bildschirmbereiche
+
+        Args:
+            screen: Display-Surface
+            elements: alle dynamischen Elemente dieses Frames in Zeichenreihenfolge
+        """
+        screen_rect = screen.get_rect()
+        current = {e.key: (pygame.Rect(e.rect), e.version) for e in elements}
+
+        if self._static is None or self._static.get_size() != screen.get_size():
+            self._static = pygame.Surface(screen.get_size()).convert()
+            self._scratch = self._static.copy()
+            self._draw_static(self._static)
+            dirty = [screen_rect]
+        else:
+            changed = []
+            for key, (rect, version) in current.items():
+                previous = self._last.get(key)
+                if previous is None:
+                    changed.append(rect)
+                elif previous != (rect, version):
+                    changed.append(rect)
+                    changed.append(previous[0])
+            for key, (rect, _) in self._last.items():
+                if key not in current:
+                    changed.append(rect)
+
+            dirty = [r.clip(screen_rect) for r in merge_rects(changed)]
+            dirty = [r for r in dirty if r.width > 0 and r.height > 0]
+            area = sum(r.width * r.height for r in dirty)
+            if area > FULL_REDRAW_RATIO * screen_rect.width * screen_rect.height:
+                dirty = [screen_rect]
+
+        self._last = current
+        if not dirty:
+            return []
+
+        if dirty == [screen_rect]:
+            screen.blit(self._static, (0, 0))
+            for element in elements:
+                element.draw(screen)
+            return dirty
+
+        # Was Elemente außerhalb ihres Rechtecks auf die Arbeitsfläche malen,
+        # wird nie kopiert und beim nächsten Mal vom statischen Layer überschrieben
+        scratch = self._scratch
+        for rect in dirty:
+            scratch.blit(self._static, rect, rect)
+            for element in elements:
+                if element.rect.colliderect(rect):
+                    element.draw(scratch)
+            screen.blit(scratch, rect, rect)
+        return dirty
@@ -0,0 +1,145 @@
+"""
+Enemy Sprite - vorgerenderte Darstellung eines Gegners
+
+Körper und HP-Balken werden einmal pro Gegner in das Sprite-Bild gerendert,
+Namensschild und Verzauberungs-Label einmal gerendert (geteilt aus dem
+Text-Cache) und darüber geblittet. Danach wird nur noch neu gezeichnet, was
+sich geändert hat: der Körper bei Hover/Ziel-Wechsel, der HP-Balken bei
+HP-Änderung. Jede Änderung erhöht version (Dirty-Rect-Modus der Szene).
+
+Das Sprite-Bild enthält nur deckende und ganz transparente Pixel und ist
+RLE-beschleunigt (Blit kopiert Abschnitte statt jeden Pixel zu mischen).
+Texte bleiben eigene Surfaces, da RLE halbtransparente Pixel mit reduzierter
+Genauigkeit speichert. Auf RLE-Surfaces nur fill()/blit() verwenden
+(pygame.draw stürzt dort ab).
+
+Layout relativ zur Gegnermitte (x, y) wie bisher:
+    Name        ab y - 40 (zentriert)
+    Körper      enemy_size x enemy_size, zentriert
+    HP-Balken   60 x 6 ab y + 30
+    Verz.-Label ab y + 40 (zentriert)
+"""
+from typing import List, Tuple
+
+import pygame
+
+from ui.fonts import FONT_SMALL, render_text
+
+
+BODY_COLOR = (200, 50, 50)
+BODY_HOVER_COLOR = (255, 100, 100)
+BORDER_COLOR = (255, 255, 255)
+BORDER_HOVER_COLOR = (255, 255, 0)
+BORDER_TARGET_COLOR = (255, 140, 0)
+ENCHANT_COLOR = (255, 215, 0)
+
+HP_BAR_WIDTH = 60
+HP_BAR_HEIGHT = 6
+
+
+class EnemySprite:
+    def __init__(self, enemy_id: int, record, x: int, y: int, hp: int, max_hp: int,
+                 enchant_count: int, size: int):
+        """
+        Args:
+            enemy_id: stabile ID im EnemyStore
+            record: EnemyRecord (Name und Namensfarbe)
+            x, y: Mitte des Gegners
+            hp, max_hp: aktuelle HP
+            enchant_count: Anzahl Verzauberungen
+            size: Kantenlänge des Körpers
+        """
+        self.enemy_id = enemy_id
+        self.version = 0
+
+        # Sprite-Bild: Körper + HP-Balken
+        half = size // 2
+        body = pygame.Rect(x - half, y - half, size, size)
+        bar = pygame.Rect(x - HP_BAR_WIDTH // 2, y + 30, HP_BAR_WIDTH, HP_BAR_HEIGHT)
+        self.rect = body.union(bar)
+        self._body = body.move(-self.rect.x, -self.rect.y)
+        self._bar = bar.move(-self.rect.x, -self.rect.y)
+        self.image = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+
+        # Texte darüber (in Zeichenreihenfolge nach dem Körper)
+        name_text = render_text(FONT_SMALL, record.name, True, record.name_color)
+        self.labels: List[Tuple[pygame.Surface, pygame.Rect]] = [
+            (name_text, name_text.get_rect(topleft=(x - name_text.get_width() // 2, y - 40))),
+        ]
+        if enchant_count:
+            enchant_text = render_text(FONT_SMALL, f"{enchant_count} Verz.", True, ENCHANT_COLOR)
+            self.labels.append(
+                (enchant_text, enchant_text.get_rect(topleft=(x - enchant_text.get_width() // 2, y + 40)))
+            )
+        self.bounds = self.rect.unionall([rect for _, rect in self.labels])
+
+        self.hovered = False
+        self.targeted = False
+        self.hp = hp
+        self.max_hp = max_hp
+        self._render_body()
+        self._render_hp_bar()
+
+        # Display-Format (falls schon ein Fenster existiert) + RLE
+        if pygame.display.get_surface() is not None:
+            self.image = self.image.convert_alpha()
+        self.image.set_alpha(255, pygame.RLEACCEL)
+
+        # Alles, was für diesen Gegner geblittet wird (das Bild bleibt dasselbe Objekt)
+        self.blits: List[Tuple[pygame.Surface, pygame.Rect]] = [(self.image, self.rect)] + self.labels
+
+    def draw(self, surface: pygame.Surface):
+        for image, rect in self.blits:
+            surface.blit(image, rect)
+
+    # ------------------------------------------------------------------ #
+    # Zustand
+    # ------------------------------------------------------------------ #
+    def set_highlight(self, hovered: bool, targeted: bool):
+        if hovered == self.hovered and targeted == self.targeted:
+            return
+        self.hovered = hovered
+        self.targeted = targeted
+        self._render_body()
+        self._changed()
+
+    def set_hp(self, hp: int, max_hp: int):
+        if hp == self.hp and max_hp == self.max_hp:
+            return
+        self.hp = hp
+        self.max_hp = max_hp
+        self._render_hp_bar()
+        self._changed()
+
+    def _changed(self):
+        self.version += 1
+
+    # ------------------------------------------------------------------ #
+    # Rendern (nur die betroffenen Teile)
+    # ------------------------------------------------------------------ #
+    def _render_body(self):
+        color = BODY_HOVER_COLOR if self.hovered else BODY_COLOR
+        border_color = BORDER_HOVER_COLOR if self.hovered else BORDER_COLOR
+        if self.targeted:
+            border_color = BORDER_TARGET_COLOR
+
+        body = self._body
+        border = 3 if self.hovered or self.targeted else 2
+        self.image.fill(color, body)
+        # Rand innen, wie pygame.draw.rect(..., border)
+        self.image.fill(border_color, (body.x, body.y, body.width, border))
+        self.image.fill(border_color, (body.x, body.bottom - border, body.width, border))
+        self.image.fill(border_color, (body.x, body.y, border, body.height))
+        self.image.fill(border_color, (body.right - border, body.y, border, body.height))
+
+    def _render_hp_bar(self):
+        bar = self._bar
+        if self.max_hp <= 0:
+            self.image.fill((0, 0, 0, 0), bar)
+            return
+
+        hp_percent = self.hp / self.max_hp
+        # Hintergrund (schwarz), darüber HP (grün zu rot basierend auf HP%)
+        self.image.fill((0, 0, 0, 255), bar)
+        hp_color = (int(255 * (1 - hp_percent)), int(255 * hp_percent), 0)
+        self.image.fill(hp_color, (bar.x, bar.y, int(HP_BAR_WIDTH * hp_percent), HP_BAR_HEIGHT))
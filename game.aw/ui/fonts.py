@@ -1,7 +1,109 @@
+from collections import OrderedDict
+from typing import Dict, Hashable, Tuple
+
 import pygame
 
-pygame.init()
 
-FONT_BIG = pygame.font.Font(None, 70)
-FONT = pygame.font.Font(None, 40)
-FONT_SMALL = pygame.font.Font(None, 26)
+class LazyFont:
+    """
+    Platzhalter für pygame.font.Font: die Schrift wird erst beim ersten
+    Gebrauch geladen (nicht beim Import). Alle Attribute (render, size,
+    get_height, ...) werden an die echte Font weitergereicht.
+
+    Initialisiert wird pygame nur in main.py; für Tools ohne pygame.init()
+    wird das Font-Modul hier bei Bedarf gestartet.
+    """
+
+    __slots__ = ("_args", "_font")
+
+    def __init__(self, *args):
+        self._args = args
+        self._font = None
+
+    @property
+    def font(self) -> pygame.font.Font:
+        if self._font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self._font = pygame.font.Font(*self._args)
+        return self._font
+
+    def __getattr__(self, name):
+        return getattr(self.font, name)
+
+
+FONT_BIG = LazyFont(None, 70)
+FONT = LazyFont(None, 40)
+FONT_SMALL = LazyFont(None, 26)
+
+
+# ---------------------------------------------------
+# TEXT-CACHE
+# ---------------------------------------------------
+TEXT_CACHE_BYTES = 8 * 1024 * 1024   # Obergrenze für gecachte Text-Surfaces
+
+
+class TextCache:
+    """
+    LRU-Cache für gerenderte Texte, Key: (Font, Text, Antialias, Farbe)
+
+    Die meisten UI-Texte ändern sich nie oder selten, werden aber jedes
+    Frame gezeichnet. Begrenzt wird nach Speicher der Surfaces, nicht nach
+    Anzahl, damit viele kleine Zahlen nicht wenige große Titel verdrängen.
+
+    Gelieferte Surfaces werden geteilt und dürfen nicht verändert werden
+    (für set_alpha o.ä. vorher .copy()).
+    """
+
+    def __init__(self, max_bytes: int = TEXT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._surfaces: "OrderedDict[Hashable, Tuple[pygame.Surface, int]]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool, color) -> pygame.Surface:
+        key = (font, text, antialias, tuple(color))
+        entry = self._surfaces.get(key)
+        if entry is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        size = surface.get_pitch() * surface.get_height()
+        self._surfaces[key] = (surface, size)
+        self.bytes += size
+
+        # Älteste Einträge verdrängen (der neue bleibt immer drin)
+        while self.bytes > self.max_bytes and len(self._surfaces) > 1:
+            _, (_, old_size) = self._surfaces.popitem(last=False)
+            self.bytes -= old_size
+            self.evictions += 1
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+        self.bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._surfaces),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+TEXT_CACHE = TextCache()
+
+
+def render_text(font: pygame.font.Font, text: str, antialias: bool, color) -> pygame.Surface:
+    """Wie font.render(text, antialias, color), aber aus dem gemeinsamen Text-Cache"""
+    return TEXT_CACHE.render(font, text, antialias, color)
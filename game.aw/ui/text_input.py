@@ -0,0 +1,67 @@
+"""
+Text Input - einzeiliges Eingabefeld
+
+Klick ins Feld gibt den Fokus (über den UIRoot), Klick daneben, Escape
+oder Enter nimmt ihn weg. Bei jeder Änderung wird on_change mit dem neuen
+Text aufgerufen.
+"""
+from typing import Callable, Optional
+
+import pygame
+
+from ui.fonts import FONT_SMALL, render_text
+from ui.widget import Widget
+
+
+BACKGROUND_COLOR = (34, 37, 48)
+BORDER_COLOR = (80, 84, 100)
+FOCUS_BORDER_COLOR = (150, 170, 230)
+TEXT_COLOR = (230, 230, 230)
+PLACEHOLDER_COLOR = (120, 124, 140)
+
+
+class TextInput(Widget):
+    focusable = True
+
+    def __init__(self, x, y, w, h, on_change: Optional[Callable[[str], None]] = None,
+                 placeholder: str = ""):
+        super().__init__((x, y, w, h))
+        self.on_change = on_change
+        self.placeholder = placeholder
+        self.text = ""
+
+    def set_text(self, text: str):
+        if text == self.text:
+            return
+        self.text = text
+        if self.on_change:
+            self.on_change(text)
+
+    def on_mouse_down(self, ev) -> bool:
+        return True
+
+    def on_key(self, ev) -> bool:
+        if ev.key in (pygame.K_ESCAPE, pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_TAB):
+            self.blur()
+        elif ev.key == pygame.K_BACKSPACE:
+            self.set_text(self.text[:-1])
+        elif ev.unicode and ev.unicode.isprintable():
+            self.set_text(self.text + ev.unicode)
+        else:
+            return False
+        return True
+
+    def draw(self, surface: pygame.Surface):
+        pygame.draw.rect(surface, BACKGROUND_COLOR, self.rect, border_radius=6)
+        border = FOCUS_BORDER_COLOR if self.focused else BORDER_COLOR
+        pygame.draw.rect(surface, border, self.rect, 2, border_radius=6)
+
+        if self.text:
+            txt = render_text(FONT_SMALL, self.text + ("|" if self.focused else ""), True, TEXT_COLOR)
+        else:
+            txt = render_text(FONT_SMALL, "|" if self.focused else self.placeholder, True, PLACEHOLDER_COLOR)
+
+        # Zu lange Eingaben: das Ende bleibt sichtbar
+        inner = self.rect.inflate(-20, 0)
+        area = pygame.Rect(max(0, txt.get_width() - inner.width), 0, inner.width, txt.get_height())
+        surface.blit(txt, (inner.x, self.rect.centery - txt.get_height() // 2), area)
@@ -0,0 +1,223 @@
+"""
+Virtual List - scrollbare Liste, die nur sichtbare Zeilen zeichnet
+
+Alle Zeilen haben dieselbe Höhe. Dadurch ist alles reine Arithmetik:
+sichtbarer Bereich, Hit-Test (Index = (y - oben + scroll) // Zeilenhöhe)
+und Scroll-Grenzen kosten O(1), egal wie lang die Liste ist. Pro Frame
+werden nur die sichtbaren Zeilen geblittet.
+
+Zeilen-Surfaces kommen aus einem LRU-Cache, Key ist die Identität des
+Eintrags (id(), gegen wiederverwendete IDs mit "is" abgesichert). Zeilen
+werden also nur beim ersten Sichtbarwerden gerendert; Einfügen/Entfernen
+verschiebt Indizes, invalidiert aber nichts.
+
+Bedienung: Mausrad scrollt (weich animiert), Linksklick wählt aus,
+Pfeiltasten/Bild auf/ab/Pos1/Ende bewegen die Auswahl.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+import pygame
+
+from ui.widget import Widget
+
+
+ROW_CACHE_SIZE = 512     # gecachte Zeilen-Surfaces (ein paar Bildschirmseiten)
+SCROLL_STEP = 3          # Zeilen pro Mausrad-Raste
+SCROLL_SPEED = 18.0      # Annäherung an das Scroll-Ziel pro Sekunde (exponentiell)
+
+SELECTED_COLOR = (50, 90, 70)
+SCROLLBAR_COLOR = (45, 48, 60)
+SCROLLBAR_THUMB_COLOR = (110, 115, 135)
+SCROLLBAR_WIDTH = 6
+
+
+class VirtualList(Widget):
+    def __init__(self, rect, row_height: int, render_row: Callable[[Any], pygame.Surface],
+                 on_select: Optional[Callable[[int], None]] = None):
+        """
+        Args:
+            rect: sichtbarer Bereich der Liste
+            row_height: Höhe jeder Zeile in Pixeln
+            render_row: rendert die Zeile für einen Eintrag (Ergebnis wird gecacht)
+            on_select: wird mit dem neuen Index aufgerufen, wenn der Spieler auswählt
+        """
+        super().__init__(rect)
+        self.row_height = row_height
+        self.render_row = render_row
+        self.on_select = on_select
+
+        self.items: Sequence[Any] = []
+        self.selected: Optional[int] = None
+        self.scroll = 0.0          # aktuell gezeichneter Offset in Pixeln
+        self.target_scroll = 0.0   # Ziel der Scroll-Animation
+
+        # id(Eintrag) -> (Eintrag, Surface)
+        self._rows: "OrderedDict[int, Tuple[Any, pygame.Surface]]" = OrderedDict()
+
+    # ------------------------------------------------------------------ #
+    # Inhalt
+    # ------------------------------------------------------------------ #
+    def set_items(self, items: Sequence[Any], reset: bool = True):
+        """
+        Setzt die Einträge (die Liste wird referenziert, nicht kopiert)
+
+        Args:
+            items: neue Einträge
+            reset: nach oben scrollen (False: Scroll-Position bleibt, soweit möglich)
+        """
+        self.items = items
+        self.selected = None
+        if reset:
+            self.scroll = self.target_scroll = 0.0
+        else:
+            self.target_scroll = min(self.target_scroll, float(self.max_scroll))
+
+    def clear_cache(self):
+        self._rows.clear()
+
+    @property
+    def visible_rows(self) -> int:
+        return max(1, self.rect.height // self.row_height)
+
+    @property
+    def max_scroll(self) -> int:
+        return max(0, len(self.items) * self.row_height - self.rect.height)
+
+    @property
+    def is_scrolling(self) -> bool:
+        """Ob die Scroll-Animation noch läuft"""
+        return self.scroll != self.target_scroll
+
+    def index_at(self, pos) -> Optional[int]:
+        """Index der Zeile unter pos (None außerhalb der Liste oder hinter dem letzten Eintrag)"""
+        if not self.rect.collidepoint(pos):
+            return None
+        index = int((pos[1] - self.rect.y + self.scroll) // self.row_height)
+        return index if index < len(self.items) else None
+
+    # ------------------------------------------------------------------ #
+    # Scrollen / Auswahl
+    # ------------------------------------------------------------------ #
+    def scroll_by(self, pixels: float):
+        self.target_scroll = min(max(self.target_scroll + pixels, 0.0), float(self.max_scroll))
+
+    def scroll_to_index(self, index: int):
+        """Scrollt so wenig wie nötig, damit die Zeile ganz sichtbar ist"""
+        top = index * self.row_height
+        bottom = top + self.row_height
+        if top < self.target_scroll:
+            self.scroll_by(top - self.target_scroll)
+        elif bottom > self.target_scroll + self.rect.height:
+            self.scroll_by(bottom - self.rect.height - self.target_scroll)
+
+    def select(self, index: Optional[int]):
+        if index is None or not self.items:
+            self.selected = None
+            return
+        index = min(max(index, 0), len(self.items) - 1)
+        self.selected = index
+        self.scroll_to_index(index)
+        if self.on_select:
+            self.on_select(index)
+
+    # ------------------------------------------------------------------ #
+    # Events (vom UIRoot geroutet)
+    # ------------------------------------------------------------------ #
+    def on_wheel(self, ev) -> bool:
+        self.scroll_by(-ev.y * SCROLL_STEP * self.row_height)
+        return True
+
+    def on_mouse_down(self, ev) -> bool:
+        if ev.button != 1:
+            return False
+        index = self.index_at(ev.pos)
+        if index is not None:
+            self.select(index)
+        return True
+
+    def on_key(self, ev) -> bool:
+        if not self.items:
+            return False
+        current = self.selected
+        page = self.visible_rows
+        if ev.key == pygame.K_DOWN:
+            self.select(0 if current is None else current + 1)
+        elif ev.key == pygame.K_UP:
+            self.select(0 if current is None else current - 1)
+        elif ev.key == pygame.K_PAGEDOWN:
+            self.select((current or 0) + page)
+        elif ev.key == pygame.K_PAGEUP:
+            self.select((current or 0) - page)
+        elif ev.key == pygame.K_HOME:
+            self.select(0)
+        elif ev.key == pygame.K_END:
+            self.select(len(self.items) - 1)
+        else:
+            return False
+        return True
+
+    def update(self, dt: float):
+        # Liste kann kürzer geworden sein (z.B. nach dem Anlegen eines Items)
+        self.target_scroll = min(self.target_scroll, float(self.max_scroll))
+        if self.selected is not None and self.selected >= len(self.items):
+            self.selected = None
+
+        diff = self.target_scroll - self.scroll
+        if abs(diff) < 0.5:
+            self.scroll = self.target_scroll
+        else:
+            self.scroll += diff * min(1.0, SCROLL_SPEED * dt)
+
+    # ------------------------------------------------------------------ #
+    # Zeichnen
+    # ------------------------------------------------------------------ #
+    def _row_surface(self, item) -> pygame.Surface:
+        key = id(item)
+        entry = self._rows.get(key)
+        if entry is not None and entry[0] is item:
+            self._rows.move_to_end(key)
+            return entry[1]
+
+        surface = self.render_row(item)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        self._rows[key] = (item, surface)
+        self._rows.move_to_end(key)
+        if len(self._rows) > ROW_CACHE_SIZE:
+            self._rows.popitem(last=False)
+        return surface
+
+    def draw(self, surface: pygame.Surface):
+        rect = self.rect
+        row_height = self.row_height
+        scroll = int(self.scroll)
+        first = scroll // row_height
+        last = min(len(self.items), (scroll + rect.height) // row_height + 1)
+
+        previous_clip = surface.get_clip()
+        surface.set_clip(rect.clip(previous_clip))
+
+        y = rect.y + first * row_height - scroll
+        for index in range(first, last):
+            if index == self.selected:
+                pygame.draw.rect(surface, SELECTED_COLOR,
+                                 (rect.x, y, rect.width, row_height), border_radius=4)
+            row = self._row_surface(self.items[index])
+            surface.blit(row, (rect.x + 10, y + (row_height - row.get_height()) // 2))
+            y += row_height
+
+        surface.set_clip(previous_clip)
+        self._draw_scrollbar(surface)
+
+    def _draw_scrollbar(self, surface: pygame.Surface):
+        content = len(self.items) * self.row_height
+        if content <= self.rect.height:
+            return
+
+        track = pygame.Rect(self.rect.right + 4, self.rect.y, SCROLLBAR_WIDTH, self.rect.height)
+        thumb_height = max(20, track.height * self.rect.height // content)
+        thumb_y = track.y + int((track.height - thumb_height) * self.scroll / max(1, self.max_scroll))
+        pygame.draw.rect(surface, SCROLLBAR_COLOR, track, border_radius=3)
+        pygame.draw.rect(surface, SCROLLBAR_THUMB_COLOR,
+                         (track.x, thumb_y, SCROLLBAR_WIDTH, thumb_height), border_radius=3)
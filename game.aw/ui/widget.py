@@ -0,0 +1,275 @@
+"""
+Widget-Baum mit Event-Routing
+
+Eine Szene hängt ihre Widgets an einen UIRoot und reicht jedes Event
+einmal an UIRoot.handle_event() weiter, statt es an jeden Button zu geben.
+Geroutet wird nach Event-Typ:
+
+    Maus (Klick, Rad)   ein Hit-Test im Raster-Index -> getroffenes Widget,
+                        unbenutzte Events steigen zum Elternwidget auf
+    Loslassen           an das Widget, auf dem gedrückt wurde
+    Bewegung            nur hier wird der Hover-Zustand umgeschaltet
+    Tastatur            an das Widget mit Fokus, sonst an key_target
+
+Der Raster-Index ordnet jedem Feld die Widgets zu, deren Rechteck es
+berührt; ein Hit-Test prüft nur die wenigen Widgets eines Feldes. Die
+Kosten pro Event bleiben so gleich, egal wie viele Widgets es gibt.
+Geändert wird der Index nur, wenn sich der Baum ändert.
+
+Rückgabewerte der Handler: None/False = nicht benutzt (steigt auf),
+True = benutzt, alles andere ist ein Ergebnis (z.B. eine neue Szene) und
+wird von handle_event() an die Szene zurückgegeben.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+import pygame
+
+
+GRID_CELL_SIZE = 64
+
+
+class Widget:
+    # Widgets mit focusable = True bekommen beim Anklicken den Tastatur-Fokus
+    focusable = False
+
+    def __init__(self, rect=None):
+        self.rect: Optional[pygame.Rect] = pygame.Rect(rect) if rect is not None else None
+        self.parent: Optional["Widget"] = None
+        self.children: List["Widget"] = []
+        self.visible = True
+        self.hovered = False
+        self.focused = False
+
+    # ------------------------------------------------------------------ #
+    # Baum
+    # ------------------------------------------------------------------ #
+    def add(self, *widgets: "Widget"):
+        for widget in widgets:
+            widget.parent = self
+            self.children.append(widget)
+        self._tree_changed()
+
+    def remove(self, widget: "Widget"):
+        self.children.remove(widget)
+        widget.parent = None
+        self._tree_changed()
+
+    def clear(self):
+        for widget in self.children:
+            widget.parent = None
+        self.children = []
+        self._tree_changed()
+
+    def set_visible(self, visible: bool):
+        if visible != self.visible:
+            self.visible = visible
+            self._tree_changed()
+
+    def is_shown(self) -> bool:
+        widget = self
+        while widget is not None:
+            if not widget.visible:
+                return False
+            widget = widget.parent
+        return True
+
+    @property
+    def root(self) -> "Widget":
+        widget = self
+        while widget.parent is not None:
+            widget = widget.parent
+        return widget
+
+    def blur(self):
+        """Gibt den Tastatur-Fokus ab"""
+        root = self.root
+        if isinstance(root, UIRoot) and root.focus is self:
+            root.set_focus(None)
+
+    def _tree_changed(self):
+        if self.parent is not None:
+            self.parent._tree_changed()
+
+    def walk(self):
+        """Alle Nachfahren in Zeichenreihenfolge"""
+        for child in self.children:
+            yield child
+            yield from child.walk()
+
+    # ------------------------------------------------------------------ #
+    # Events (Standard: nicht benutzt)
+    # ------------------------------------------------------------------ #
+    def on_mouse_down(self, ev) -> Any:
+        return None
+
+    def on_mouse_up(self, ev, inside: bool) -> Any:
+        return None
+
+    def on_wheel(self, ev) -> Any:
+        return None
+
+    def on_key(self, ev) -> Any:
+        return None
+
+    def on_hover(self, hovered: bool):
+        self.hovered = hovered
+
+    def on_focus(self, focused: bool):
+        self.focused = focused
+
+    # ------------------------------------------------------------------ #
+    def draw(self, surface: pygame.Surface):
+        for child in self.children:
+            if child.visible:
+                child.draw(surface)
+
+
+class UIRoot(Widget):
+    def __init__(self, cell_size: int = GRID_CELL_SIZE):
+        super().__init__()
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[Widget]] = {}
+        self._index_dirty = True
+
+        self.hovered_widget: Optional[Widget] = None
+        self.pressed_widget: Optional[Widget] = None
+        self.focus: Optional[Widget] = None
+        self.key_target: Optional[Widget] = None   # bekommt Tasten, wenn nichts fokussiert ist
+        self.mouse_pos: Tuple[int, int] = pygame.mouse.get_pos()
+
+        self._handlers = {
+            pygame.MOUSEMOTION: self._on_motion,
+            pygame.MOUSEBUTTONDOWN: self._on_button_down,
+            pygame.MOUSEBUTTONUP: self._on_button_up,
+            pygame.MOUSEWHEEL: self._on_wheel,
+            pygame.KEYDOWN: self._on_keydown,
+        }
+
+    def _tree_changed(self):
+        self._index_dirty = True
+
+    # ------------------------------------------------------------------ #
+    # Raster-Index
+    # ------------------------------------------------------------------ #
+    def _rebuild_index(self):
+        self._cells = {}
+        size = self.cell_size
+        for widget in self.walk():
+            if widget.rect is None or not widget.is_shown():
+                continue
+            rect = widget.rect
+            for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+                for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                    self._cells.setdefault((cx, cy), []).append(widget)
+        self._index_dirty = False
+
+        # Hover an den neuen Baum anpassen (z.B. eingeblendete Buttons unter der Maus)
+        self._set_hovered(self._hit(self.mouse_pos))
+
+    def _hit(self, pos) -> Optional[Widget]:
+        candidates = self._cells.get((pos[0] // self.cell_size, pos[1] // self.cell_size))
+        if candidates:
+            # Zuletzt gezeichnete (oberste) zuerst
+            for widget in reversed(candidates):
+                if widget.rect.collidepoint(pos):
+                    return widget
+        return None
+
+    def widget_at(self, pos) -> Optional[Widget]:
+        if self._index_dirty:
+            self._rebuild_index()
+        return self._hit(pos)
+
+    # ------------------------------------------------------------------ #
+    # Routing
+    # ------------------------------------------------------------------ #
+    def handle_event(self, ev) -> Any:
+        """Leitet ein Event an das zuständige Widget; liefert dessen Ergebnis (oder None)"""
+        handler = self._handlers.get(ev.type)
+        if handler is None:
+            return None
+        if self._index_dirty:
+            self._rebuild_index()
+        result = handler(ev)
+        return None if result is True or result is False else result
+
+    @staticmethod
+    def _bubble(widget: Optional[Widget], method: str, *args) -> Any:
+        while widget is not None:
+            result = getattr(widget, method)(*args)
+            if result is not None and result is not False:
+                return result
+            widget = widget.parent
+        return None
+
+    def _set_hovered(self, widget: Optional[Widget]):
+        if widget is self.hovered_widget:
+            return
+        if self.hovered_widget is not None:
+            self.hovered_widget.on_hover(False)
+        self.hovered_widget = widget
+        if widget is not None:
+            widget.on_hover(True)
+
+    def set_focus(self, widget: Optional[Widget]):
+        if widget is self.focus:
+            return
+        if self.focus is not None:
+            self.focus.on_focus(False)
+        self.focus = widget
+        if widget is not None:
+            widget.on_focus(True)
+
+    def sync_pointer(self):
+        """
+        Nach einer Pause (Szene war verdeckt): die Maus steht woanders und
+        nichts ist mehr gedrückt. Hover wird an die aktuelle Position angepasst.
+        """
+        self.pressed_widget = None
+        self.mouse_pos = pygame.mouse.get_pos()
+        if self._index_dirty:
+            self._rebuild_index()
+        else:
+            self._set_hovered(self._hit(self.mouse_pos))
+
+    def _on_motion(self, ev):
+        self.mouse_pos = ev.pos
+        self._set_hovered(self._hit(ev.pos))
+
+    def _on_button_down(self, ev):
+        self.mouse_pos = ev.pos
+        widget = self._hit(ev.pos)
+        if ev.button == 1:
+            self.pressed_widget = widget
+            self.set_focus(widget if widget is not None and widget.focusable else None)
+        return self._bubble(widget, "on_mouse_down", ev)
+
+    def _on_button_up(self, ev):
+        self.mouse_pos = ev.pos
+        if ev.button != 1:
+            return self._bubble(self._hit(ev.pos), "on_mouse_up", ev, True)
+        widget, self.pressed_widget = self.pressed_widget, None
+        if widget is None:
+            return None
+        inside = widget.is_shown() and widget.rect.collidepoint(ev.pos)
+        return widget.on_mouse_up(ev, inside)
+
+    def _on_wheel(self, ev):
+        return self._bubble(self._hit(self.mouse_pos), "on_wheel", ev)
+
+    def _on_keydown(self, ev):
+        if self.focus is not None:
+            if not self.focus.is_shown():
+                self.set_focus(None)
+            else:
+                result = self.focus.on_key(ev)
+                if result is not None and result is not False:
+                    return result
+        if self.key_target is not None and self.key_target.is_shown():
+            return self.key_target.on_key(ev)
+        return None
+
+    def draw(self, surface: pygame.Surface):
+        if self._index_dirty:
+            self._rebuild_index()
+        super().draw(surface)